@@ -0,0 +1,189 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 경로 질의 서비스 - 지도를 한 번만 로드하고 메모리에서 경로 질의에 응답
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | /route, /nearest 질의 + 그리드 버전별 LRU 캐시 및 적중 통계 | zookeeper
+# 2026-10-18 | 수정 | reload 시 공용 로더(map_data)의 메모이즈 결과 초기화 | zookeeper
+# 2026-10-18 | 수정 | 구조물 종류별 좌표를 공용 인덱스(map_index)에서 가져옴 | zookeeper
+# 2026-10-18 | 기능 추가 | /tiles/<z>/<x>/<y>.png 타일 응답 (Cache-Control max-age + 셀 내용 해시 ETag), /tiles/meta | zookeeper
+# 2026-10-18 | 버그 수정 | flask run / WSGI 서버에서도 첫 요청 전에 지도를 한 번만 로드 (이전에는 python app.py에서만 로드) | zookeeper
+# 2026-10-18 | 리팩토링 | 범위 검사를 GridMap.contains로 통일 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import os
+import threading
+from functools import lru_cache
+
+from flask import Flask, jsonify, request, send_from_directory
+
+from grid_search import SEARCH_METHODS, reconstruct_path
+from map_data import load_map_data
+from map_direct_save import load_and_prepare_data, create_grid_map
+from map_index import index_for
+from tile_pyramid import TILE_DIR, MANIFEST_FILE, load_manifest
+
+app = Flask(__name__)
+
+# 서비스 시작 시 한 번 로드한 지도 상태 (reload 시 version 증가 → 이전 캐시 항목은 사용되지 않음)
+map_state = {'data': None, 'grid': None, 'structures': {}, 'version': 0}
+
+# 타일 응답의 브라우저/프록시 캐시 유지 시간(초), 타일 manifest는 파일이 바뀔 때만 다시 읽음
+TILE_MAX_AGE = 3600
+tile_state = {'mtime_ns': None, 'manifest': None}
+
+# 지도 최초 로드를 한 번만 수행하기 위한 잠금 (멀티 스레드 서버에서 동시에 첫 요청이 들어오는 경우)
+_load_lock = threading.Lock()
+
+def load_map():
+    """CSV를 읽어 그리드와 구조물 종류별 좌표를 메모리에 올리는 함수"""
+
+    load_map_data.cache_clear()  # reload 시 공용 로더의 메모이즈 결과 대신 CSV(또는 캐시)를 다시 확인
+    data = load_and_prepare_data()
+    grid, _, _, _, _ = create_grid_map(data)
+
+    structures = index_for(data).struct_points
+
+    map_state['data'] = data
+    map_state['grid'] = grid
+    map_state['structures'] = structures
+    map_state['version'] += 1
+
+def ensure_map_loaded():
+    """지도가 아직 로드되지 않았으면 한 번만 로드하는 함수
+
+    python app.py뿐 아니라 flask run, gunicorn 등 WSGI 서버로 실행해도 첫 요청 전에 지도가 준비되도록
+    before_request에서 호출합니다. 이미 로드되었으면 잠금 없이 바로 반환합니다.
+    """
+
+    if map_state['grid'] is not None:
+        return
+    with _load_lock:
+        if map_state['grid'] is None:
+            load_map()
+
+@app.before_request
+def _load_map_before_request():
+    ensure_map_loaded()
+
+def parse_point(text):
+    """'x,y' 형식의 문자열을 좌표 튜플로 변환하는 함수"""
+
+    try:
+        x, y = (int(value) for value in text.split(','))
+    except (AttributeError, ValueError):
+        raise ValueError(f'좌표 형식이 잘못되었습니다: {text!r} (예: 14,2)')
+    return x, y
+
+def search_route(start, destinations, method):
+    """현재 그리드에서 시작점 → 가장 가까운 목적지 경로를 찾는 함수"""
+
+    grid = map_state['grid']
+    for point in [start] + list(destinations):
+        if not grid.contains(*point):
+            raise ValueError(f'지도 범위를 벗어난 좌표입니다: {point}')
+    if method not in SEARCH_METHODS:
+        raise ValueError(f'알 수 없는 탐색 방식입니다: {method} (사용 가능: {", ".join(SEARCH_METHODS)})')
+
+    goal_ids = {grid.cell_id(x, y) for x, y in destinations}
+    goal_id, distance, parent = SEARCH_METHODS[method](
+        grid.cells, grid.width, grid.height, grid.cell_id(*start), goal_ids)
+
+    if goal_id is None:
+        return {'from': start, 'to': None, 'distance': None, 'path': []}
+
+    path = [grid.coord(cell) for cell in reconstruct_path(parent, goal_id)]
+    return {'from': start, 'to': grid.coord(goal_id), 'distance': distance, 'path': path}
+
+@lru_cache(maxsize=4096)
+def cached_route(start, end, method, grid_version):
+    """grid_version까지 포함한 질의 키로 경로 결과를 캐시하는 함수"""
+    return search_route(start, [end], method)
+
+@lru_cache(maxsize=4096)
+def cached_nearest(start, struct_name, method, grid_version):
+    """grid_version까지 포함한 질의 키로 가장 가까운 구조물 결과를 캐시하는 함수"""
+
+    destinations = map_state['structures'].get(struct_name)
+    if not destinations:
+        raise ValueError(f'구조물을 찾을 수 없습니다: {struct_name}')
+    result = search_route(start, destinations, method)
+    result['struct'] = struct_name
+    return result
+
+def cache_stats():
+    """두 캐시의 적중/실패 횟수를 합쳐 반환하는 함수"""
+
+    stats = {}
+    for name, cached in (('route', cached_route), ('nearest', cached_nearest)):
+        info = cached.cache_info()
+        stats[name] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+    return stats
+
+@app.route('/route')
+def route():
+    try:
+        start = parse_point(request.args.get('from'))
+        end = parse_point(request.args.get('to'))
+        result = cached_route(start, end, request.args.get('method', 'bfs'), map_state['version'])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(result)
+
+@app.route('/nearest')
+def nearest():
+    try:
+        struct_name = request.args.get('struct', 'BandalgomCoffee')
+        if 'from' in request.args:
+            start = parse_point(request.args.get('from'))
+        else:
+            start = map_state['structures'].get('MyHome', [None])[0]
+            if start is None:
+                raise ValueError('출발점(from)이 없고 내 집도 찾을 수 없습니다!')
+        result = cached_nearest(start, struct_name, request.args.get('method', 'bfs'), map_state['version'])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(result)
+
+def tile_manifest():
+    """tile_pyramid.py가 만든 manifest.json을 반환하는 함수 (수정 시각이 같으면 메모리의 값을 재사용)"""
+
+    path = os.path.join(TILE_DIR, MANIFEST_FILE)
+    mtime_ns = os.stat(path).st_mtime_ns if os.path.exists(path) else None
+    if mtime_ns != tile_state['mtime_ns']:
+        tile_state['manifest'] = load_manifest(TILE_DIR)
+        tile_state['mtime_ns'] = mtime_ns
+    return tile_state['manifest']
+
+@app.route('/tiles/<int:z>/<int:x>/<int:y>.png')
+def tile(z, x, y):
+    manifest = tile_manifest()
+    if manifest is None:
+        return jsonify({'error': '타일이 없습니다. python tile_pyramid.py로 먼저 생성하세요.'}), 404
+    digest = manifest['tiles'].get(f'{z}/{x}/{y}')
+    if digest is None:
+        return jsonify({'error': f'지도 범위를 벗어난 타일입니다: {z}/{x}/{y}'}), 404
+
+    # 셀 내용 해시를 ETag로 사용 → 타일을 다시 만들어도 내용이 같으면 304 Not Modified
+    return send_from_directory(os.path.abspath(TILE_DIR), f'{z}/{x}/{y}.png',
+                               mimetype='image/png', max_age=TILE_MAX_AGE, etag=digest)
+
+@app.route('/tiles/meta')
+def tile_meta():
+    manifest = tile_manifest()
+    if manifest is None:
+        return jsonify({'error': '타일이 없습니다. python tile_pyramid.py로 먼저 생성하세요.'}), 404
+    return jsonify({key: value for key, value in manifest.items() if key != 'tiles'})
+
+@app.route('/stats')
+def stats():
+    return jsonify({'grid_version': map_state['version'], 'cache': cache_stats()})
+
+@app.route('/reload', methods=['POST'])
+def reload():
+    load_map()
+    return jsonify({'grid_version': map_state['version']})
+
+if __name__ == '__main__':
+    ensure_map_loaded()
+    app.run(host='127.0.0.1', port=5000, debug=True)
@@ -0,0 +1,157 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 전체 구역 분석 리포트 - 구역별 구조물 수, 건설 현장 비율, 가장 가까운 커피숍 거리 통계
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 구역별 groupby 한 번으로 모든 구역 집계, 큰 입력은 구역 단위로 프로세스 풀 분할, JSON 저장 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import json
+import math
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from grid_map import build_grid_map, nearest_distance_field
+from map_data import load_map_data
+from map_index import index_for
+
+REPORT_FILE = 'area_report.json'
+CAFE_STRUCT = 'BandalgomCoffee'
+
+def _number(value):
+    """NumPy 값을 JSON으로 저장할 수 있는 int/float로 바꾸는 함수 (NaN은 None)"""
+
+    value = float(value)
+    if math.isnan(value):
+        return None
+    return int(value) if value.is_integer() else round(value, 3)
+
+def cafe_distances(data, grid, cafe_points):
+    """각 행의 좌표에서 가장 가까운 커피숍까지의 거리 배열을 구하는 함수 (도달 불가 -1)
+
+    커피숍 전체를 출발점으로 하는 거리장을 한 번만 계산한 뒤 각 행의 셀 ID로 조회합니다.
+    """
+
+    if not cafe_points:
+        return np.full(len(data), -1, dtype=np.int32)
+
+    field = nearest_distance_field(grid, cafe_points).reshape(-1)
+    return field[grid.cell_ids(data['x'].to_numpy(), data['y'].to_numpy())]
+
+def summarize_areas(frame):
+    """area, struct_name, ConstructionSite, cafe_distance 컬럼의 DataFrame을 구역별로 집계하는 함수
+
+    구역마다 필터링하지 않고 groupby 한 번으로 모든 구역의 통계를 계산합니다.
+    반환값: {구역 번호: 통계 dict}
+    """
+
+    construction = frame['ConstructionSite'].astype(bool)
+    walkable_distance = frame['cafe_distance'].where(~construction)
+    frame = frame.assign(
+        construction=construction,
+        reachable_distance=walkable_distance.where(walkable_distance >= 0),
+        unreachable=walkable_distance == -1,
+    )
+
+    stats = frame.groupby('area', sort=True).agg(
+        cells=('construction', 'size'),
+        construction_sites=('construction', 'sum'),
+        unreachable=('unreachable', 'sum'),
+        reachable=('reachable_distance', 'count'),
+        distance_min=('reachable_distance', 'min'),
+        distance_mean=('reachable_distance', 'mean'),
+        distance_median=('reachable_distance', 'median'),
+        distance_max=('reachable_distance', 'max'),
+    )
+
+    structures = {}
+    counts = frame[frame['struct_name'] != 'Empty'].groupby(['area', 'struct_name'], observed=True).size()
+    for (area_id, struct_name), count in counts.items():
+        structures.setdefault(int(area_id), {})[str(struct_name)] = int(count)
+
+    report = {}
+    for area_id, row in stats.iterrows():
+        report[int(area_id)] = {
+            'cells': int(row['cells']),
+            'structures': structures.get(int(area_id), {}),
+            'construction_sites': int(row['construction_sites']),
+            'construction_ratio': round(float(row['construction_sites']) / int(row['cells']), 4),
+            'nearest_cafe_distance': {
+                'reachable_cells': int(row['reachable']),
+                'unreachable_cells': int(row['unreachable']),
+                'min': _number(row['distance_min']),
+                'mean': _number(row['distance_mean']),
+                'median': _number(row['distance_median']),
+                'max': _number(row['distance_max']),
+            },
+        }
+    return report
+
+def build_area_report(data, processes=1):
+    """병합된 지도 데이터로 전체 구역 리포트(dict)를 만드는 함수
+
+    processes가 2 이상이면 구역들을 processes개의 묶음으로 나누어 프로세스 풀에서 집계합니다.
+    (가장 가까운 커피숍 거리장은 지도 전체가 필요하므로 먼저 한 번 계산해서 각 행에 붙여 보냄)
+    """
+
+    grid = build_grid_map(data)
+    index = index_for(data)
+    cafe_points = index.points(CAFE_STRUCT)
+
+    frame = data[['area', 'struct_name', 'ConstructionSite']].assign(
+        cafe_distance=cafe_distances(data, grid, cafe_points))
+
+    area_ids = sorted(index.area_ranges)
+    processes = max(1, min(processes, len(area_ids)))
+
+    if processes == 1:
+        areas = summarize_areas(frame)
+    else:
+        # 구역 인덱스로 묶음별 행만 잘라 보냄 (구역 크기가 고르게 섞이도록 번갈아 배정)
+        shards = [
+            frame.iloc[np.concatenate([index.area_rows(area_id) for area_id in area_ids[start::processes]])]
+            for start in range(processes)
+        ]
+        areas = {}
+        with Pool(processes) as pool:
+            for part in pool.map(summarize_areas, shards):
+                areas.update(part)
+        areas = dict(sorted(areas.items()))
+
+    construction_sites = sum(area['construction_sites'] for area in areas.values())
+    return {
+        'cells': len(data),
+        'construction_sites': construction_sites,
+        'construction_ratio': round(construction_sites / len(data), 4) if len(data) else 0.0,
+        'cafes': [list(point) for point in cafe_points],
+        'areas': {str(area_id): area for area_id, area in areas.items()},
+    }
+
+def write_area_report(report, path=REPORT_FILE):
+    """리포트를 JSON 파일 하나로 저장하는 함수"""
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+def main():
+    """사용법: python area_report.py [프로세스 수] [출력 JSON]"""
+
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    path = sys.argv[2] if len(sys.argv) > 2 else REPORT_FILE
+
+    data = load_map_data()
+
+    started = time.perf_counter()
+    report = build_area_report(data, processes)
+    write_area_report(report, path)
+    elapsed = time.perf_counter() - started
+
+    print(f'=== 전체 구역 리포트 저장: {path} ===')
+    print(f'구역 {len(report["areas"])}개, 셀 {report["cells"]}개, 건설 현장 비율 {report["construction_ratio"]:.1%}, '
+          f'{elapsed * 1000:.1f}ms (프로세스 {processes}개)')
+
+if __name__ == '__main__':
+    main()
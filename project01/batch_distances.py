@@ -0,0 +1,123 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 다대다(여러 출발점 x 여러 목표점) 거리 행렬 일괄 계산 - 프로세스 풀 + 공유 메모리
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 출발점마다 거리장 1회 계산, 점유 그리드는 공유 메모리로 워커에 전달 | zookeeper
+# 2026-10-18 | 버그 수정 | 지도 밖의 출발점/목표점은 다른 행의 셀 ID로 바뀌지 않도록 ValueError로 거부 | zookeeper
+# 2026-10-18 | 리팩토링 | 범위 검사를 GridMap.contains로 통일 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import os
+import sys
+import time
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from grid_map import GridMap, distance_field
+
+# 워커 프로세스별 상태 (initializer에서 공유 메모리에 연결)
+_worker_state = {}
+
+def _attach_worker(shm_name, shape, min_x, min_y, target_ids):
+    """워커 시작 시 공유 메모리의 점유 그리드에 복사 없이 연결하는 함수"""
+
+    shm = SharedMemory(name=shm_name)
+    occupancy = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    _worker_state['shm'] = shm  # 참조를 유지해야 버퍼가 닫히지 않음
+    _worker_state['grid'] = GridMap(occupancy, min_x, min_y)
+    _worker_state['target_ids'] = target_ids
+
+def _distance_row(task):
+    """출발점 하나의 거리장을 계산하고 목표점들의 거리만 뽑아 반환하는 함수"""
+
+    index, (x, y) = task
+    grid = _worker_state['grid']
+    field = distance_field(grid, x, y).reshape(-1)
+    return index, field[_worker_state['target_ids']]
+
+def check_points(grid, points, label):
+    """좌표 목록이 모두 지도 범위 안에 있는지 확인하고, 벗어난 좌표가 있으면 ValueError를 발생시키는 함수"""
+
+    for x, y in points:
+        if not grid.contains(x, y):
+            raise ValueError(f'지도 범위를 벗어난 {label}입니다: {(x, y)}')
+
+def distance_matrix(grid, sources, targets, processes=None):
+    """출발점 목록 x 목표점 목록의 최단 거리 행렬을 계산하는 함수
+
+    출발점마다 거리장을 한 번씩만 계산하며, processes가 2 이상이면 프로세스 풀에서 나누어 계산합니다.
+    점유 그리드는 pickle로 보내지 않고 공유 메모리에 한 번 올려 모든 워커가 함께 읽습니다.
+    반환값: int32 배열 (len(sources) x len(targets)), 도달할 수 없으면 -1
+    지도 범위를 벗어난 출발점/목표점이 있으면 계산 전에 ValueError를 발생시킵니다.
+    """
+
+    sources = [(int(x), int(y)) for x, y in sources]
+    targets = [(int(x), int(y)) for x, y in targets]
+    check_points(grid, sources, '출발점')
+    check_points(grid, targets, '목표점')
+    target_ids = grid.cell_ids([x for x, _ in targets], [y for _, y in targets]).astype(np.int64)
+    matrix = np.full((len(sources), len(targets)), -1, dtype=np.int32)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(sources)))
+
+    tasks = list(enumerate(sources))
+
+    if processes == 1:
+        # 단일 프로세스는 풀과 공유 메모리 없이 같은 함수로 계산
+        _worker_state.update(grid=grid, target_ids=target_ids)
+        try:
+            for index, row in map(_distance_row, tasks):
+                matrix[index] = row
+        finally:
+            _worker_state.clear()
+        return matrix
+
+    shm = SharedMemory(create=True, size=max(grid.occupancy.nbytes, 1))
+    try:
+        shared = np.ndarray(grid.occupancy.shape, dtype=np.uint8, buffer=shm.buf)
+        shared[:] = grid.occupancy
+        del shared  # 공유 메모리를 닫기 전에 버퍼 참조 해제
+
+        initargs = (shm.name, grid.occupancy.shape, grid.min_x, grid.min_y, target_ids)
+        chunksize = max(1, len(tasks) // (processes * 4))
+        with Pool(processes, initializer=_attach_worker, initargs=initargs) as pool:
+            for index, row in pool.imap_unordered(_distance_row, tasks, chunksize):
+                matrix[index] = row
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return matrix
+
+def run_benchmark(size=1000, source_count=32, target_count=200, obstacle_ratio=0.2):
+    """프로세스 수별 다대다 거리 행렬 계산 시간을 측정하는 함수"""
+
+    print(f'=== 다대다 거리 행렬 벤치마크 ({size} x {size}, 출발 {source_count} x 목표 {target_count}) ===')
+
+    rng = np.random.default_rng(0)
+    grid = GridMap((rng.random((size, size)) < obstacle_ratio).astype(np.uint8))
+    sources = [tuple(point) for point in rng.integers(0, size, (source_count, 2))]
+    targets = [tuple(point) for point in rng.integers(0, size, (target_count, 2))]
+
+    cpu_count = os.cpu_count() or 1
+    process_counts = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+
+    baseline = None
+    expected = None
+    for processes in process_counts:
+        started = time.perf_counter()
+        matrix = distance_matrix(grid, sources, targets, processes)
+        elapsed = time.perf_counter() - started
+
+        if expected is None:
+            baseline, expected = elapsed, matrix
+        assert np.array_equal(matrix, expected)
+        print(f'프로세스 {processes:>2}개: {elapsed:.3f}초 (속도 향상 {baseline / elapsed:.2f}배)')
+
+if __name__ == '__main__':
+    run_benchmark(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,184 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 경로 이미지 일괄 생성 - (출발점, 도착점, 파일명) 작업 목록을 프로세스 풀에서 화면 없이 렌더링
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 워커마다 지도/그리드/베이스 레이어를 한 번만 로드, Agg 백엔드, 초당 이미지 수 출력 | zookeeper
+# 2026-10-18 | 버그 수정 | 작업 좌표를 미리 검사, 작업별 예외를 실패 결과로 반환하여 나머지 작업은 계속 처리 | zookeeper
+# 2026-10-18 | 리팩토링 | 범위 검사를 GridMap.contains로 통일 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import contextlib
+import csv
+import io
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+from map_data import load_map_data
+from map_direct_save import create_grid_map, bfs_distance_between_points, visualize_map_with_path
+from map_index import index_for
+from plot_setup import HEADLESS_ENV
+from route_render import BASE_DPI, load_base_layer, render_route_image
+
+OUTPUT_DIR = 'route_images'
+
+# 워커 프로세스별 상태 (initializer에서 지도와 그리드를 한 번만 로드)
+_worker_state = {}
+
+def pair_jobs(data, output_dir=OUTPUT_DIR):
+    """내 집 x 반달곰 커피 모든 쌍의 작업 목록 [(출발점, 도착점, 파일명)]을 만드는 함수"""
+
+    index = index_for(data)
+    return [
+        (home, cafe, os.path.join(output_dir, f'route_{home[0]}_{home[1]}_to_{cafe[0]}_{cafe[1]}.png'))
+        for home in index.points('MyHome')
+        for cafe in index.points('BandalgomCoffee')
+    ]
+
+def read_jobs(path):
+    """작업 CSV(start_x,start_y,dest_x,dest_y,filename)를 읽어 작업 목록으로 변환하는 함수"""
+
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return [
+            ((int(row['start_x']), int(row['start_y'])), (int(row['dest_x']), int(row['dest_y'])), row['filename'])
+            for row in csv.DictReader(f)
+        ]
+
+def validate_jobs(jobs, grid):
+    """지도 범위를 벗어난 좌표가 있는 작업을 골라내는 함수
+
+    반환값: (유효한 작업 목록, [(파일명, 오류 메시지)])
+    """
+
+    valid, invalid = [], []
+    for start, destination, filename in jobs:
+        outside = [point for point in (start, destination) if not grid.contains(*point)]
+        if outside:
+            invalid.append((filename, f'지도 범위를 벗어난 좌표입니다: {outside[0]}'))
+        else:
+            valid.append((start, destination, filename))
+    return valid, invalid
+
+def _init_worker(renderer, dpi):
+    """워커 시작 시 Agg 백엔드를 지정하고 지도, 그리드, 베이스 레이어를 한 번만 준비하는 함수"""
+
+    os.environ[HEADLESS_ENV] = '1'  # plot_setup.load_pyplot()이 Agg 백엔드를 쓰고 창을 띄우지 않음
+    import matplotlib
+    matplotlib.use('Agg')
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = load_map_data()
+        grid, min_x, min_y, _, _ = create_grid_map(data)
+        if renderer == 'composite':
+            load_base_layer(data, dpi)  # 부모 프로세스가 만든 .npz 캐시를 읽기만 함
+
+    _worker_state.update(data=data, grid=grid, min_x=min_x, min_y=min_y, renderer=renderer, dpi=dpi)
+
+def _render_job(job):
+    """작업 하나의 경로를 찾아 이미지로 저장하고 (파일명, 거리, 걸린 시간, 오류)를 반환하는 함수
+
+    도달할 수 없거나 렌더링 중 예외가 나면 거리는 None, 오류에 메시지를 담아 반환하므로
+    작업 하나의 실패가 풀 전체를 멈추지 않습니다.
+    """
+
+    start, destination, filename = job
+    state = _worker_state
+    started = time.perf_counter()
+
+    try:
+        distance, path = bfs_distance_between_points(state['grid'], start, destination, state['min_x'], state['min_y'])
+        if not path:
+            return filename, None, time.perf_counter() - started, '경로를 찾을 수 없습니다'
+
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        if state['renderer'] == 'composite':
+            render_route_image(state['data'], path, filename, dpi=state['dpi'])
+        else:
+            # 주석이 포함된 전체 그림 (visualize_map_with_path, 헤드리스 모드라 plt.show() 대신 닫음)
+            with contextlib.redirect_stdout(io.StringIO()):
+                visualize_map_with_path(state['data'], path, destination, filename)
+    except Exception as e:
+        return filename, None, time.perf_counter() - started, f'{type(e).__name__}: {e}'
+    return filename, distance, time.perf_counter() - started, None
+
+def render_batch(jobs, processes=None, renderer='composite', dpi=BASE_DPI):
+    """작업 목록의 경로 이미지를 프로세스 풀에서 렌더링하는 함수
+
+    renderer가 'composite'이면 캐시된 베이스 레이어에 경로만 합성(route_render),
+    'full'이면 visualize_map_with_path로 전체 그림을 그립니다. 어느 쪽이든 Agg 백엔드로 파일만 저장합니다.
+    지도 범위를 벗어난 작업은 렌더링하지 않고, 실패한 작업은 거리 None과 오류 메시지로 결과에 남깁니다.
+    반환값: {'results': [(파일명, 거리, 걸린 시간, 오류)], 'elapsed': 전체 시간, 'images_per_second': 처리량}
+    """
+
+    data = load_map_data()
+    with contextlib.redirect_stdout(io.StringIO()):
+        grid, _, _, _, _ = create_grid_map(data)
+    jobs, invalid = validate_jobs(jobs, grid)
+    rejected = [(filename, None, 0.0, message) for filename, message in invalid]
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(jobs)))
+
+    if renderer == 'composite' and jobs:
+        # 워커들이 각자 그리지 않도록 베이스 레이어 디스크 캐시를 먼저 만듦
+        load_base_layer(data, dpi)
+
+    started = time.perf_counter()
+    if not jobs:
+        results = []
+    elif processes == 1:
+        # 단일 프로세스는 풀 없이 같은 함수로 렌더링
+        _init_worker(renderer, dpi)
+        try:
+            results = [_render_job(job) for job in jobs]
+        finally:
+            _worker_state.clear()
+    else:
+        chunksize = max(1, len(jobs) // (processes * 4))
+        with Pool(processes, initializer=_init_worker, initargs=(renderer, dpi)) as pool:
+            results = list(pool.imap_unordered(_render_job, jobs, chunksize))
+    elapsed = time.perf_counter() - started
+
+    rendered = sum(1 for _, distance, _, _ in results if distance is not None)
+    return {
+        'results': rejected + results,
+        'elapsed': elapsed,
+        'images_per_second': rendered / elapsed if elapsed > 0 else 0.0,
+    }
+
+def main():
+    """사용법: python batch_routes.py [작업 CSV] [--processes N] [--full] [--dpi 100]
+
+    작업 CSV가 없으면 내 집 x 반달곰 커피 모든 쌍의 이미지를 route_images/에 만듭니다.
+    """
+
+    args = sys.argv[1:]
+    options = {}
+    for name in ('--processes', '--dpi'):
+        if name in args:
+            position = args.index(name)
+            options[name] = int(args[position + 1])
+            del args[position:position + 2]
+    renderer = 'full' if '--full' in args else 'composite'
+    args = [arg for arg in args if not arg.startswith('--')]
+
+    data = load_map_data()
+    jobs = read_jobs(args[0]) if args else pair_jobs(data)
+    if not jobs:
+        print('렌더링할 작업이 없습니다!')
+        return
+
+    print(f'=== 경로 이미지 일괄 생성 ({len(jobs)}개, 렌더러: {renderer}) ===')
+    report = render_batch(jobs, options.get('--processes'), renderer, options.get('--dpi', BASE_DPI))
+
+    failed = [(filename, error) for filename, distance, _, error in report['results'] if distance is None]
+    for filename, error in failed:
+        print(f'  ❌ {filename}: {error}')
+    print(f'완료: {len(jobs) - len(failed)}개 이미지, {report["elapsed"]:.2f}초 '
+          f'({report["images_per_second"]:.1f} 이미지/초)')
+
+if __name__ == '__main__':
+    main()
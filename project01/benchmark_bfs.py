@@ -0,0 +1,220 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : grid_search BFS 엔진의 그리드 크기별 성능 측정 (선형 확장성 확인)
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 250x250 ~ 2000x2000 그리드에서 모서리 간 BFS 시간 측정 | zookeeper
+# 2026-10-18 | 기능 추가 | 탐색 방식별(BFS / A*) 확장 노드 수 및 시간 비교 추가 | zookeeper
+# 2026-10-18 | 기능 추가 | 무작위 건설 현장 그리드에서 탐색 방식별 결과 일치 검증 추가 | zookeeper
+# 2026-10-18 | 기능 추가 | NumPy wavefront 거리장과 순수 Python BFS 전체 탐색 비교 추가 | zookeeper
+# 2026-10-18 | 수정 | 결과 일치 검증 기준을 공개 함수 bfs_distance_between_points로 변경, --check로 검증만 실행 | zookeeper
+# 2026-10-18 | 수정 | 검증 기준을 grid_search와 독립된 최초 BFS 구현으로 변경, bfs는 경로까지 비교 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import random
+import sys
+import time
+
+import numpy as np
+
+from grid_map import GridMap, distance_field
+from grid_search import SEARCH_METHODS, NO_MOVE, bfs_search, bfs_tree, reconstruct_path
+from map_direct_save import bfs_distance_between_points
+
+def make_open_cells(size):
+    """벽 없이 모두 이동 가능한 size x size flat 셀 배열을 만드는 함수"""
+    return bytearray(size * size)
+
+def run_benchmark(sizes):
+    """그리드 크기별로 (0,0) → (size-1,size-1) BFS 시간을 측정하는 함수"""
+
+    print('=== BFS 엔진 벤치마크 (좌상단 → 우하단) ===')
+    print(f'{"크기":>12} | {"셀 수":>10} | {"시간(초)":>9} | {"셀당(ns)":>9} | {"거리":>6}')
+
+    results = []
+    for size in sizes:
+        cells = make_open_cells(size)
+        goal = size * size - 1
+
+        started = time.perf_counter()
+        goal_id, distance, parent = bfs_search(cells, size, size, 0, {goal})
+        path = reconstruct_path(parent, goal_id)
+        elapsed = time.perf_counter() - started
+
+        cell_count = size * size
+        per_cell_ns = elapsed / cell_count * 1e9
+        results.append((size, cell_count, elapsed, per_cell_ns))
+
+        assert distance == 2 * (size - 1) and len(path) == distance + 1
+        print(f'{size:>5} x {size:<5} | {cell_count:>10} | {elapsed:>9.3f} | {per_cell_ns:>9.1f} | {distance:>6}')
+
+    # 셀당 시간이 크기에 관계없이 일정하면 선형 확장
+    print(f'\n셀당 시간 비율 (최대/최소): {max(r[3] for r in results) / min(r[3] for r in results):.2f}')
+
+    return results
+
+def make_random_cells(size, obstacle_ratio, seed=0):
+    """건설 현장(이동 불가)을 무작위로 배치한 flat 셀 배열을 만드는 함수 (양 끝 모서리는 비움)"""
+
+    rng = random.Random(seed)
+    cells = bytearray(1 if rng.random() < obstacle_ratio else 0 for _ in range(size * size))
+    cells[0] = cells[-1] = 0
+    return cells
+
+def run_search_comparison(size, obstacle_ratio=0.2):
+    """같은 그리드에서 탐색 방식별 확장 노드 수, 큐 최대 크기, 시간을 비교하는 함수"""
+
+    print(f'\n=== 탐색 방식 비교 ({size} x {size}, 장애물 {obstacle_ratio:.0%}) ===')
+    print(f'{"방식":>14} | {"거리":>6} | {"확장 노드":>10} | {"큐 최대":>8} | {"시간(초)":>9}')
+
+    cells = make_random_cells(size, obstacle_ratio)
+    goal = size * size - 1
+
+    for name, search in SEARCH_METHODS.items():
+        stats = {}
+        started = time.perf_counter()
+        goal_id, distance, parent = search(cells, size, size, 0, {goal}, stats)
+        elapsed = time.perf_counter() - started
+        print(f'{name:>14} | {distance:>6} | {stats["expanded"]:>10} | {stats["max_queue"]:>8} | {elapsed:>9.3f}')
+
+def is_valid_path(cells, width, path, start_id, goal_id):
+    """경로가 시작점에서 목표점까지 이동 가능한 셀만 4방향으로 한 칸씩 이동하는지 확인하는 함수"""
+
+    if not path or path[0] != start_id or path[-1] != goal_id:
+        return False
+    for cell, next_cell in zip(path, path[1:]):
+        step = abs(cell - next_cell)
+        same_row = cell // width == next_cell // width
+        if not ((step == 1 and same_row) or step == width) or cells[next_cell] != 0:
+            return False
+    return True
+
+def reference_search(cells, width, height, start, goals):
+    """기준 구현: 최초 map_direct_save BFS와 같은 순서로 2차원 좌표를 탐색하는 함수 (grid_search와 독립)
+
+    FIFO 큐, 좌/우/상/하 이웃 순서, 큐에 넣을 때 방문 표시, 꺼낼 때 목표 확인까지 최초 구현과 같으므로
+    같은 경로를 돌려줍니다. (list.pop(0) 대신 head 인덱스, 경로 복사 대신 parent dict만 사용)
+    반환값: (거리, 좌표 경로), 도달할 수 없으면 (inf, [])
+    """
+
+    queue = [start]
+    parent = {start: None}
+    head = 0
+    while head < len(queue):
+        current = queue[head]
+        head += 1
+        if current in goals:
+            path = []
+            while current is not None:
+                path.append(current)
+                current = parent[current]
+            path.reverse()
+            return len(path) - 1, path
+
+        x, y = current
+        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in parent and cells[ny * width + nx] == 0:
+                parent[(nx, ny)] = current
+                queue.append((nx, ny))
+    return float('inf'), []
+
+def run_consistency_check(trials=300, seed=0):
+    """무작위 크기/건설 현장 그리드에서 탐색 결과를 독립 기준 구현(reference_search)과 비교하는 함수
+
+    - 거리: 모든 방식(엔진 직접 호출, 공개 함수 bfs_distance_between_points의 method별 호출)이 기준값과 같아야 함
+    - 경로: bfs는 기준 구현(최초 BFS)과 경로까지 같아야 하고, astar / bidirectional은 같은 길이의
+      최단 경로가 여러 개일 때 다른 경로를 고를 수 있으므로 길이와 유효성(이동 가능한 셀만 4방향 이동)만 확인
+    - 지도 좌표 원점(min_x, min_y)을 무작위로 옮기고, 지도 밖 목표점은 (inf, [])인지 확인
+    """
+
+    print(f'\n=== 탐색 방식 결과 일치 검증 ({trials}회, 기준: 최초 BFS 구현) ===')
+
+    rng = random.Random(seed)
+    for trial in range(trials):
+        width, height = rng.randint(1, 40), rng.randint(1, 40)
+        min_x, min_y = rng.randint(-5, 5), rng.randint(-5, 5)
+        obstacle_ratio = rng.uniform(0.1, 0.4)
+        cells = bytearray(1 if rng.random() < obstacle_ratio else 0 for _ in range(width * height))
+        grid = GridMap(np.frombuffer(bytes(cells), dtype=np.uint8).reshape(height, width), min_x, min_y)
+
+        start_id = rng.randrange(width * height)
+        goal_ids = {rng.randrange(width * height) for _ in range(rng.randint(1, 3))}
+        start = grid.coord(start_id)
+
+        def to_cells(path):
+            return [grid.cell_id(x + min_x, y + min_y) for x, y in path]
+
+        # 1. 엔진 직접 호출 (다중 목표)
+        expected, expected_path = reference_search(
+            cells, width, height, (start_id % width, start_id // width),
+            {(goal_id % width, goal_id // width) for goal_id in goal_ids})
+        for name, search in SEARCH_METHODS.items():
+            goal_id, distance, parent = search(cells, width, height, start_id, goal_ids)
+            distance = float('inf') if goal_id is None else distance
+            assert distance == expected, f'{name}: 거리 불일치 ({distance} != {expected}, 시도 {trial})'
+            if goal_id is None:
+                continue
+            path = reconstruct_path(parent, goal_id)
+            if name == 'bfs':
+                assert path == to_cells(expected_path), f'{name}: 기준 구현과 경로가 다름 (시도 {trial})'
+            assert goal_id in goal_ids and len(path) == distance + 1, f'{name}: 경로 길이 오류 (시도 {trial})'
+            assert is_valid_path(cells, width, path, start_id, goal_id), f'{name}: 잘못된 경로 (시도 {trial})'
+
+        # 2. 공개 함수 (단일 목표, 실제 좌표)
+        for goal_id in goal_ids:
+            end = grid.coord(goal_id)
+            expected, expected_path = reference_search(
+                cells, width, height, (start_id % width, start_id // width), {(goal_id % width, goal_id // width)})
+            for name in SEARCH_METHODS:
+                distance, path = bfs_distance_between_points(grid, start, end, min_x, min_y, name)
+                assert distance == expected, f'{name}: 공개 함수 거리 불일치 ({distance} != {expected}, 시도 {trial})'
+                if name == 'bfs':
+                    assert path == [(x + min_x, y + min_y) for x, y in expected_path], \
+                        f'{name}: 공개 함수 경로가 기준 구현과 다름 (시도 {trial})'
+                elif path:
+                    assert is_valid_path(cells, width, [grid.cell_id(*point) for point in path], start_id, goal_id), \
+                        f'{name}: 공개 함수 경로 오류 (시도 {trial})'
+
+        # 3. 지도 밖 목표점은 다른 행으로 넘어가지 않고 도달 불가로 처리되어야 함
+        outside = (min_x + width, min_y) if trial % 2 else (min_x - 1, min_y + height - 1)
+        assert bfs_distance_between_points(grid, start, outside, min_x, min_y) == (float('inf'), []), \
+            f'지도 밖 목표점 {outside}이 도달 가능으로 처리됨 (시도 {trial})'
+
+    print(f'✅ {", ".join(SEARCH_METHODS)} 모두 거리 일치 (bfs는 경로까지 일치, 나머지는 경로 길이/유효성 확인)')
+
+def run_distance_field_benchmark(size, obstacle_ratio=0.2):
+    """한 출발점에서 전체 셀까지의 거리 계산을 순수 Python BFS와 NumPy wavefront로 비교하는 함수"""
+
+    print(f'\n=== 전체 거리장 계산 비교 ({size} x {size}, 장애물 {obstacle_ratio:.0%}) ===')
+
+    cells = make_random_cells(size, obstacle_ratio)
+    grid = GridMap(np.frombuffer(bytes(cells), dtype=np.uint8).reshape(size, size))
+
+    started = time.perf_counter()
+    _, moves = bfs_tree(cells, size, size, 0)
+    python_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    distances = distance_field(grid, 0, 0)
+    numpy_elapsed = time.perf_counter() - started
+
+    # 도달 가능한 셀 집합이 같은지 확인 (시작점은 방향 코드가 없으므로 제외)
+    reached = np.frombuffer(bytes(moves), dtype=np.uint8) != NO_MOVE
+    reached[0] = True
+    assert np.array_equal(reached, distances.reshape(-1) >= 0)
+
+    print(f'순수 Python BFS: {python_elapsed:.3f}초')
+    print(f'NumPy wavefront: {numpy_elapsed:.3f}초 (최대 거리 {distances.max()}, {python_elapsed / numpy_elapsed:.1f}배 빠름)')
+
+if __name__ == '__main__':
+    # python benchmark_bfs.py --check [시도 횟수] : 벤치마크 없이 결과 일치 검증만 실행
+    if '--check' in sys.argv[1:]:
+        run_consistency_check(*[int(arg) for arg in sys.argv[1:] if arg != '--check'])
+        sys.exit(0)
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [250, 500, 1000, 2000]
+    run_benchmark(sizes)
+    run_search_comparison(min(max(sizes), 1000))
+    run_consistency_check()
+    run_distance_field_benchmark(min(max(sizes), 1000))
@@ -0,0 +1,173 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 경로 탐색 파이프라인 전체 벤치마크 - 가상 지도 크기별 단계 시간 측정 및 기준값 대비 회귀 검사
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 로드/그리드/BFS/투어/CSV 저장/렌더링 시간 측정, 결과값 일치 + 시간 허용 범위 검사 | zookeeper
+# 2026-10-18 | 성능 개선 | 경로 저장 단계를 바이너리 경로 파일 + CSV 변환(save_path_to_route)으로 변경 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+from generate_map import generate_map
+from map_data import load_map_data
+from map_direct_save import (
+    find_start_and_destinations, find_all_structures, create_grid_map, bfs_shortest_path,
+    find_optimized_all_structures_path, save_path_to_route, visualize_map_with_path
+)
+from plot_setup import HEADLESS_ENV
+
+BASELINE_FILE = 'benchmark_baseline.json'
+STAGES = ['load', 'grid', 'bfs', 'tour', 'csv_export', 'render']
+MIN_REGRESSION_SECONDS = 0.005  # 이보다 작은 시간 차이는 측정 오차로 보고 무시
+
+def run_pipeline(render=True):
+    """현재 디렉터리의 CSV로 map_direct_save 파이프라인을 한 번 실행하고 (단계별 시간, 결과값)을 반환하는 함수"""
+
+    timings = {}
+
+    def timed(stage, function, *args, **kwargs):
+        started = time.perf_counter()
+        result = function(*args, **kwargs)
+        timings[stage] = time.perf_counter() - started
+        return result
+
+    load_map_data.cache_clear()  # 이전 크기의 메모이즈 결과를 쓰지 않도록 초기화
+    data = timed('load', load_map_data, use_cache=False)
+    start_point, destinations = find_start_and_destinations(data)
+    structure_points, _ = find_all_structures(data)
+
+    grid, min_x, min_y, _, _ = timed('grid', create_grid_map, data)
+    path, target, distance = timed('bfs', bfs_shortest_path, grid, start_point, destinations, min_x, min_y)
+    tour_path, tour_distance = timed('tour', find_optimized_all_structures_path,
+                                     grid, start_point, structure_points, min_x, min_y)
+
+    started = time.perf_counter()
+    save_path_to_route(path, 'home_to_cafe.route', 'home_to_cafe.csv')
+    save_path_to_route(tour_path, 'home_to_all_structures.route', 'home_to_all_structures.csv')
+    timings['csv_export'] = time.perf_counter() - started
+
+    if render:
+        timed('render', visualize_map_with_path, data, path, target, 'map_final.png', tour_path)
+
+    results = {
+        'target': list(target),
+        'distance': distance,
+        'path_length': len(path),
+        'structures': len(structure_points),
+        'tour_distance': tour_distance,
+        'tour_length': len(tour_path),
+    }
+    return timings, results
+
+def benchmark_size(size, repeat=3, render_limit=200, obstacle_ratio=0.2, structure_count=9, seed=0):
+    """size x size 가상 지도를 만들어 파이프라인을 repeat번 실행하고 단계별 최소 시간과 결과값을 반환하는 함수"""
+
+    previous_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        generate_map(directory, size, size, obstacle_ratio, area_count=4,
+                     structure_count=structure_count, seed=seed)
+        os.chdir(directory)
+        try:
+            best = {}
+            results = None
+            for _ in range(repeat):
+                # 파이프라인 함수들의 진행 메시지와 matplotlib 경고는 숨김
+                with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+                    warnings.simplefilter('ignore', UserWarning)
+                    timings, run_results = run_pipeline(render=size <= render_limit)
+
+                if results is not None and run_results != results:
+                    raise AssertionError(f'{size} x {size}: 반복 실행 결과가 다릅니다 ({run_results} != {results})')
+                results = run_results
+                for stage, elapsed in timings.items():
+                    best[stage] = min(best.get(stage, elapsed), elapsed)
+        finally:
+            os.chdir(previous_directory)
+
+    return {'timings': best, 'results': results}
+
+def compare_with_baseline(report, baseline, tolerance):
+    """기준값과 비교하여 회귀 목록을 반환하는 함수
+
+    결과값(거리, 경로 길이 등)은 정확히 같아야 하고, 단계 시간은 기준값의 (1 + tolerance)배 이하여야 합니다.
+    (차이가 MIN_REGRESSION_SECONDS 미만인 아주 짧은 단계는 측정 오차로 보고 제외)
+    """
+
+    regressions = []
+    for size, current in report.items():
+        reference = baseline.get(size)
+        if reference is None:
+            continue
+
+        if current['results'] != reference['results']:
+            regressions.append(f'{size}: 결과값 변경 {reference["results"]} → {current["results"]}')
+
+        for stage, elapsed in current['timings'].items():
+            expected = reference['timings'].get(stage)
+            if expected is None or elapsed - expected < MIN_REGRESSION_SECONDS:
+                continue
+            if elapsed > expected * (1 + tolerance):
+                regressions.append(f'{size}: {stage} {expected * 1000:.1f}ms → {elapsed * 1000:.1f}ms '
+                                   f'({elapsed / expected:.2f}배)')
+    return regressions
+
+def main():
+    """사용법: python benchmark_pipeline.py [--save-baseline] [--tolerance 0.5] [크기 ...]
+
+    기준값 파일(benchmark_baseline.json)이 있으면 비교하여 회귀가 있을 때 종료 코드 1을 반환합니다.
+    """
+
+    args = sys.argv[1:]
+    save_baseline = '--save-baseline' in args
+    tolerance = 0.5
+    if '--tolerance' in args:
+        tolerance = float(args[args.index('--tolerance') + 1])
+        del args[args.index('--tolerance'):args.index('--tolerance') + 2]
+    sizes = [int(arg) for arg in args if not arg.startswith('--')] or [15, 50, 100, 200]
+
+    # 렌더링 단계는 창을 띄우지 않고 파일로만 저장
+    os.environ[HEADLESS_ENV] = '1'
+
+    print('=== 파이프라인 벤치마크 (단계별 최소 시간, ms) ===')
+    print(f'{"크기":>11} | ' + ' | '.join(f'{stage:>10}' for stage in STAGES))
+
+    report = {}
+    for size in sizes:
+        entry = benchmark_size(size)
+        report[f'{size}x{size}'] = entry
+        cells = ' | '.join(
+            f'{entry["timings"][stage] * 1000:>10.1f}' if stage in entry['timings'] else f'{"-":>10}'
+            for stage in STAGES
+        )
+        print(f'{size:>4} x {size:<4} | {cells}')
+
+    if save_baseline:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'\n기준값 저장: {BASELINE_FILE}')
+        return
+
+    if not os.path.exists(BASELINE_FILE):
+        print(f'\n기준값 파일이 없습니다. --save-baseline으로 {BASELINE_FILE}을 먼저 만드세요.')
+        return
+
+    with open(BASELINE_FILE, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(report, baseline, tolerance)
+    if regressions:
+        print(f'\n❌ 회귀 {len(regressions)}건 (시간 허용 범위 +{tolerance:.0%}):')
+        for regression in regressions:
+            print(f'  {regression}')
+        sys.exit(1)
+    print(f'\n✅ 기준값 대비 회귀 없음 (시간 허용 범위 +{tolerance:.0%})')
+
+if __name__ == '__main__':
+    main()
@@ -4,32 +4,27 @@
 
 # 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
 # 2025-07-22 | 요구사항 수정 | 요구사항에 맞는 데이터 분석 및 통계 리포트 구현 | zookeeper
+# 2026-10-18 | 성능 개선 | 병합 데이터를 바이너리 컬럼 캐시로 재사용 (원본 CSV 변경 시에만 재생성) | zookeeper
+# 2026-10-18 | 리팩토링 | 로드/병합 코드를 공용 로더(map_data)로 이동 | zookeeper
+# 2026-10-18 | 성능 개선 | Area 1 필터링을 마스크 스캔 대신 구역 인덱스(map_index) 조회로 변경 | zookeeper
+# 2026-10-18 | 수정 | 구조물 분포를 기존과 같은 순서로 출력 (범주형 대신 문자열 기준 value_counts) | zookeeper
 # ----------------------------------------------------------------------------------------------------
 
-import pandas as pd
+from map_data import load_map_data
+from map_index import index_for
 
 def filter_area1_coffee_data():
     """Area 1 지역의 반달곰 커피 관련 데이터를 필터링하고 분석하는 함수"""
     
-    # 1. CSV 파일들 불러오기
+    # 1~3. CSV 파일 로딩, 구조물 이름 변환, 병합 (공용 로더 map_data 사용)
     print('=== CSV 파일 로딩 ===')
     
-    area_category = pd.read_csv('area_category.csv', skipinitialspace=True)
-    area_map = pd.read_csv('area_map.csv')
-    area_struct = pd.read_csv('area_struct.csv')
+    merged_data = load_map_data()
     
-    # 2. 구조물 ID를 이름으로 변환
-    category_mapping = dict(zip(area_category['category'], area_category['struct']))
-    area_struct['struct_name'] = area_struct['category'].map(category_mapping)
-    area_struct['struct_name'] = area_struct['struct_name'].fillna('Empty')
-    
-    # 3. 데이터 병합
-    merged_data = pd.merge(area_map, area_struct, on=['x', 'y'], how='inner')
-    
-    # 4. Area 1 데이터만 필터링
+    # 4. Area 1 데이터만 필터링 (구역 인덱스로 해당 행만 조회)
     print('=== Area 1 데이터 필터링 ===')
     
-    area1_data = merged_data[merged_data['area'] == 1].copy()
+    area1_data = merged_data.iloc[index_for(merged_data).area_rows(1)].copy()
     area1_data = area1_data.sort_values(['x', 'y']).reset_index(drop=True)
     
     print(f'Area 1 전체 좌표 개수: {len(area1_data)}')
@@ -38,7 +33,8 @@ def filter_area1_coffee_data():
     
     # 5. Area 1 구조물 분포
     print("\nArea 1 구조물 분포:")
-    struct_count = area1_data['struct_name'].value_counts()
+    # 범주형 value_counts는 없는 구조물(0개)까지 값 목록 순서로 세므로, 기존과 같이 등장 순서 기준으로 집계
+    struct_count = area1_data['struct_name'].astype(object).value_counts()
     for struct_name, count in struct_count.items():
         print(f"  {struct_name}: {count}개")
     
@@ -0,0 +1,137 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 벤치마크용 가상 지도 생성 - area_map / area_struct / area_category CSV를 원하는 크기로 생성
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 크기, 건설 현장 비율, 구역 수, 구조물 수, 시드를 지정하여 열 단위로 CSV 기록 | zookeeper
+# 2026-10-18 | 버그 수정 | 내 집 → 가장 가까운 반달곰 커피 L자 통로는 건설 현장을 두지 않아 항상 도달 가능하도록 보장 | zookeeper
+# 2026-10-18 | 버그 수정 | 구역 번호 docstring을 실제 계산식(열 우선, 샘플 데이터와 동일)에 맞게 정정 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import math
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 구조물 코드 (샘플 area_category.csv와 동일)
+CATEGORIES = {1: 'Apartment', 2: 'Building', 3: 'MyHome', 4: 'BandalgomCoffee'}
+
+def area_layout(width, height, area_count):
+    """구역을 격자 모양 블록으로 나누는 함수
+
+    번호는 샘플 데이터처럼 열 우선으로 매김: 같은 x 블록 열 안에서 y 방향으로 먼저 증가
+    (구역 번호 = x 블록 번호 * y 방향 블록 수 + y 블록 번호, 15x15 샘플의 (1,15)가 1, (15,1)이 2)
+    반환값: (x 방향 블록 수, y 방향 블록 수, 블록 너비, 블록 높이)
+    """
+
+    columns = math.ceil(math.sqrt(area_count))
+    rows = math.ceil(area_count / columns)
+    return columns, rows, math.ceil(width / columns), math.ceil(height / rows)
+
+def generate_map(directory, width=15, height=15, obstacle_ratio=0.3, area_count=4,
+                 structure_count=9, cafe_count=2, seed=0, columns_per_chunk=None):
+    """가상 지도 CSV 3개(area_map.csv, area_struct.csv, area_category.csv)를 directory에 만드는 함수
+
+    - 건설 현장은 obstacle_ratio 비율로 무작위 배치하되 구조물이 있는 셀은 비워 둠
+    - 내 집에서 가장 가까운(Manhattan) 반달곰 커피까지 L자 통로(내 집 행 → 커피숍 열)를 비워 두어
+      건설 현장 비율과 관계없이 기본 경로가 항상 존재함
+    - 구조물: 내 집 1개, 반달곰 커피 cafe_count개, 아파트/빌딩 structure_count개 (무작위 위치)
+    - 샘플 CSV와 같이 x 순서(열 단위)로 행을 기록하며, 열 묶음 단위로 만들어 이어 쓰므로
+      메모리 사용량이 지도 크기가 아닌 columns_per_chunk * height에 비례
+    반환값: 구조물 종류별 좌표 dict
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    cell_count = width * height
+    special_count = 1 + cafe_count + structure_count
+    if special_count > cell_count:
+        raise ValueError(f'구조물 {special_count}개를 {width} x {height} 지도에 배치할 수 없습니다!')
+
+    # 구조물 위치 (셀 ID = (x - 1) * height + (y - 1), 기록 순서와 같은 열 우선)
+    special_ids = rng.choice(cell_count, special_count, replace=False)
+    special_categories = np.concatenate((
+        [3], np.full(cafe_count, 4), rng.choice([1, 2], structure_count)
+    )).astype(np.int64)
+    order = np.argsort(special_ids)
+    special_ids, special_categories = special_ids[order], special_categories[order]
+
+    # 내 집 → 가장 가까운 반달곰 커피 L자 통로 (내 집의 y 행을 따라 커피숍 x까지, 이후 커피숍 x 열을 따라 이동)
+    home_x, home_y = divmod(int(special_ids[special_categories == 3][0]), height)
+    cafes = [divmod(int(cell_id), height) for cell_id in special_ids[special_categories == 4]]
+    if cafes:
+        cafe_x, cafe_y = min(cafes, key=lambda cafe: abs(cafe[0] - home_x) + abs(cafe[1] - home_y))
+    else:
+        cafe_x, cafe_y = home_x, home_y
+
+    layout_columns, layout_rows, block_width, block_height = area_layout(width, height, area_count)
+    if columns_per_chunk is None:
+        columns_per_chunk = max(1, 1_000_000 // height)
+
+    map_path = os.path.join(directory, 'area_map.csv')
+    struct_path = os.path.join(directory, 'area_struct.csv')
+    # 샘플 파일과 같이 UTF-8 BOM을 붙여 저장
+    with open(map_path, 'w', encoding='utf-8-sig', newline='') as map_file, \
+            open(struct_path, 'w', encoding='utf-8-sig', newline='') as struct_file:
+        for first_x in range(1, width + 1, columns_per_chunk):
+            last_x = min(width, first_x + columns_per_chunk - 1)
+            xs = np.repeat(np.arange(first_x, last_x + 1), height)
+            ys = np.tile(np.arange(1, height + 1), last_x - first_x + 1)
+            ids = (xs - 1) * height + (ys - 1)
+
+            category = np.zeros(len(ids), dtype=np.int64)
+            lo, hi = np.searchsorted(special_ids, [ids[0], ids[-1] + 1])
+            category[special_ids[lo:hi] - ids[0]] = special_categories[lo:hi]
+
+            construction = (rng.random(len(ids)) < obstacle_ratio) & (category == 0)
+            corridor = (
+                ((ys - 1 == home_y) & (xs - 1 >= min(home_x, cafe_x)) & (xs - 1 <= max(home_x, cafe_x)))
+                | ((xs - 1 == cafe_x) & (ys - 1 >= min(home_y, cafe_y)) & (ys - 1 <= max(home_y, cafe_y)))
+            )
+            construction &= ~corridor
+
+            block_x = np.minimum((xs - 1) // block_width, layout_columns - 1)
+            block_y = np.minimum((ys - 1) // block_height, layout_rows - 1)
+            area = np.minimum(block_x * layout_rows + block_y, area_count - 1)  # 열 우선 번호 (area_layout 참고)
+
+            header = first_x == 1
+            pd.DataFrame({'x': xs, 'y': ys, 'ConstructionSite': construction.astype(np.int8)}).to_csv(
+                map_file, header=header, index=False)
+            pd.DataFrame({'x': xs, 'y': ys, 'category': category, 'area': area}).to_csv(
+                struct_file, header=header, index=False)
+
+    with open(os.path.join(directory, 'area_category.csv'), 'w', encoding='utf-8', newline='') as f:
+        f.write('category, struct\n')
+        for code, name in CATEGORIES.items():
+            f.write(f'{code}, {name}\n')
+
+    structures = {}
+    for cell_id, code in zip(special_ids.tolist(), special_categories.tolist()):
+        structures.setdefault(CATEGORIES[code], []).append((cell_id // height + 1, cell_id % height + 1))
+    return structures
+
+def main():
+    """사용법: python generate_map.py <디렉터리> [너비] [높이] [건설 현장 비율] [구역 수] [구조물 수] [시드]"""
+
+    if len(sys.argv) < 2:
+        print(main.__doc__)
+        return
+
+    directory = sys.argv[1]
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else width
+    obstacle_ratio = float(sys.argv[4]) if len(sys.argv) > 4 else 0.3
+    area_count = int(sys.argv[5]) if len(sys.argv) > 5 else 4
+    structure_count = int(sys.argv[6]) if len(sys.argv) > 6 else 9
+    seed = int(sys.argv[7]) if len(sys.argv) > 7 else 0
+
+    structures = generate_map(directory, width, height, obstacle_ratio, area_count, structure_count, seed=seed)
+    print(f'=== 가상 지도 생성: {directory} ({width} x {height}, 건설 현장 {obstacle_ratio:.0%}, 구역 {area_count}개) ===')
+    for struct_name, points in structures.items():
+        print(f'  {struct_name}: {len(points)}개')
+
+if __name__ == '__main__':
+    main()
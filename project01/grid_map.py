@@ -0,0 +1,122 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 경로 탐색용 점유 그리드 - NumPy uint8 배열 기반, 셀 ID 제공
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | iterrows 없이 벡터화된 scatter로 점유 그리드 생성 | zookeeper
+# 2026-10-18 | 기능 추가 | 배열 연산으로 wavefront를 확장하는 전체 거리장(distance field) 계산 추가 | zookeeper
+# 2026-10-18 | 수정 | 압축된 int16 좌표로도 셀 ID 계산이 넘치지 않도록 int/int64로 변환 | zookeeper
+# 2026-10-18 | 기능 추가 | 여러 출발점 중 가장 가까운 곳까지의 거리장(nearest_distance_field) 추가 | zookeeper
+# 2026-10-18 | 기능 추가 | 좌표 범위 검사 메서드(contains) 추가 - 질의/일괄 계산/타일 그리드/증분 계획기 공용 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+class GridMap:
+    """연속된 uint8 배열(0: 이동 가능, 1: 이동 불가)로 저장되는 점유 그리드
+
+    occupancy[y][x] 형태의 2차원 배열과, 탐색 엔진이 셀 ID(y * width + x)로 바로 읽을 수 있는
+    flat memoryview(cells)를 함께 제공합니다. cells는 occupancy와 메모리를 공유합니다.
+    기존 중첩 리스트 그리드와 같이 grid[y][x], len(grid)로도 접근할 수 있습니다.
+    """
+
+    def __init__(self, occupancy, min_x=0, min_y=0):
+        self.occupancy = np.ascontiguousarray(occupancy, dtype=np.uint8)
+        self.height, self.width = self.occupancy.shape
+        self.min_x = min_x
+        self.min_y = min_y
+        self.max_x = min_x + self.width - 1
+        self.max_y = min_y + self.height - 1
+        self.cells = memoryview(self.occupancy.reshape(-1))
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, row):
+        return self.occupancy[row]
+
+    @property
+    def blocked_count(self):
+        """이동 불가 셀 수"""
+        return int(np.count_nonzero(self.occupancy))
+
+    def contains(self, x, y):
+        """실제 좌표가 지도 범위 안에 있는지 확인하는 메서드 (cell_id로 바꾸기 전에 검사)"""
+        return self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y
+
+    def cell_id(self, x, y):
+        """실제 좌표를 셀 ID로 변환하는 메서드"""
+        return (int(y) - self.min_y) * self.width + (int(x) - self.min_x)
+
+    def coord(self, cell_id):
+        """셀 ID를 실제 좌표로 변환하는 메서드"""
+        return cell_id % self.width + self.min_x, cell_id // self.width + self.min_y
+
+    def cell_ids(self, xs, ys):
+        """좌표 배열을 셀 ID 배열로 한 번에 변환하는 메서드 (int16 좌표도 넘치지 않도록 int64로 계산)"""
+        return (np.asarray(ys, dtype=np.int64) - self.min_y) * self.width + (np.asarray(xs, dtype=np.int64) - self.min_x)
+
+def build_grid_map(data):
+    """병합된 지도 데이터의 x, y, ConstructionSite 컬럼으로 GridMap을 만드는 함수
+
+    셀마다 반복하지 않고, 건설 현장 좌표를 한 번의 배열 인덱싱(scatter)으로 표시합니다.
+    """
+
+    xs = data['x'].to_numpy()
+    ys = data['y'].to_numpy()
+    min_x, min_y = int(xs.min()), int(ys.min())
+    width = int(xs.max()) - min_x + 1
+    height = int(ys.max()) - min_y + 1
+
+    occupancy = np.zeros((height, width), dtype=np.uint8)
+    blocked = data['ConstructionSite'].to_numpy() == 1
+    occupancy[ys[blocked] - min_y, xs[blocked] - min_x] = 1
+
+    return GridMap(occupancy, min_x, min_y)
+
+def distance_field(grid, source_x, source_y):
+    """한 출발점에서 모든 셀까지의 최단 거리를 int32 배열(height x width)로 계산하는 함수
+
+    셀마다 Python 반복을 돌지 않고, 현재 wavefront(셀 ID 배열)의 4방향 이웃을
+    배열 연산으로 한 번에 만들어 다음 wavefront를 구합니다. 도달할 수 없는 셀은 -1입니다.
+    """
+    return nearest_distance_field(grid, [(source_x, source_y)])
+
+def nearest_distance_field(grid, sources):
+    """여러 출발점 중 가장 가까운 곳까지의 최단 거리를 int32 배열(height x width)로 계산하는 함수
+
+    모든 출발점을 거리 0의 첫 wavefront로 두고 한 번만 확장하므로 (다중 출발점 BFS),
+    출발점 수와 관계없이 distance_field 한 번과 같은 비용입니다. 도달할 수 없는 셀은 -1입니다.
+    """
+
+    width, height = grid.width, grid.height
+    free = grid.occupancy.reshape(-1) == 0
+    distances = np.full(width * height, -1, dtype=np.int32)
+
+    frontier = np.unique(np.array([grid.cell_id(x, y) for x, y in sources], dtype=np.int64))
+    distances[frontier] = 0
+
+    # 중복 제거용 표시 배열 (같은 셀이 여러 이웃에서 동시에 발견될 수 있음)
+    owner = np.empty(width * height, dtype=np.int64)
+    distance = 0
+
+    while frontier.size:
+        distance += 1
+        x = frontier % width
+
+        candidates = np.concatenate((
+            frontier[x > 0] - 1,
+            frontier[x < width - 1] + 1,
+            frontier[frontier >= width] - width,
+            frontier[frontier < width * (height - 1)] + width,
+        ))
+        candidates = candidates[free[candidates] & (distances[candidates] == -1)]
+
+        # 셀마다 기록된 위치 하나만 남겨 중복 제거 (정렬 없이 O(k), 어느 위치가 남아도 결과는 같음)
+        order = np.arange(candidates.size)
+        owner[candidates] = order
+        frontier = candidates[owner[candidates] == order]
+
+        distances[frontier] = distance
+
+    return distances.reshape(height, width)
@@ -0,0 +1,373 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 그리드 경로 탐색 엔진 (parent 배열 기반 BFS)
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 셀 ID 기반 flat 배열 + 레벨 단위 FIFO BFS 엔진 구현 | zookeeper
+# 2026-10-18 | 기능 추가 | 다중 목표 거리 계산용 BFS 트리(1바이트 방향 코드) 추가 | zookeeper
+# 2026-10-18 | 기능 추가 | Manhattan 휴리스틱 A* 탐색 및 확장 노드 수 통계 추가 | zookeeper
+# 2026-10-18 | 기능 추가 | 양방향 BFS 탐색 추가 | zookeeper
+# 2026-10-18 | 기능 개선 | GridMap의 flat 셀 배열을 복사 없이 사용 | zookeeper
+# 2026-10-18 | 기능 개선 | A* 탐색 상태를 방문한 셀만 저장하도록 변경 (타일 지도 지원) | zookeeper
+# 2026-10-18 | 버그 수정 | 그리드 범위 검사 함수 추가 (범위 밖 좌표가 다른 행의 셀 ID로 바뀌는 문제) | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+# 4방향 이동 (좌, 우, 상, 하) - map_direct_save.py의 기존 탐색 순서와 동일
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+def flatten_grid(grid):
+    """그리드를 셀 ID(y * width + x) 기준의 flat 배열로 변환하는 함수
+
+    GridMap처럼 flat 배열(cells)을 이미 가지고 있으면 복사 없이 그대로 사용하고,
+    중첩 리스트 그리드는 bytearray로 변환합니다.
+    """
+
+    if hasattr(grid, 'cells'):
+        return grid.cells, grid.width, grid.height
+
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+
+    cells = bytearray(width * height)
+    for y, row in enumerate(grid):
+        cells[y * width:(y + 1) * width] = bytes(row)
+
+    return cells, width, height
+
+def in_grid(x, y, width, height):
+    """그리드 좌표가 그리드 범위 안에 있는지 확인하는 함수 (범위 밖 좌표는 셀 ID로 바꾸면 다른 행을 가리킴)"""
+    return 0 <= x < width and 0 <= y < height
+
+def to_cell_id(x, y, width):
+    """그리드 좌표를 셀 ID로 변환하는 함수"""
+    return y * width + x
+
+def from_cell_id(cell_id, width):
+    """셀 ID를 그리드 좌표로 변환하는 함수"""
+    return cell_id % width, cell_id // width
+
+def record_stats(stats, expanded, max_queue):
+    """탐색 통계(확장한 노드 수, 큐 최대 크기)를 stats dict에 기록하는 함수"""
+
+    if stats is not None:
+        stats['expanded'] = expanded
+        stats['max_queue'] = max_queue
+
+def bfs_search(cells, width, height, start_id, goal_ids=None, stats=None):
+    """flat 셀 배열에서 BFS를 수행하는 함수
+
+    큐는 레벨 단위 frontier 리스트(append/순회만 사용, pop(0) 없음)로 구현하여
+    모든 연산이 O(1)이고, 경로는 저장하지 않고 parent 배열만 기록합니다.
+    goal_ids가 주어지면 가장 먼저 발견한 목표에서 멈추고, 없으면 도달 가능한 모든 셀을 탐색합니다.
+    stats dict가 주어지면 확장한 노드 수와 큐 최대 크기를 기록합니다.
+    반환값: (도달한 목표 셀 ID 또는 None, 거리, parent 배열)
+    """
+
+    parent = [-1] * (width * height)
+    parent[start_id] = start_id
+
+    if goal_ids is not None and start_id in goal_ids:
+        record_stats(stats, 0, 1)
+        return start_id, 0, parent
+
+    last_column = width - 1
+    last_row_start = width * (height - 1)
+
+    frontier = [start_id]
+    distance = 0
+    expanded = 0
+    max_queue = 1
+
+    while frontier:
+        distance += 1
+        next_frontier = []
+
+        for index, cell in enumerate(frontier):
+            x = cell % width
+
+            # 좌, 우, 상, 하 순서로 이웃 확인 (경계 체크 포함)
+            neighbors = []
+            if x > 0:
+                neighbors.append(cell - 1)
+            if x < last_column:
+                neighbors.append(cell + 1)
+            if cell >= width:
+                neighbors.append(cell - width)
+            if cell < last_row_start:
+                neighbors.append(cell + width)
+
+            for neighbor in neighbors:
+                if parent[neighbor] == -1 and cells[neighbor] == 0:
+                    parent[neighbor] = cell
+                    if goal_ids is not None and neighbor in goal_ids:
+                        record_stats(stats, expanded + index + 1, max_queue)
+                        return neighbor, distance, parent
+                    next_frontier.append(neighbor)
+
+        expanded += len(frontier)
+        max_queue = max(max_queue, len(next_frontier))
+        frontier = next_frontier
+
+    record_stats(stats, expanded, max_queue)
+    return None, float('inf'), parent
+
+def astar_search(cells, width, height, start_id, goal_ids, stats=None):
+    """Manhattan 거리 휴리스틱을 사용하는 A* 탐색 함수 (bfs_search와 같은 반환 형식)
+
+    4방향 단위 비용 격자에서 Manhattan 거리는 일관된(consistent) 휴리스틱이므로 최단 거리가 보장됩니다.
+    f = g + h 값이 정수이므로 heap 대신 f 값별 버킷 리스트로 우선순위 큐를 구현했고,
+    같은 버킷에서는 나중에 들어온(목표에 더 가까운) 셀을 먼저 꺼냅니다.
+    탐색 상태(parent, g, closed)는 방문한 셀만 dict/set에 저장하므로 메모리가 그리드 크기가 아닌
+    탐색 영역에 비례하며, 타일 단위로 지연 로드되는 큰 지도에도 사용할 수 있습니다.
+    반환값: (도달한 목표 셀 ID 또는 None, 거리, parent dict)
+    """
+
+    parent = {start_id: start_id}
+
+    goal_coords = [(goal % width, goal // width) for goal in goal_ids]
+    if not goal_coords:
+        record_stats(stats, 0, 0)
+        return None, float('inf'), parent
+
+    def heuristic(cell):
+        x, y = cell % width, cell // width
+        return min(abs(x - gx) + abs(y - gy) for gx, gy in goal_coords)
+
+    g_score = {start_id: 0}
+    closed = set()
+
+    last_column = width - 1
+    last_row_start = width * (height - 1)
+
+    current_f = heuristic(start_id)
+    buckets = {current_f: [start_id]}
+    queue_size = 1
+    expanded = 0
+    max_queue = 1
+
+    while buckets:
+        if current_f not in buckets:
+            current_f = min(buckets)
+        bucket = buckets[current_f]
+        cell = bucket.pop()
+        queue_size -= 1
+        if not bucket:
+            del buckets[current_f]
+
+        if cell in closed:
+            continue  # 더 짧은 거리로 이미 확장된 셀 (오래된 항목)
+        closed.add(cell)
+        expanded += 1
+
+        g = g_score[cell]
+        if cell in goal_ids:
+            record_stats(stats, expanded, max_queue)
+            return cell, g, parent
+
+        x = cell % width
+        neighbors = []
+        if x > 0:
+            neighbors.append(cell - 1)
+        if x < last_column:
+            neighbors.append(cell + 1)
+        if cell >= width:
+            neighbors.append(cell - width)
+        if cell < last_row_start:
+            neighbors.append(cell + width)
+
+        for neighbor in neighbors:
+            if neighbor in closed or cells[neighbor] != 0:
+                continue
+            if g + 1 < g_score.get(neighbor, float('inf')):
+                g_score[neighbor] = g + 1
+                parent[neighbor] = cell
+                f = g + 1 + heuristic(neighbor)
+                buckets.setdefault(f, []).append(neighbor)
+                queue_size += 1
+
+        max_queue = max(max_queue, queue_size)
+
+    record_stats(stats, expanded, max_queue)
+    return None, float('inf'), parent
+
+def bidirectional_bfs_search(cells, width, height, start_id, goal_ids, stats=None):
+    """시작점과 목표점(들) 양쪽에서 동시에 BFS를 진행하여 중간에서 만나는 탐색 함수
+
+    매 단계 frontier가 더 작은 쪽을 한 레벨씩 확장하고, 상대편이 이미 방문한 셀을 발견하면 멈춥니다.
+    목표가 여러 개이면 역방향 탐색은 모든 목표에서 동시에 시작합니다.
+    만난 뒤 역방향 parent를 뒤집어 하나의 parent 배열로 합치므로 bfs_search와 같은 형식으로 반환합니다.
+    반환값: (도달한 목표 셀 ID 또는 None, 거리, parent 배열)
+    """
+
+    size = width * height
+    forward_parent = [-1] * size
+    backward_parent = [-1] * size
+    forward_parent[start_id] = start_id
+
+    if start_id in goal_ids:
+        record_stats(stats, 0, 1)
+        return start_id, 0, forward_parent
+
+    for goal in goal_ids:
+        if cells[goal] == 0:
+            backward_parent[goal] = goal
+
+    last_column = width - 1
+    last_row_start = width * (height - 1)
+
+    forward_frontier = [start_id]
+    backward_frontier = [goal for goal in goal_ids if cells[goal] == 0]
+    expanded = 0
+    max_queue = len(forward_frontier) + len(backward_frontier)
+    meeting = None
+
+    while forward_frontier and backward_frontier and meeting is None:
+        # 더 작은 frontier 쪽을 한 레벨 확장
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, own_parent, other_parent = forward_frontier, forward_parent, backward_parent
+        else:
+            frontier, own_parent, other_parent = backward_frontier, backward_parent, forward_parent
+
+        next_frontier = []
+        for cell in frontier:
+            expanded += 1
+            x = cell % width
+
+            neighbors = []
+            if x > 0:
+                neighbors.append(cell - 1)
+            if x < last_column:
+                neighbors.append(cell + 1)
+            if cell >= width:
+                neighbors.append(cell - width)
+            if cell < last_row_start:
+                neighbors.append(cell + width)
+
+            for neighbor in neighbors:
+                if own_parent[neighbor] == -1 and cells[neighbor] == 0:
+                    own_parent[neighbor] = cell
+                    if other_parent[neighbor] != -1:
+                        meeting = neighbor
+                        break
+                    next_frontier.append(neighbor)
+            if meeting is not None:
+                break
+
+        if own_parent is forward_parent:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+        max_queue = max(max_queue, len(forward_frontier) + len(backward_frontier))
+
+    record_stats(stats, expanded, max_queue)
+
+    if meeting is None:
+        return None, float('inf'), forward_parent
+
+    # 만난 지점에서 목표까지의 역방향 경로를 forward parent로 이어 붙이기
+    distance = len(reconstruct_path(forward_parent, meeting)) - 1
+    cell = meeting
+    while backward_parent[cell] != cell:
+        next_cell = backward_parent[cell]
+        forward_parent[next_cell] = cell
+        cell = next_cell
+        distance += 1
+
+    return cell, distance, forward_parent
+
+# 단일 쌍 탐색 방식 등록 (이름 → 함수), 모두 (목표 ID, 거리, parent 배열)을 반환
+SEARCH_METHODS = {
+    'bfs': bfs_search,
+    'astar': astar_search,
+    'bidirectional': bidirectional_bfs_search,
+}
+
+def reconstruct_path(parent, goal_id):
+    """parent 배열(또는 dict)을 역추적하여 시작점 → 목표점 셀 ID 경로를 복원하는 함수"""
+
+    if goal_id is None or parent[goal_id] == -1:
+        return []
+
+    path = [goal_id]
+    cell = goal_id
+    while parent[cell] != cell:
+        cell = parent[cell]
+        path.append(cell)
+
+    path.reverse()
+    return path
+
+# 방향 코드가 기록되지 않은 셀 (미방문 또는 시작점)
+NO_MOVE = 255
+
+def bfs_tree(cells, width, height, start_id, target_ids=None):
+    """시작 셀에서 BFS 트리를 만들고 목표 셀들까지의 거리를 구하는 함수
+
+    parent 대신 셀당 1바이트의 이동 방향 코드(0:좌, 1:우, 2:상, 3:하)를 기록하여
+    여러 출발점의 트리를 동시에 보관해도 메모리가 작습니다.
+    target_ids가 주어지면 모든 목표를 찾는 즉시 탐색을 멈춥니다.
+    반환값: ({목표 셀 ID: 거리}, 방향 코드 bytearray)
+    """
+
+    moves = bytearray([NO_MOVE]) * (width * height)
+    visited = bytearray(width * height)
+    visited[start_id] = 1
+
+    remaining = set(target_ids) if target_ids is not None else None
+    distances = {}
+    if remaining is not None and start_id in remaining:
+        distances[start_id] = 0
+        remaining.discard(start_id)
+
+    last_column = width - 1
+    last_row_start = width * (height - 1)
+
+    frontier = [start_id]
+    distance = 0
+
+    while frontier and (remaining is None or remaining):
+        distance += 1
+        next_frontier = []
+
+        for cell in frontier:
+            x = cell % width
+
+            neighbors = []
+            if x > 0:
+                neighbors.append((cell - 1, 0))
+            if x < last_column:
+                neighbors.append((cell + 1, 1))
+            if cell >= width:
+                neighbors.append((cell - width, 2))
+            if cell < last_row_start:
+                neighbors.append((cell + width, 3))
+
+            for neighbor, move in neighbors:
+                if not visited[neighbor] and cells[neighbor] == 0:
+                    visited[neighbor] = 1
+                    moves[neighbor] = move
+                    if remaining is not None and neighbor in remaining:
+                        distances[neighbor] = distance
+                        remaining.discard(neighbor)
+                    next_frontier.append(neighbor)
+
+        frontier = next_frontier
+
+    return distances, moves
+
+def reconstruct_path_from_moves(moves, width, start_id, goal_id):
+    """방향 코드 배열을 역추적하여 시작점 → 목표점 셀 ID 경로를 복원하는 함수"""
+
+    if goal_id != start_id and moves[goal_id] == NO_MOVE:
+        return []
+
+    step_back = (1, -1, width, -width)  # 각 방향 코드의 반대 방향 이동량
+
+    path = [goal_id]
+    cell = goal_id
+    while cell != start_id:
+        cell += step_back[moves[cell]]
+        path.append(cell)
+
+    path.reverse()
+    return path
@@ -0,0 +1,355 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 건설 현장 변경 시 경로 증분 재계획 - 탐색 상태를 유지하고 영향받는 부분만 갱신
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 출발점별 동적 거리장 + 집→커피 / 모든 구조물 경로 증분 갱신 | zookeeper
+# 2026-10-18 | 버그 수정 | 지도 밖 좌표 변경은 ValueError로 거부, --check로 전체 재계산 거리장과 무작위 비교 검증 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import random
+import sys
+import time
+
+import numpy as np
+
+from grid_map import GridMap, distance_field
+from tour_planner import solve_tour
+
+UNREACHABLE = -1
+
+class DynamicDistanceField:
+    """한 출발점에서의 거리장을 유지하며, 셀이 열리거나 막힐 때 영향받는 셀만 다시 계산하는 클래스
+
+    LPA* / D* Lite와 같이 이전 탐색 결과를 재사용합니다. 단위 비용 4방향 격자이므로
+    셀이 열리면 거리가 줄어드는 영역만 BFS로 전파하고, 셀이 막히면 그 셀을 거쳐야만 하던
+    셀들(영향 영역)만 찾아 경계에서부터 다시 채웁니다.
+    cells는 여러 거리장이 공유하는 bytearray이며, 호출 전에 이미 갱신되어 있어야 합니다.
+    """
+
+    def __init__(self, cells, width, height, source_id, distances):
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.source_id = source_id
+        self.distances = distances
+        self.touched = 0  # 마지막 갱신에서 다시 계산한 셀 수
+
+    def neighbors(self, cell):
+        """좌, 우, 상, 하 순서로 격자 안의 이웃 셀 ID를 반환하는 메서드"""
+
+        x = cell % self.width
+        result = []
+        if x > 0:
+            result.append(cell - 1)
+        if x < self.width - 1:
+            result.append(cell + 1)
+        if cell >= self.width:
+            result.append(cell - self.width)
+        if cell < self.width * (self.height - 1):
+            result.append(cell + self.width)
+        return result
+
+    def open_cell(self, cell):
+        """막혀 있던 셀이 열렸을 때 거리가 줄어드는 셀들만 갱신하는 메서드"""
+
+        distances = self.distances
+        self.touched = 0
+
+        if cell == self.source_id:
+            return
+
+        reachable = [distances[n] for n in self.neighbors(cell) if distances[n] != UNREACHABLE]
+        if not reachable:
+            return  # 아직 도달할 수 없는 영역에 열린 셀
+
+        distances[cell] = min(reachable) + 1
+        self.touched = 1
+
+        # 열린 셀에서 시작하여 거리가 줄어드는 셀로만 레벨 단위 전파
+        frontier = [cell]
+        while frontier:
+            next_frontier = []
+            for current in frontier:
+                next_distance = distances[current] + 1
+                for neighbor in self.neighbors(current):
+                    if self.cells[neighbor] != 0:
+                        continue
+                    if distances[neighbor] == UNREACHABLE or distances[neighbor] > next_distance:
+                        distances[neighbor] = next_distance
+                        next_frontier.append(neighbor)
+            self.touched += len(next_frontier)
+            frontier = next_frontier
+
+    def close_cell(self, cell):
+        """셀이 막혔을 때 그 셀을 거쳐야만 하던 셀들의 거리만 다시 계산하는 메서드"""
+
+        distances = self.distances
+        self.touched = 0
+
+        # 출발점은 막혀도 기존 BFS와 같이 출발 가능으로 취급
+        if cell == self.source_id or distances[cell] == UNREACHABLE:
+            return
+
+        level = distances[cell] + 1
+        distances[cell] = UNREACHABLE
+
+        # 1. 영향 영역 찾기: 더 이상 거리 level-1인 (영향받지 않은) 이웃이 없는 셀
+        affected = set()
+        frontier = [n for n in self.neighbors(cell) if distances[n] == level]
+        while frontier:
+            next_frontier = []
+            for current in frontier:
+                if current in affected:
+                    continue
+                supported = any(
+                    distances[n] == level - 1 and n not in affected
+                    for n in self.neighbors(current)
+                )
+                if supported:
+                    continue
+                affected.add(current)
+                next_frontier.extend(n for n in self.neighbors(current) if distances[n] == level + 1)
+            frontier = next_frontier
+            level += 1
+
+        self.touched = len(affected)
+        if not affected:
+            return
+
+        # 2. 영향 영역을 비우고, 영향받지 않은 경계 이웃에서부터 거리별 버킷 순서로 다시 채우기
+        for current in affected:
+            distances[current] = UNREACHABLE
+
+        buckets = {}
+        for current in affected:
+            boundary = [distances[n] for n in self.neighbors(current) if distances[n] != UNREACHABLE]
+            if boundary:
+                buckets.setdefault(min(boundary) + 1, []).append(current)
+
+        while buckets:
+            distance = min(buckets)
+            for current in buckets.pop(distance):
+                if distances[current] != UNREACHABLE:
+                    continue  # 이미 더 짧은 거리로 확정됨
+                distances[current] = distance
+                for neighbor in self.neighbors(current):
+                    if neighbor in affected and distances[neighbor] == UNREACHABLE:
+                        buckets.setdefault(distance + 1, []).append(neighbor)
+
+    def path_to(self, goal_id):
+        """거리장을 따라 목표에서 출발점까지 거꾸로 내려가며 셀 ID 경로를 복원하는 메서드"""
+
+        distances = self.distances
+        if distances[goal_id] == UNREACHABLE:
+            return []
+
+        path = [goal_id]
+        cell = goal_id
+        while cell != self.source_id:
+            cell = next(n for n in self.neighbors(cell) if distances[n] == distances[cell] - 1)
+            path.append(cell)
+
+        path.reverse()
+        return path
+
+class IncrementalRoutePlanner:
+    """집 → 가장 가까운 커피숍 경로와 모든 구조물 방문 경로를 유지하는 증분 계획기
+
+    시작점과 각 구조물의 거리장을 한 번 계산해 두고, update()로 건설 현장 좌표가
+    바뀌면 각 거리장의 영향 영역만 고친 뒤 거리 행렬로 경로를 다시 구성합니다.
+    """
+
+    def __init__(self, grid, start_point, destinations, structure_points):
+        self.grid = grid  # 범위 검사(contains)용, 점유 상태는 아래 cells 복사본을 사용
+        self.width = grid.width
+        self.height = grid.height
+        self.min_x = grid.min_x
+        self.min_y = grid.min_y
+        self.cells = bytearray(grid.cells)  # 계획기 전용 복사본 (update로 변경)
+
+        self.start_point = start_point
+        self.destinations = list(destinations)
+        self.structure_points = list(structure_points)
+
+        # 거리장이 필요한 출발점: 시작점 + 모든 구조물 (중복 좌표는 하나만 유지)
+        self.fields = {}
+        for point in [start_point] + self.structure_points:
+            cell_id = self.cell_id(point)
+            if cell_id not in self.fields:
+                distances = distance_field(grid, point[0], point[1]).reshape(-1).tolist()
+                self.fields[cell_id] = DynamicDistanceField(self.cells, self.width, self.height, cell_id, distances)
+
+    def cell_id(self, point):
+        """실제 좌표를 셀 ID로 변환하는 메서드"""
+        return int((point[1] - self.min_y) * self.width + (point[0] - self.min_x))
+
+    def coord(self, cell_id):
+        """셀 ID를 실제 좌표로 변환하는 메서드"""
+        return cell_id % self.width + self.min_x, cell_id // self.width + self.min_y
+
+    def update(self, toggled_points):
+        """건설 현장 여부가 바뀐 좌표 목록을 반영하고 갱신 통계를 반환하는 메서드
+
+        반환값: {'toggled': 바뀐 셀 수, 'touched': 다시 계산한 셀 수 합계, 'elapsed': 소요 시간(초)}
+        지도 밖의 좌표가 하나라도 있으면 아무것도 바꾸지 않고 ValueError를 발생시킵니다.
+        """
+
+        for point in toggled_points:
+            if not self.grid.contains(*point):
+                raise ValueError(f'지도 범위를 벗어난 좌표입니다: {point}')
+
+        started = time.perf_counter()
+        touched = 0
+
+        for point in toggled_points:
+            cell = self.cell_id(point)
+            opening = self.cells[cell] != 0
+            self.cells[cell] = 0 if opening else 1
+
+            for field in self.fields.values():
+                if opening:
+                    field.open_cell(cell)
+                else:
+                    field.close_cell(cell)
+                touched += field.touched
+
+        return {
+            'toggled': len(toggled_points),
+            'touched': touched,
+            'elapsed': time.perf_counter() - started,
+        }
+
+    def home_to_cafe(self):
+        """현재 거리장으로 집 → 가장 가까운 커피숍 경로를 구하는 메서드
+
+        반환값: (실제 좌표 경로, 도착 커피숍 좌표, 거리), 도달할 수 없으면 ValueError
+        """
+
+        field = self.fields[self.cell_id(self.start_point)]
+        reachable = [
+            (field.distances[self.cell_id(dest)], index)
+            for index, dest in enumerate(self.destinations)
+            if field.distances[self.cell_id(dest)] != UNREACHABLE
+        ]
+        if not reachable:
+            raise ValueError('경로를 찾을 수 없습니다!')
+
+        distance, index = min(reachable)
+        target = self.destinations[index]
+        path = [self.coord(cell) for cell in field.path_to(self.cell_id(target))]
+        return path, target, distance
+
+    def all_structures_tour(self, method='auto', time_budget=1.0):
+        """현재 거리장으로 거리 행렬을 만들고 모든 구조물 방문 경로를 구하는 메서드
+
+        반환값: (실제 좌표 경로, 총 거리)
+        """
+
+        if not self.structure_points:
+            return [], 0
+
+        point_ids = [self.cell_id(point) for point in [self.start_point] + self.structure_points]
+        matrix = []
+        for source_id in point_ids:
+            distances = self.fields[source_id].distances
+            matrix.append([
+                distances[target_id] if distances[target_id] != UNREACHABLE else float('inf')
+                for target_id in point_ids
+            ])
+
+        result = solve_tour(matrix, 0, method, time_budget)
+        order = result['order']
+
+        cell_path = [point_ids[order[0]]]
+        for source, target in zip(order, order[1:]):
+            cell_path.extend(self.fields[point_ids[source]].path_to(point_ids[target])[1:])
+
+        return [self.coord(cell) for cell in cell_path], result['distance']
+
+def run_consistency_check(trials=200, seed=0):
+    """무작위 그리드에서 셀을 열고 막을 때마다 모든 동적 거리장이 전체 재계산(distance_field)과 같은지 검증하는 함수"""
+
+    print(f'=== 증분 거리장 결과 일치 검증 ({trials}회, 기준: grid_map.distance_field) ===')
+
+    rng = random.Random(seed)
+    updates = 0
+    for trial in range(trials):
+        width, height = rng.randint(1, 25), rng.randint(1, 25)
+        min_x, min_y = rng.randint(-3, 3), rng.randint(-3, 3)
+        obstacle_ratio = rng.uniform(0.1, 0.5)
+        occupancy = np.array([[rng.random() < obstacle_ratio for _ in range(width)] for _ in range(height)],
+                             dtype=np.uint8)
+        grid = GridMap(occupancy, min_x, min_y)
+
+        def random_point():
+            return rng.randint(min_x, min_x + width - 1), rng.randint(min_y, min_y + height - 1)
+
+        planner = IncrementalRoutePlanner(grid, random_point(), [random_point()],
+                                          [random_point() for _ in range(rng.randint(0, 3))])
+
+        for _ in range(rng.randint(1, 15)):
+            toggled = [random_point() for _ in range(rng.randint(1, 4))]
+            planner.update(toggled)
+            updates += 1
+
+            current = GridMap(np.frombuffer(bytes(planner.cells), dtype=np.uint8).reshape(height, width), min_x, min_y)
+            for source_id, field in planner.fields.items():
+                expected = distance_field(current, *planner.coord(source_id)).reshape(-1).tolist()
+                assert field.distances == expected, \
+                    f'거리장 불일치 (시도 {trial}, 출발점 {planner.coord(source_id)}, 변경 {toggled})'
+
+            try:
+                path, _, distance = planner.home_to_cafe()
+                assert len(path) == distance + 1, f'경로 길이 오류 (시도 {trial})'
+            except ValueError:
+                pass  # 도달할 수 없는 경우
+
+        # 지도 밖 좌표는 거부되고 점유 상태는 바뀌지 않아야 함
+        before = bytes(planner.cells)
+        try:
+            planner.update([random_point(), (min_x + width, min_y)])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'지도 밖 좌표 변경이 거부되지 않음 (시도 {trial})')
+        assert bytes(planner.cells) == before, f'거부된 변경이 점유 상태를 바꿈 (시도 {trial})'
+
+    print(f'✅ 갱신 {updates}회 모두 전체 재계산과 일치')
+
+def main():
+    """명령행 인자로 받은 좌표(x,y)들의 건설 현장 여부를 바꾸고 경로를 증분 재계획하는 예시"""
+
+    # python incremental_planner.py --check [시도 횟수] : 전체 재계산과의 결과 일치 검증만 실행
+    if '--check' in sys.argv[1:]:
+        run_consistency_check(*[int(arg) for arg in sys.argv[1:] if arg != '--check'])
+        return
+
+    from map_direct_save import (
+        load_and_prepare_data, find_start_and_destinations, find_all_structures, create_grid_map
+    )
+
+    data = load_and_prepare_data()
+    start_point, destinations = find_start_and_destinations(data)
+    structure_points, _ = find_all_structures(data)
+    grid, _, _, _, _ = create_grid_map(data)
+
+    print('\n=== 증분 계획기 초기화 ===')
+    started = time.perf_counter()
+    planner = IncrementalRoutePlanner(grid, start_point, destinations, structure_points)
+    print(f'거리장 {len(planner.fields)}개 계산: {(time.perf_counter() - started) * 1000:.1f}ms')
+
+    toggled_points = [tuple(int(value) for value in arg.split(',')) for arg in sys.argv[1:]]
+    if toggled_points:
+        summary = planner.update(toggled_points)
+        print(f'건설 현장 변경 {summary["toggled"]}개 반영: 셀 {summary["touched"]}개 재계산, '
+              f'{summary["elapsed"] * 1000:.2f}ms')
+
+    path, target, distance = planner.home_to_cafe()
+    print(f'집 → 커피숍: {target}, 거리 {distance}, {len(path)}개 지점')
+
+    tour_path, tour_distance = planner.all_structures_tour()
+    print(f'모든 구조물 방문: 거리 {tour_distance}, {len(tour_path)}개 지점')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 병합된 지도 데이터의 바이너리 컬럼 캐시 - 원본 CSV 변경 감지 후 재사용
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 컬럼별 .npy 저장 + memmap 로드, 원본 크기/수정시각/해시로 무효화 | zookeeper
+# 2026-10-18 | 버그 수정 | 캐시 형식/생성 함수 버전을 meta.json에 기록하고 다르면 캐시를 다시 만듦 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = '.map_cache'
+META_FILE = 'meta.json'
+CACHE_VERSION = 1  # 저장 형식(컬럼 파일 구성, 메타 정보)을 바꾸면 올려서 기존 캐시를 모두 무효화
+
+def file_hash(path):
+    """파일 내용의 SHA-1 해시를 청크 단위로 계산하는 함수"""
+
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def file_signature(path):
+    """파일의 크기와 수정 시각(ns)을 반환하는 함수"""
+
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def sources_match(meta, source_paths):
+    """캐시에 기록된 원본 파일 정보와 현재 파일이 같은지 확인하는 함수
+
+    크기와 수정 시각이 같으면 바로 같다고 보고, 수정 시각만 다르면 해시를 비교합니다.
+    (파일을 다시 저장했지만 내용이 같은 경우에도 캐시를 재사용)
+    """
+
+    recorded = meta.get('sources', {})
+    if sorted(recorded) != sorted(source_paths):
+        return False
+
+    for path in source_paths:
+        signature = file_signature(path)
+        if signature['size'] != recorded[path]['size']:
+            return False
+        if signature['mtime_ns'] != recorded[path]['mtime_ns'] and file_hash(path) != recorded[path]['sha1']:
+            return False
+    return True
+
+def cache_version(version=None):
+    """캐시 형식 버전과 생성 함수 버전을 합친 문자열 (meta.json에 기록하여 비교)"""
+    return f'{CACHE_VERSION}/{version}'
+
+def save_frame(frame, cache_path, source_paths, version=None):
+    """DataFrame을 컬럼별 .npy 파일과 메타 정보로 저장하는 함수
+
+    문자열(object) 컬럼은 정수 코드 + 값 목록으로 바꾸어 저장합니다.
+    """
+
+    os.makedirs(cache_path, exist_ok=True)
+    columns = []
+    for column in frame.columns:
+        values = frame[column]
+        entry = {'name': column, 'dtype': str(values.dtype)}
+        if isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(values.dtype):
+            codes, categories = pd.factorize(values)  # 결측치는 코드 -1
+            np.save(os.path.join(cache_path, f'{len(columns)}.npy'), codes.astype(np.int32))
+            entry['categories'] = categories.tolist()
+        else:
+            np.save(os.path.join(cache_path, f'{len(columns)}.npy'), values.to_numpy())
+        columns.append(entry)
+
+    meta = {
+        'version': cache_version(version),
+        'columns': columns,
+        'sources': {path: {**file_signature(path), 'sha1': file_hash(path)} for path in source_paths},
+    }
+    with open(os.path.join(cache_path, META_FILE), 'w') as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+def load_frame(cache_path, meta):
+    """컬럼별 .npy 파일을 memmap으로 열어 DataFrame을 복원하는 함수"""
+
+    data = {}
+    for index, entry in enumerate(meta['columns']):
+        values = np.load(os.path.join(cache_path, f'{index}.npy'), mmap_mode='c')
+        if 'categories' in entry:
+            if entry['dtype'] == 'category':
+                values = pd.Categorical.from_codes(values, entry['categories'])
+            else:
+                # 코드 -1(결측치)은 마지막에 덧붙인 None으로 복원
+                categories = np.array(entry['categories'] + [None], dtype=object)
+                values = categories.take(values)
+        data[entry['name']] = values
+    return pd.DataFrame(data)
+
+def load_cached_frame(name, source_paths, build, cache_dir=CACHE_DIR, version=None):
+    """원본 CSV가 바뀌지 않았으면 캐시에서, 바뀌었으면 build()로 만든 뒤 캐시에 저장하여 반환하는 함수
+
+    name은 캐시 항목 이름(스크립트별로 다르게 지정), build는 인자 없이 DataFrame을 반환하는 함수입니다.
+    version은 build 결과(컬럼, dtype)의 버전으로, 기록된 값과 다르면 원본이 같아도 캐시를 다시 만듭니다.
+    """
+
+    cache_path = os.path.join(cache_dir, name)
+    meta_path = os.path.join(cache_path, META_FILE)
+
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta.get('version') == cache_version(version) and sources_match(meta, source_paths):
+            # 내용은 같고 수정 시각만 바뀐 파일은 다음 실행에서 해시를 다시 계산하지 않도록 갱신
+            refreshed = {path: {**meta['sources'][path], **file_signature(path)} for path in source_paths}
+            if refreshed != meta['sources']:
+                meta['sources'] = refreshed
+                with open(meta_path, 'w') as f:
+                    json.dump(meta, f, ensure_ascii=False)
+
+            print(f'캐시 사용: {cache_path} (원본 CSV 변경 없음)')
+            return load_frame(cache_path, meta)
+
+    frame = build()
+    save_frame(frame, cache_path, source_paths, version)
+    print(f'캐시 저장: {cache_path}')
+    return frame
@@ -0,0 +1,153 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 병합 지도 데이터 공용 로더 - 한 번만 읽고 압축된 dtype으로 모든 스크립트가 공유
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 스크립트별 로드/병합 코드 통합, int16/int32 좌표 + 범주형 구조물 이름 + bool 건설 현장 | zookeeper
+# 2026-10-18 | 기능 추가 | CSV 로드/병합 단계 프로파일링 구간 추가 | zookeeper
+# 2026-10-18 | 버그 수정 | 병합 데이터 형식 버전(DATA_VERSION)을 캐시에 기록하여 형식이 바뀌면 캐시를 다시 만듦 | zookeeper
+# 2026-10-18 | 수정 | 압축 후에도 병합 결과의 컬럼 순서 유지, 건설 현장은 bool 대신 int8(0/1)로 저장 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from map_cache import load_cached_frame
+from stage_profiler import stage
+
+# 병합 데이터의 원본 CSV 파일 (하나라도 바뀌면 캐시를 다시 만듦)
+SOURCE_FILES = ['area_category.csv', 'area_map.csv', 'area_struct.csv']
+
+# prepare_data / compact_frame 결과(컬럼 순서, dtype)를 바꾸면 올려서 기존 캐시를 무효화
+DATA_VERSION = 2
+
+def read_sources():
+    """CSV 파일 3개를 읽어 컬럼 이름의 공백을 정리하는 함수"""
+
+    area_category = pd.read_csv('area_category.csv', skipinitialspace=True)
+    area_map = pd.read_csv('area_map.csv')
+    area_struct = pd.read_csv('area_struct.csv')
+
+    for df in (area_category, area_map, area_struct):
+        df.columns = df.columns.str.strip()
+    return area_category, area_map, area_struct
+
+def compact_int(values):
+    """값 범위에 맞추어 정수 컬럼을 int16 또는 int32로 줄이는 함수
+
+    좌표 연산(x - min_x 등)에서 넘치지 않도록 int8까지는 줄이지 않습니다.
+    """
+
+    info = np.iinfo(np.int16)
+    if len(values) == 0 or (values.min() >= info.min and values.max() <= info.max):
+        return values.astype(np.int16)
+    return values.astype(np.int32)
+
+def compact_frame(merged_data):
+    """병합된 DataFrame의 dtype을 압축하는 함수
+
+    - x, y, area, category: int16/int32 (기본 int64 대비 1/4 ~ 1/2)
+    - struct_name: 범주형 (행마다 Python 문자열 대신 정수 코드 + 값 목록)
+    - ConstructionSite: int8 (bool과 같은 1바이트, 출력은 기존과 같은 0/1)
+    컬럼 순서는 병합 결과(x, y, ConstructionSite, category, area, struct_name)를 그대로 유지합니다.
+    """
+
+    compact = {}
+    for column in merged_data.columns:
+        if column == 'struct_name':
+            compact[column] = merged_data[column].astype('category')
+        elif column == 'ConstructionSite':
+            compact[column] = merged_data[column].astype(np.int8)
+        else:
+            compact[column] = compact_int(merged_data[column])
+    return pd.DataFrame(compact)
+
+def prepare_data():
+    """CSV를 읽어 결측치 처리, 구조물 이름 변환, 병합, dtype 압축까지 수행하는 함수"""
+
+    with stage('csv_load') as counters:
+        area_category, area_map, area_struct = read_sources()
+        counters['rows'] = len(area_category) + len(area_map) + len(area_struct)
+
+    # 결측치 확인 및 처리
+    print('=== 결측치 확인 및 처리 ===')
+
+    files_data = [
+        ('area_category', area_category),
+        ('area_map', area_map),
+        ('area_struct', area_struct)
+    ]
+
+    for name, df in files_data:
+        missing_count = df.isnull().sum().sum()
+        print(f'{name}: {len(df)}개 행, 결측치 {missing_count}개')
+
+        if missing_count > 0:
+            print(f'  컬럼별 결측치:')
+            for col, count in df.isnull().sum().items():
+                if count > 0:
+                    print(f'    {col}: {count}개')
+
+            # 결측치 처리 (필요시)
+            if name == 'area_map':
+                # 좌표나 건설현장 정보에 결측치가 있으면 제거
+                df.dropna(inplace=True)
+                print(f'  → {name} 결측치 제거 후: {len(df)}개 행')
+            elif name == 'area_struct':
+                # 좌표에 결측치가 있으면 제거, category는 0으로 대체
+                df.dropna(subset=['x', 'y'], inplace=True)
+                df['category'] = df['category'].fillna(0)
+                print(f'  → {name} 결측치 처리 후: {len(df)}개 행')
+
+    # 구조물 ID를 이름으로 변환
+    print('=== 구조물 ID → 이름 변환 ===')
+    category_mapping = dict(zip(area_category['category'], area_category['struct']))
+    area_struct['struct_name'] = area_struct['category'].map(category_mapping)
+
+    # 매핑되지 않은 값들을 'Empty'로 처리 (결측치 처리)
+    unmapped_count = area_struct['struct_name'].isnull().sum()
+    print(f'매핑되지 않은 구조물: {unmapped_count}개 → "Empty"로 처리')
+    area_struct['struct_name'] = area_struct['struct_name'].fillna('Empty')
+
+    # 데이터 병합
+    print('=== 데이터 병합 ===')
+    print(f'병합 전 - area_map: {len(area_map)}개, area_struct: {len(area_struct)}개')
+
+    with stage('merge') as counters:
+        merged_data = pd.merge(area_map, area_struct, on=['x', 'y'], how='inner')
+        counters['rows'] = len(merged_data)
+
+    print(f'병합 후 - merged_data: {len(merged_data)}개')
+
+    # 병합 후 결측치 최종 확인
+    final_missing = merged_data.isnull().sum().sum()
+    if final_missing > 0:
+        print(f'⚠️ 병합 후 결측치 발견: {final_missing}개')
+        for col, count in merged_data.isnull().sum().items():
+            if count > 0:
+                print(f'  {col}: {count}개')
+
+        # 최종 결측치 제거
+        merged_data.dropna(inplace=True)
+        print(f'최종 결측치 제거 후: {len(merged_data)}개')
+    else:
+        print('✅ 병합 후 결측치 없음')
+
+    print(f'✅ 전체 데이터 포인트: {len(merged_data)}')
+
+    return compact_frame(merged_data)
+
+@lru_cache(maxsize=None)
+def load_map_data(use_cache=True):
+    """병합된 지도 데이터를 반환하는 공용 로더 (같은 프로세스에서는 두 번째 호출부터 즉시 반환)
+
+    use_cache가 True이면 원본 CSV가 바뀌지 않은 동안 바이너리 캐시(map_cache)를 사용합니다.
+    반환된 DataFrame은 모든 호출자가 공유하므로 수정하려면 copy()한 뒤 사용해야 하며,
+    실행 중에 CSV를 다시 읽으려면 load_map_data.cache_clear()를 호출합니다.
+    """
+
+    if use_cache:
+        return load_cached_frame('merged_data', SOURCE_FILES, prepare_data, version=DATA_VERSION)
+    return prepare_data()
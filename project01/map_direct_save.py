@@ -6,111 +6,66 @@
 # 2025-07-21 | 최초 구현 | BFS 최단 경로 알고리즘 및 지도 시각화 구현 | zookeeper
 # 2025-07-21 | 수정 | 8방향 이동을 4방향 이동으로 변경 (대각선 이동 제거) | zookeeper
 # 2025-07-23 | 보너스 구현 | 모든 구조물을 방문하는 최적화된 경로 계산 추가 | zookeeper
+# 2026-10-18 | 성능 개선 | BFS를 grid_search 엔진(parent 배열 + O(1) FIFO)으로 교체 | zookeeper
+# 2026-10-18 | 성능 개선 | 모든 구조물 방문 경로를 사전 계산된 거리 행렬 기반으로 변경 | zookeeper
+# 2026-10-18 | 기능 개선 | Greedy 대신 투어 해법(Held-Karp / 지역 탐색) 선택 및 최적성 격차 출력 | zookeeper
+# 2026-10-18 | 기능 추가 | 단일 쌍 탐색에 A* 모드 선택 및 확장 노드 수 통계 추가 | zookeeper
+# 2026-10-18 | 성능 개선 | 그리드를 중첩 리스트 대신 NumPy 기반 GridMap으로 생성 (iterrows 제거) | zookeeper
+# 2026-10-18 | 성능 개선 | 병합 데이터를 바이너리 컬럼 캐시로 재사용 (원본 CSV 변경 시에만 재생성) | zookeeper
+# 2026-10-18 | 리팩토링 | 로드/병합 코드를 공용 로더(map_data)로 이동, 좌표는 Python int로 변환 | zookeeper
+# 2026-10-18 | 성능 개선 | 시작점/도착점 검색을 마스크 스캔 대신 구조물 인덱스(map_index) 조회로 변경 | zookeeper
+# 2026-10-18 | 기능 추가 | --profile / MAP_PROFILE로 단계별 시간, 최대 메모리, 탐색 카운터를 JSON으로 저장 | zookeeper
+# 2026-10-18 | 성능 개선 | matplotlib 지연 import, --headless / MAP_HEADLESS로 시각화 없이 경로 계산만 수행 | zookeeper
+# 2026-10-18 | 버그 수정 | 지도 밖의 시작점/도착점 범위 검사 (두 점 거리는 (inf, []) 반환) | zookeeper
+# 2026-10-18 | 성능 개선 | 경로를 바이너리 경로 파일(route_format)로 저장 후 CSV로 변환, DataFrame 기반 save_path_to_csv 제거 | zookeeper
+# 2026-10-18 | 리팩토링 | bfs_shortest_path의 사용되지 않는 height/width 계산 제거 및 docstring 정정 | zookeeper
 # ----------------------------------------------------------------------------------------------------
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import math
+import os
+import sys
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
-plt.rcParams['axes.unicode_minus'] = False
+from grid_search import SEARCH_METHODS, flatten_grid, in_grid, to_cell_id, reconstruct_path
+from grid_map import build_grid_map
+from map_data import load_map_data
+from map_index import index_for
+from map_raster import draw_base_map, draw_letters
+from route_format import RouteWriter, route_to_csv
+from plot_setup import load_pyplot, finish_figure, is_headless
+from stage_profiler import stage, start_profiling, finish_profiling, profile_path
+from tour_planner import build_distance_matrix, solve_tour, expand_tour
 
-def load_and_prepare_data():
-    """데이터를 로드하고 경로 탐색을 위해 준비하는 함수"""
+# 모든 구조물 방문 경로에 표시할 방문 순서 번호의 최대 개수 (경로가 길면 간격을 넓힘)
+MAX_STEP_LABELS = 100
+
+def load_and_prepare_data(use_cache=True):
+    """데이터를 로드하고 경로 탐색을 위해 준비하는 함수 (공용 로더 map_data 사용)"""
     
     print('=== 데이터 로딩 및 준비 ===')
     
-    # CSV 파일들 로드
-    area_category = pd.read_csv('area_category.csv', skipinitialspace=True)
-    area_map = pd.read_csv('area_map.csv')
-    area_struct = pd.read_csv('area_struct.csv')
-    
-    # 결측치 확인 및 처리
-    print('=== 결측치 확인 및 처리 ===')
-    
-    files_data = [
-        ('area_category', area_category),
-        ('area_map', area_map), 
-        ('area_struct', area_struct)
-    ]
-    
-    for name, df in files_data:
-        missing_count = df.isnull().sum().sum()
-        print(f'{name}: {len(df)}개 행, 결측치 {missing_count}개')
-        
-        if missing_count > 0:
-            print(f'  컬럼별 결측치:')
-            for col, count in df.isnull().sum().items():
-                if count > 0:
-                    print(f'    {col}: {count}개')
-            
-            # 결측치 처리 (필요시)
-            if name == 'area_map':
-                # 좌표나 건설현장 정보에 결측치가 있으면 제거
-                df.dropna(inplace=True)
-                print(f'  → {name} 결측치 제거 후: {len(df)}개 행')
-            elif name == 'area_struct':
-                # 좌표에 결측치가 있으면 제거, category는 0으로 대체
-                df.dropna(subset=['x', 'y'], inplace=True)
-                df['category'].fillna(0, inplace=True)
-                print(f'  → {name} 결측치 처리 후: {len(df)}개 행')
-    
-    # 구조물 ID를 이름으로 변환
-    print('=== 구조물 ID → 이름 변환 ===')
-    category_mapping = dict(zip(area_category['category'], area_category['struct']))
-    area_struct['struct_name'] = area_struct['category'].map(category_mapping)
-    
-    # 매핑되지 않은 값들을 'Empty'로 처리 (결측치 처리)
-    unmapped_count = area_struct['struct_name'].isnull().sum()
-    print(f'매핑되지 않은 구조물: {unmapped_count}개 → "Empty"로 처리')
-    area_struct['struct_name'] = area_struct['struct_name'].fillna('Empty')
-    
-    # 데이터 병합
-    print('=== 데이터 병합 ===')
-    print(f'병합 전 - area_map: {len(area_map)}개, area_struct: {len(area_struct)}개')
-    
-    merged_data = pd.merge(area_map, area_struct, on=['x', 'y'], how='inner')
-    
-    print(f'병합 후 - merged_data: {len(merged_data)}개')
-    
-    # 병합 후 결측치 최종 확인
-    final_missing = merged_data.isnull().sum().sum()
-    if final_missing > 0:
-        print(f'⚠️ 병합 후 결측치 발견: {final_missing}개')
-        for col, count in merged_data.isnull().sum().items():
-            if count > 0:
-                print(f'  {col}: {count}개')
-        
-        # 최종 결측치 제거
-        merged_data.dropna(inplace=True)
-        print(f'최종 결측치 제거 후: {len(merged_data)}개')
-    else:
-        print('✅ 병합 후 결측치 없음')
-    
-    print(f'✅ 전체 데이터 포인트: {len(merged_data)}')
-    
-    return merged_data
+    return load_map_data(use_cache)
 
 def find_start_and_destinations(data):
     """시작점(내 집)과 도착점들(반달곰 커피)을 찾는 함수"""
     
     print('=== 시작점과 도착점 찾기 ===')
     
+    # 구조물 종류별 좌표 인덱스 (데이터당 한 번만 생성)
+    index = index_for(data)
+    
     # 내 집 위치 찾기
-    my_home = data[data['struct_name'] == 'MyHome']
+    my_home = index.points('MyHome')
     if len(my_home) == 0:
         raise ValueError('내 집을 찾을 수 없습니다!')
     
-    start_point = (my_home.iloc[0]['x'], my_home.iloc[0]['y'])
+    start_point = my_home[0]
     print(f'시작점 (내 집): {start_point}')
     
     # 반달곰 커피 위치들 찾기
-    coffee_shops = data[data['struct_name'] == 'BandalgomCoffee']
-    if len(coffee_shops) == 0:
+    destinations = index.points('BandalgomCoffee')
+    if len(destinations) == 0:
         raise ValueError('반달곰 커피를 찾을 수 없습니다!')
     
-    destinations = [(row['x'], row['y']) for _, row in coffee_shops.iterrows()]
     print(f'도착점들 (반달곰 커피): {destinations}')
     
     return start_point, destinations
@@ -127,7 +82,7 @@ def find_all_structures(data):
     structure_types = []
     
     for _, struct in all_structures.iterrows():
-        point = (struct['x'], struct['y'])
+        point = (int(struct['x']), int(struct['y']))
         struct_type = struct['struct_name']
         structure_points.append(point)
         structure_types.append(struct_type)
@@ -138,131 +93,86 @@ def find_all_structures(data):
     return structure_points, structure_types
 
 def create_grid_map(data):
-    """경로 탐색을 위한 그리드 맵을 생성하는 함수 (순수 Python)"""
+    """경로 탐색을 위한 그리드 맵을 생성하는 함수 (NumPy uint8 점유 그리드)"""
     
     print('=== 그리드 맵 생성 ===')
     
-    min_x, max_x = data['x'].min(), data['x'].max()
-    min_y, max_y = data['y'].min(), data['y'].max()
-    
-    # 그리드 크기
-    width = max_x - min_x + 1
-    height = max_y - min_y + 1
-    
-    # 순수 Python으로 2D 리스트 생성 (0: 이동 가능, 1: 이동 불가)
-    grid = []
-    for y in range(height):
-        row = []
-        for x in range(width):
-            row.append(0)  # 기본값: 이동 가능
-        grid.append(row)
-    
-    # 건설 현장은 이동 불가
-    construction_sites = data[data['ConstructionSite'] == 1]
-    blocked_count = 0
-    
-    for _, site in construction_sites.iterrows():
-        grid_x = site['x'] - min_x
-        grid_y = site['y'] - min_y
-        grid[grid_y][grid_x] = 1  # 이동 불가
-        blocked_count += 1
+    # 건설 현장 좌표를 한 번에 표시 (0: 이동 가능, 1: 이동 불가)
+    grid = build_grid_map(data)
     
-    print(f'그리드 크기: {width} x {height}')
-    print(f'이동 불가 구역 (건설 현장): {blocked_count}개')
-    print(f'그리드 타입: {type(grid)} (순수 Python 리스트)')
+    print(f'그리드 크기: {grid.width} x {grid.height}')
+    print(f'이동 불가 구역 (건설 현장): {grid.blocked_count}개')
+    print(f'그리드 타입: {type(grid).__name__} ({grid.occupancy.dtype}, {grid.occupancy.nbytes} bytes)')
     
-    return grid, min_x, min_y, max_x, max_y
+    return grid, grid.min_x, grid.min_y, grid.max_x, grid.max_y
 
-def bfs_distance_between_points(grid, start, end, min_x, min_y):
-    """두 점 사이의 BFS 최단 거리를 계산하는 함수"""
+def bfs_distance_between_points(grid, start, end, min_x, min_y, method='bfs', stats=None):
+    """두 점 사이의 최단 거리를 계산하는 함수 (method: 'bfs' 또는 'astar', stats에 확장 노드 수 기록)"""
     
-    height = len(grid)
-    width = len(grid[0])
+    cells, width, height = flatten_grid(grid)
     
-    # 좌표를 그리드 인덱스로 변환
+    # 좌표를 그리드 인덱스로 변환 (지도 밖의 점은 도달할 수 없음)
     start_grid = (start[0] - min_x, start[1] - min_y)
     end_grid = (end[0] - min_x, end[1] - min_y)
+    if not (in_grid(*start_grid, width, height) and in_grid(*end_grid, width, height)):
+        return float('inf'), []
+    
+    # 좌표를 셀 ID로 변환
+    start_id = to_cell_id(start_grid[0], start_grid[1], width)
+    end_id = to_cell_id(end_grid[0], end_grid[1], width)
     
-    if start_grid == end_grid:
+    if start_id == end_id:
         return 0, [start]
     
-    # BFS
-    queue = [(start_grid[0], start_grid[1], 0, [start_grid])]
-    visited = set()
-    visited.add(start_grid)
+    # BFS/A* (parent 배열 기반, 경로는 목표 도달 시 한 번만 복원)
+    search = SEARCH_METHODS[method]
+    goal_id, distance, parent = search(cells, width, height, start_id, {end_id}, stats)
     
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    if goal_id is None:
+        return float('inf'), []  # 경로를 찾을 수 없음
     
-    while queue:
-        x, y, distance, path = queue.pop(0)
-        
-        if (x, y) == end_grid:
-            # 실제 좌표로 변환
-            actual_path = [(px + min_x, py + min_y) for px, py in path]
-            return distance, actual_path
-        
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            
-            if 0 <= nx < width and 0 <= ny < height:
-                if (nx, ny) not in visited and grid[ny][nx] == 0:
-                    visited.add((nx, ny))
-                    new_path = path + [(nx, ny)]
-                    queue.append((nx, ny, distance + 1, new_path))
-    
-    return float('inf'), []  # 경로를 찾을 수 없음
+    # 실제 좌표로 변환
+    actual_path = [(cell % width + min_x, cell // width + min_y) for cell in reconstruct_path(parent, goal_id)]
+    return distance, actual_path
+
+def find_optimized_all_structures_path(grid, start_point, structure_points, min_x, min_y, method='auto', time_budget=1.0):
+    """보너스: 모든 구조물을 방문하는 최적화된 경로를 찾는 함수
 
-def find_optimized_all_structures_path(grid, start_point, structure_points, min_x, min_y):
-    """보너스: 모든 구조물을 방문하는 최적화된 경로를 찾는 함수 (Greedy 알고리즘)"""
+    거리 행렬을 한 번 만든 뒤 method로 지정한 해법(auto, held_karp, local_search, greedy)으로
+    방문 순서를 정합니다. auto는 구조물이 적으면 정확해, 많으면 time_budget초 내 지역 탐색을 사용합니다.
+    """
     
     print('\n=== 보너스: 모든 구조물 방문 최적화 경로 계산 ===')
     
     if not structure_points:
         return [], 0
     
-    # 현재 위치에서 시작
-    current_point = start_point
-    unvisited = list(structure_points)  # 복사
-    total_path = [start_point]
-    total_distance = 0
-    
     print(f'시작점: {start_point}')
-    print(f'방문할 구조물: {len(unvisited)}개')
+    print(f'방문할 구조물: {len(structure_points)}개')
     
-    # Greedy 알고리즘: 현재 위치에서 가장 가까운 구조물을 선택
-    step = 1
-    while unvisited:
-        print(f'\n--- Step {step}: 현재 위치 {current_point} ---')
-        
-        # 현재 위치에서 각 미방문 구조물까지의 거리 계산
-        min_distance = float('inf')
-        next_point = None
-        best_path = []
-        
-        for target in unvisited:
-            distance, path = bfs_distance_between_points(grid, current_point, target, min_x, min_y)
-            print(f'  {target}까지 거리: {distance}')
-            
-            if distance < min_distance:
-                min_distance = distance
-                next_point = target
-                best_path = path
-        
-        if next_point is None:
-            print('❌ 더 이상 방문할 수 있는 구조물이 없습니다!')
-            break
-        
-        # 다음 구조물로 이동
-        print(f'  → 선택: {next_point} (거리: {min_distance})')
-        
-        # 경로에 추가 (시작점 제외하고 추가)
-        total_path.extend(best_path[1:])  # 첫 번째 요소는 현재 위치이므로 제외
-        total_distance += min_distance
-        
-        # 상태 업데이트
-        current_point = next_point
-        unvisited.remove(next_point)
-        step += 1
+    # 시작점 + 구조물마다 BFS를 한 번씩만 수행하여 거리 행렬 생성
+    cells, width, height = flatten_grid(grid)
+    points = [start_point] + list(structure_points)
+    point_ids = [to_cell_id(x - min_x, y - min_y, width) for x, y in points]
+    
+    matrix, trees = build_distance_matrix(cells, width, height, point_ids)
+    print(f'거리 행렬 생성 완료: {len(points)} x {len(points)} (BFS {len(points)}회)')
+    
+    # 거리 행렬만으로 방문 순서 결정
+    result = solve_tour(matrix, 0, method, time_budget)
+    order, total_distance = result['order'], result['distance']
+    print(f'투어 해법: {result["method"]} ({result["elapsed"] * 1000:.1f}ms)')
+    print(f'하한: {result["lower_bound"]}, 최적성 격차: {result["gap"] * 100:.1f}%')
+    
+    for step, (source, target) in enumerate(zip(order, order[1:]), start=1):
+        print(f'  Step {step}: {points[source]} → {points[target]} (거리: {matrix[source][target]})')
+    
+    if result['unreachable']:
+        print(f'❌ 도달할 수 없는 구조물 {len(result["unreachable"])}개는 제외되었습니다!')
+    
+    # 선택된 구간만 BFS 트리로 복원하여 전체 경로 구성
+    cell_path = expand_tour(order, point_ids, trees, width)
+    total_path = [(cell % width + min_x, cell // width + min_y) for cell in cell_path]
     
     print(f'\n✅ 모든 구조물 방문 완료!')
     print(f'총 경로 길이: {len(total_path)}개 지점')
@@ -270,13 +180,14 @@ def find_optimized_all_structures_path(grid, start_point, structure_points, min_
     
     return total_path, total_distance
 
-def bfs_shortest_path(grid, start, destinations, min_x, min_y):
-    """BFS 알고리즘으로 최단 경로를 찾는 함수 (4방향 이동만 허용, 순수 Python)"""
-    
-    print('=== BFS 최단 경로 탐색 ===')
+def bfs_shortest_path(grid, start, destinations, min_x, min_y, method='bfs', stats=None):
+    """최단 경로를 찾는 함수 (4방향 이동만 허용, grid_search 엔진 사용)
+
+    method로 탐색 방식('bfs' 또는 Manhattan 휴리스틱 'astar')을 선택하며,
+    stats dict가 주어지면 확장한 노드 수와 큐 최대 크기를 기록합니다.
+    """
     
-    height = len(grid)
-    width = len(grid[0])
+    print(f'=== {method.upper()} 최단 경로 탐색 ===')
     
     # 좌표를 그리드 인덱스로 변환
     start_grid = (start[0] - min_x, start[1] - min_y)
@@ -285,47 +196,31 @@ def bfs_shortest_path(grid, start, destinations, min_x, min_y):
     print(f'시작 그리드 좌표: {start_grid}')
     print(f'목표 그리드 좌표들: {dest_grids}')
     
-    # BFS를 위한 큐와 방문 체크 (순수 Python 리스트로 큐 구현)
-    queue = [(start_grid[0], start_grid[1], 0, [start_grid])]  # (x, y, distance, path)
-    visited = set()
-    visited.add(start_grid)
+    # BFS/A* (parent 배열 기반, 가장 먼저 도달한 목표 지점이 최단 거리)
+    cells, width, height = flatten_grid(grid)
     
-    # 4방향 이동 (상하좌우만)
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # 상, 하, 좌, 우
+    # 지도 밖의 시작점/목표는 다른 행의 셀 ID로 바뀌지 않도록 제외
+    if not in_grid(start_grid[0], start_grid[1], width, height):
+        raise ValueError(f'시작점이 지도 밖에 있습니다: {start}')
+    start_id = to_cell_id(start_grid[0], start_grid[1], width)
+    dest_ids = {to_cell_id(x, y, width) for x, y in dest_grids if in_grid(x, y, width, height)}
+    if not dest_ids:
+        raise ValueError('경로를 찾을 수 없습니다!')
     
-    shortest_path = None
-    shortest_distance = float('inf')
-    target_dest = None
+    if stats is None:
+        stats = {}
+    search = SEARCH_METHODS[method]
+    goal_id, shortest_distance, parent = search(cells, width, height, start_id, dest_ids, stats)
+    print(f'확장한 노드 수: {stats["expanded"]}, 큐 최대 크기: {stats["max_queue"]}')
     
-    while queue:
-        x, y, distance, path = queue.pop(0)  # 순수 Python 리스트로 큐의 popleft() 구현
-        
-        # 목표 지점 중 하나에 도달했는지 확인
-        if (x, y) in dest_grids:
-            if distance < shortest_distance:
-                shortest_distance = distance
-                shortest_path = path.copy()
-                target_dest = (x + min_x, y + min_y)
-                print(f'목표 지점 도달: {target_dest}, 거리: {distance}')
-            continue
-        
-        # 4방향으로 이동
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            
-            # 그리드 경계 체크
-            if 0 <= nx < width and 0 <= ny < height:
-                # 방문하지 않았고 이동 가능한 지점인지 확인
-                if (nx, ny) not in visited and grid[ny][nx] == 0:
-                    visited.add((nx, ny))
-                    new_path = path + [(nx, ny)]
-                    queue.append((nx, ny, distance + 1, new_path))  # 순수 Python 리스트 append
-    
-    if shortest_path is None:
+    if goal_id is None:
         raise ValueError('경로를 찾을 수 없습니다!')
     
-    # 그리드 좌표를 실제 좌표로 변환
-    actual_path = [(x + min_x, y + min_y) for x, y in shortest_path]
+    target_dest = (goal_id % width + min_x, goal_id // width + min_y)
+    print(f'목표 지점 도달: {target_dest}, 거리: {shortest_distance}')
+    
+    # 셀 ID 경로를 실제 좌표로 변환
+    actual_path = [(cell % width + min_x, cell // width + min_y) for cell in reconstruct_path(parent, goal_id)]
     
     print(f'최단 경로 발견!')
     print(f'목표 지점: {target_dest}')
@@ -334,108 +229,55 @@ def bfs_shortest_path(grid, start, destinations, min_x, min_y):
     
     return actual_path, target_dest, shortest_distance
 
-def save_path_to_csv(path, filename='home_to_cafe.csv'):
-    """경로를 CSV 파일로 저장하는 함수"""
+def save_path_to_route(path, filename='home_to_cafe.route', csv_filename=None):
+    """경로를 바이너리 경로 파일(시작점 + 칸당 2비트 이동 코드)로 저장하는 함수
+
+    csv_filename이 주어지면 저장한 경로 파일을 CSV(step,x,y)로 변환하여 함께 저장합니다.
+    """
     
     print(f'=== 경로를 {filename}로 저장 ===')
     
-    path_df = pd.DataFrame(path, columns=['x', 'y'])
-    path_df['step'] = range(1, len(path) + 1)
-    path_df = path_df[['step', 'x', 'y']]  # 순서 변경
+    with RouteWriter(filename) as writer:
+        writer.write(path)
+    print(f'총 {len(path)}개 지점 → {os.path.getsize(filename)} bytes')
     
-    path_df.to_csv(filename, index=False)
+    if csv_filename:
+        route_to_csv(filename, csv_filename)
+        print_path_preview(path)
+        print(f'CSV 변환: {csv_filename} ({os.path.getsize(csv_filename)} bytes)')
+
+def print_path_preview(path, limit=10):
+    """경로의 앞부분 limit개 지점을 출력하는 함수"""
     
     print(f'경로 데이터:')
-    print(path_df.head(10))
-    if len(path_df) > 10:
-        print(f'... (총 {len(path_df)}개 행)')
-    print(f'총 {len(path)}개 지점이 {filename}에 저장되었습니다.')
+    for step, point in enumerate(path[:limit], start=1):
+        print(f'  {step:>4}: {point}')
+    if len(path) > limit:
+        print(f'... (총 {len(path)}개 행)')
 
 def visualize_map_with_path(data, path, target_dest, filename='map_final.png', all_structures_path=None):
     """지도에 경로를 시각화하는 함수"""
     
     print('=== 지도에 경로 시각화 ===')
     
-    # 맵 크기 설정
-    min_x, max_x = data['x'].min(), data['x'].max()
-    min_y, max_y = data['y'].min(), data['y'].max()
+    # matplotlib는 그림을 그릴 때만 import (경로 계산만 하는 실행은 import 비용 없음)
+    plt = load_pyplot()
+    from matplotlib import patches
     
     # 시각화 설정
     fig, ax = plt.subplots(1, 1, figsize=(16, 14))
-    ax.set_xlim(min_x - 0.5, max_x + 0.5)
-    ax.set_ylim(min_y - 0.5, max_y + 0.5)
-    ax.invert_yaxis()  # y축 뒤집기
-    
-    # 그리드 라인
-    for x in range(min_x, max_x + 1):
-        ax.axvline(x=x - 0.5, color='lightgray', linewidth=0.5, alpha=0.7)
-    ax.axvline(x=max_x + 0.5, color='lightgray', linewidth=0.5, alpha=0.7)
-    
-    for y in range(min_y, max_y + 1):
-        ax.axhline(y=y - 0.5, color='lightgray', linewidth=0.5, alpha=0.7)
-    ax.axhline(y=max_y + 0.5, color='lightgray', linewidth=0.5, alpha=0.7)
-    
-    # 건설 현장 표시
-    construction_sites = data[data['ConstructionSite'] == 1]
-    for _, site in construction_sites.iterrows():
-        rect = patches.Rectangle(
-            (site['x'] - 0.6, site['y'] - 0.6), 1.2, 1.2,
-            linewidth=1, edgecolor='gray', facecolor='lightgray', 
-            alpha=0.7, zorder=1
-        )
-        ax.add_patch(rect)
-    
-    # 구조물 표시
-    structures = data[data['struct_name'] != 'Empty']
-    
-    for _, struct in structures.iterrows():
-        x, y = struct['x'], struct['y']
-        struct_type = struct['struct_name']
-        
-        if struct_type == 'Apartment':
-            circle = patches.Circle(
-                (x, y), 0.25, linewidth=2, 
-                edgecolor='saddlebrown', facecolor='sandybrown', 
-                zorder=3
-            )
-            ax.add_patch(circle)
-            ax.text(x, y, 'A', ha='center', va='center', fontsize=8, fontweight='bold')
-            
-        elif struct_type == 'Building':
-            circle = patches.Circle(
-                (x, y), 0.25, linewidth=2, 
-                edgecolor='saddlebrown', facecolor='sandybrown', 
-                zorder=3
-            )
-            ax.add_patch(circle)
-            ax.text(x, y, 'B', ha='center', va='center', fontsize=8, fontweight='bold')
-            
-        elif struct_type == 'BandalgomCoffee':
-            # 목표 지점 강조
-            if (x, y) == target_dest:
-                rect = patches.Rectangle(
-                    (x - 0.3, y - 0.3), 0.6, 0.6,
-                    linewidth=3, edgecolor='red', facecolor='lightgreen', 
-                    zorder=5
-                )
-            else:
-                rect = patches.Rectangle(
-                    (x - 0.2, y - 0.2), 0.4, 0.4,
-                    linewidth=2, edgecolor='darkgreen', facecolor='lightgreen', 
-                    zorder=4
-                )
-            ax.add_patch(rect)
-            ax.text(x, y, 'C', ha='center', va='center', fontsize=8, fontweight='bold', color='darkgreen')
-            
-        elif struct_type == 'MyHome':
-            # 시작점 강조
-            triangle = patches.Polygon(
-                [(x, y - 0.3), (x - 0.26, y + 0.2), (x + 0.26, y + 0.2)],
-                linewidth=3, edgecolor='blue', facecolor='lightgreen', 
-                zorder=5
-            )
-            ax.add_patch(triangle)
-            ax.text(x, y, 'H', ha='center', va='center', fontsize=8, fontweight='bold', color='blue')
+    
+    # 지도 바탕: 건설 현장/구조물 셀은 래스터(imshow 한 번), 격자선/구조물 도형/글자/좌표 눈금은
+    # 읽을 수 있는 확대 수준에서만 종류별 collection으로 표시
+    readable = draw_base_map(fig, ax, data)
+    
+    # 목표 지점 강조
+    if readable:
+        ax.add_patch(patches.Rectangle(
+            (target_dest[0] - 0.3, target_dest[1] - 0.3), 0.6, 0.6,
+            linewidth=3, edgecolor='red', facecolor='lightgreen', zorder=5
+        ))
+        draw_letters(ax, [tuple(target_dest)], 'C', 'darkgreen', zorder=5.6)
     
     # 기본 경로 그리기 (빨간 선)
     if len(path) > 1:
@@ -444,30 +286,25 @@ def visualize_map_with_path(data, path, target_dest, filename='map_final.png', a
         
         ax.plot(path_x, path_y, 'r-', linewidth=3, alpha=0.8, zorder=6, label='Shortest Path to Coffee')
         
-        # 경로 지점들 표시 (작은 원)
-        for i, (x, y) in enumerate(path):
-            if i == 0:  # 시작점
-                ax.plot(x, y, 'bo', markersize=8, zorder=7)
-            elif i == len(path) - 1:  # 도착점
-                ax.plot(x, y, 'ro', markersize=8, zorder=7)
-            else:  # 중간 지점
-                ax.plot(x, y, 'r.', markersize=4, zorder=7)
+        # 경로 지점들 표시 (시작점, 중간 지점, 도착점마다 Line2D 하나)
+        ax.plot(path_x[1:-1], path_y[1:-1], 'r.', markersize=4, zorder=7)
+        ax.plot(path_x[:1], path_y[:1], 'bo', markersize=8, zorder=7)
+        ax.plot(path_x[-1:], path_y[-1:], 'ro', markersize=8, zorder=7)
     
     # 보너스: 모든 구조물 방문 경로 그리기 (파란 선)
     if all_structures_path and len(all_structures_path) > 1:
         all_path_x = [point[0] for point in all_structures_path]
         all_path_y = [point[1] for point in all_structures_path]
         
-        ax.plot(all_path_x, all_path_y, 'b-', linewidth=2, alpha=0.6, zorder=5, 
+        ax.plot(all_path_x, all_path_y, 'b', linewidth=2, alpha=0.6, zorder=5, 
                 linestyle='--', label='All Structures Path (Bonus)')
         
-        # 방문 순서 표시
-        for i, (x, y) in enumerate(all_structures_path[::5]):  # 5개마다 표시
-            ax.text(x + 0.1, y + 0.1, str(i*5+1), fontsize=6, color='blue', fontweight='bold')
-    
-    # 좌표 레이블
-    ax.set_xticks(range(min_x, max_x + 1))
-    ax.set_yticks(range(min_y, max_y + 1))
+        # 방문 순서 표시 (읽을 수 있는 확대 수준에서만, 5개마다 최대 MAX_STEP_LABELS개)
+        if readable:
+            stride = 5 * max(1, math.ceil(len(all_structures_path) / (5 * MAX_STEP_LABELS)))
+            for i in range(0, len(all_structures_path), stride):
+                x, y = all_structures_path[i]
+                ax.text(x + 0.1, y + 0.1, str(i + 1), fontsize=6, color='blue', fontweight='bold')
     
     # 제목 및 범례
     title = 'Shortest Path from My Home to Bandalcom Coffee'
@@ -512,39 +349,63 @@ Total Distance: {len(all_structures_path)-1}"""
     plt.savefig(filename, dpi=300, bbox_inches='tight')
     print(f'경로가 시각화된 지도가 \'{filename}\' 파일로 저장되었습니다.')
     
-    plt.show()
+    finish_figure(plt, fig)
 
-def main():
-    """메인 함수"""
+def main(profile_file=None, headless=False):
+    """메인 함수 (profile_file이 주어지면 단계별 시간/메모리/카운터를 JSON으로 저장,
+    headless이면 지도 그림 없이 경로 CSV만 저장하며 matplotlib를 import하지 않음)"""
+    if profile_file:
+        start_profiling()
     try:
         # 1. 데이터 로드
-        data = load_and_prepare_data()
+        with stage('load_data') as counters:
+            data = load_and_prepare_data()
+            counters['rows'] = len(data)
         
         # 2. 시작점과 도착점 찾기
-        start_point, destinations = find_start_and_destinations(data)
-        
-        # 3. 보너스: 모든 구조물 찾기
-        all_structure_points, structure_types = find_all_structures(data)
+        with stage('find_points') as counters:
+            start_point, destinations = find_start_and_destinations(data)
+            
+            # 3. 보너스: 모든 구조물 찾기
+            all_structure_points, structure_types = find_all_structures(data)
+            counters['destinations'] = len(destinations)
+            counters['structures'] = len(all_structure_points)
         
         # 4. 그리드 맵 생성
-        grid, min_x, min_y, max_x, max_y = create_grid_map(data)
+        with stage('grid_build') as counters:
+            grid, min_x, min_y, max_x, max_y = create_grid_map(data)
+            counters.update(width=grid.width, height=grid.height, blocked=grid.blocked_count)
         
         # 5. 기본: BFS로 최단 경로 탐색 (집 → 가장 가까운 커피숍)
-        shortest_path, target_dest, distance = bfs_shortest_path(grid, start_point, destinations, min_x, min_y)
+        with stage('bfs') as counters:
+            search_stats = {}
+            shortest_path, target_dest, distance = bfs_shortest_path(
+                grid, start_point, destinations, min_x, min_y, stats=search_stats)
+            counters.update(nodes_expanded=search_stats['expanded'], queue_high_water=search_stats['max_queue'],
+                            distance=distance)
         
         # 6. 보너스: 모든 구조물을 방문하는 최적화된 경로
-        all_structures_path, all_structures_distance = find_optimized_all_structures_path(
-            grid, start_point, all_structure_points, min_x, min_y)
+        with stage('tour') as counters:
+            all_structures_path, all_structures_distance = find_optimized_all_structures_path(
+                grid, start_point, all_structure_points, min_x, min_y)
+            counters.update(points=len(all_structure_points) + 1, distance=all_structures_distance)
         
-        # 7. 기본 경로를 CSV로 저장
-        save_path_to_csv(shortest_path, 'home_to_cafe.csv')
-        
-        # 8. 보너스 경로를 CSV로 저장
-        if all_structures_path:
-            save_path_to_csv(all_structures_path, 'home_to_all_structures.csv')
+        # 7. 기본 경로를 바이너리 경로 파일로 저장 (+ CSV 변환)
+        # 8. 보너스 경로를 바이너리 경로 파일로 저장 (+ CSV 변환)
+        with stage('csv_save') as counters:
+            save_path_to_route(shortest_path, 'home_to_cafe.route', 'home_to_cafe.csv')
+            counters['rows'] = len(shortest_path)
+            
+            if all_structures_path:
+                save_path_to_route(all_structures_path, 'home_to_all_structures.route', 'home_to_all_structures.csv')
+                counters['rows'] += len(all_structures_path)
         
         # 9. 지도에 두 경로 모두 시각화
-        visualize_map_with_path(data, shortest_path, target_dest, 'map_final.png', all_structures_path)
+        if headless:
+            print('\n=== 헤드리스 모드: 지도 시각화 생략 ===')
+        else:
+            with stage('png_render'):
+                visualize_map_with_path(data, shortest_path, target_dest, 'map_final.png', all_structures_path)
         
         print('\n' + '=' * 60)
         print('✅ 최단 경로 탐색 완료 (기본 + 보너스)')
@@ -554,7 +415,7 @@ def main():
         print(f'  도착점: {target_dest}')
         print(f'  경로 길이: {len(shortest_path)}개 지점')
         print(f'  총 이동 거리: {distance}')
-        print('  결과 파일: home_to_cafe.csv')
+        print('  결과 파일: home_to_cafe.route, home_to_cafe.csv')
         
         if all_structures_path:
             print(f'\n🏢 보너스 경로 (모든 구조물 방문):')
@@ -562,12 +423,17 @@ def main():
             print(f'  방문 구조물: {len(all_structure_points)}개')
             print(f'  경로 길이: {len(all_structures_path)}개 지점')
             print(f'  총 이동 거리: {all_structures_distance}')
-            print('  결과 파일: home_to_all_structures.csv')
+            print('  결과 파일: home_to_all_structures.route, home_to_all_structures.csv')
         
-        print(f'\n📁 시각화 파일: map_final.png')
+        if not headless:
+            print(f'\n📁 시각화 파일: map_final.png')
         
     except Exception as e:
         print(f'❌ 오류 발생: {e}')
+    finally:
+        if profile_file:
+            report = finish_profiling(profile_file)
+            print(f'\n⏱ 단계별 프로파일 저장: {profile_file} (총 {report["total_ms"]:.1f}ms)')
 
 if __name__ == '__main__':
-    main() 
+    main(profile_path(sys.argv[1:]), is_headless(sys.argv[1:]))
@@ -4,140 +4,57 @@
 
 # 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
 # 2025-07-21 | 최초 구현 | 지역 지도 시각화 기능 구현 | zookeeper
+# 2026-10-18 | 성능 개선 | 병합 데이터를 바이너리 컬럼 캐시로 재사용 (원본 CSV 변경 시에만 재생성) | zookeeper
+# 2026-10-18 | 리팩토링 | 로드/병합 코드를 공용 로더(map_data)로 이동 | zookeeper
+# 2026-10-18 | 성능 개선 | 구역별 표시를 마스크 스캔 대신 구역 인덱스(map_index) 조회로 변경 | zookeeper
+# 2026-10-18 | 성능 개선 | matplotlib 지연 import, MAP_HEADLESS이면 창 표시 없이 저장만 수행 | zookeeper
+# 2026-10-18 | 성능 개선 | 셀별 patch/원/격자선 대신 래스터 지도(imshow 1회), 도형/눈금은 읽을 수 있는 확대 수준에서만 | zookeeper
+# 2026-10-18 | 성능 개선 | 구조물 도형을 종류별 PatchCollection 하나로 묶어 그림 | zookeeper
+# 2026-10-18 | 리팩토링 | 래스터/격자선/구조물 도형 그리기를 map_raster.draw_base_map 호출로 대체, 제목/범례/개수 표시만 유지 | zookeeper
 # ----------------------------------------------------------------------------------------------------
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-
-# 한글 폰트 설정
-plt.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
-plt.rcParams['axes.unicode_minus'] = False
+from map_data import load_map_data
+from map_raster import map_bounds, draw_base_map
+from plot_setup import load_pyplot, finish_figure
 
 def create_map_visualization():
     """지역 데이터를 시각화하여 지도를 생성하는 함수"""
     
-    # 1. 데이터 로드 및 병합
+    # 1. 데이터 로드 및 병합 (공용 로더 map_data 사용)
     print('=== 데이터 로딩 및 병합 ===')
     
-    area_category = pd.read_csv('area_category.csv', skipinitialspace=True)
-    area_map = pd.read_csv('area_map.csv')
-    area_struct = pd.read_csv('area_struct.csv')
-    
-    # 구조물 ID를 이름으로 변환
-    category_mapping = dict(zip(area_category['category'], area_category['struct']))
-    area_struct['struct_name'] = area_struct['category'].map(category_mapping)
-    area_struct['struct_name'] = area_struct['struct_name'].fillna('Empty')
-    
-    # 데이터 병합
-    merged_data = pd.merge(area_map, area_struct, on=['x', 'y'], how='inner')
+    merged_data = load_map_data()
     
     print(f'전체 데이터 포인트: {len(merged_data)}')
     
     # 2. 맵 크기 설정
-    min_x, max_x = merged_data['x'].min(), merged_data['x'].max()
-    min_y, max_y = merged_data['y'].min(), merged_data['y'].max()
+    min_x, max_x, min_y, max_y = map_bounds(merged_data)
     
     print(f'맵 범위: x({min_x}~{max_x}), y({min_y}~{max_y})')
     
-    # 3. 시각화 설정
+    # 3. 시각화 설정 (matplotlib는 그림을 그릴 때만 import)
+    plt = load_pyplot()
+    from matplotlib import patches
+    
     fig, ax = plt.subplots(1, 1, figsize=(12, 12))
-    ax.set_xlim(min_x - 0.5, max_x + 0.5)
-    ax.set_ylim(min_y - 0.5, max_y + 0.5)
-    
-    # y축 뒤집기 (좌측 상단이 (1,1)이 되도록)
-    ax.invert_yaxis()
-    
-    # 4. 그리드 라인 그리기
-    print('=== 그리드 라인 생성 ===')
-    
-    for x in range(min_x, max_x + 1):
-        ax.axvline(x=x - 0.5, color='lightgray', linewidth=0.5, alpha=0.7)
-    ax.axvline(x=max_x + 0.5, color='lightgray', linewidth=0.5, alpha=0.7)
-    
-    for y in range(min_y, max_y + 1):
-        ax.axhline(y=y - 0.5, color='lightgray', linewidth=0.5, alpha=0.7)
-    ax.axhline(y=max_y + 0.5, color='lightgray', linewidth=0.5, alpha=0.7)
-    
-    # 5. 건설 현장 먼저 그리기 (다른 구조물보다 뒤에 배치)
-    print('=== 건설 현장 표시 ===')
-    
-    construction_sites = merged_data[merged_data['ConstructionSite'] == 1]
-    print(f'건설 현장 개수: {len(construction_sites)}')
-    
-    for _, site in construction_sites.iterrows():
-        rect = patches.Rectangle(
-            (site['x'] - 0.6, site['y'] - 0.6), 1.2, 1.2,
-            linewidth=1, edgecolor='gray', facecolor='lightgray', 
-            alpha=0.7, zorder=1
-        )
-        ax.add_patch(rect)
-    
-    # 6. 구조물 표시 (건설 현장 위에 그리기)
-    print('=== 구조물 표시 ===')
-    
-    structures = merged_data[merged_data['struct_name'] != 'Empty']
-    
-    apartment_count = 0
-    building_count = 0
-    coffee_count = 0
-    myhome_count = 0
-    
-    for _, struct in structures.iterrows():
-        x, y = struct['x'], struct['y']
-        struct_type = struct['struct_name']
-        
-        if struct_type == 'Apartment':
-            circle = patches.Circle(
-                (x, y), 0.25, linewidth=2, 
-                edgecolor='saddlebrown', facecolor='sandybrown', 
-                zorder=3
-            )
-            ax.add_patch(circle)
-            apartment_count += 1
-            
-        elif struct_type == 'Building':
-            circle = patches.Circle(
-                (x, y), 0.25, linewidth=2, 
-                edgecolor='saddlebrown', facecolor='sandybrown', 
-                zorder=3
-            )
-            ax.add_patch(circle)
-            building_count += 1
-            
-        elif struct_type == 'BandalgomCoffee':
-            rect = patches.Rectangle(
-                (x - 0.2, y - 0.2), 0.4, 0.4,
-                linewidth=2, edgecolor='darkgreen', facecolor='lightgreen', 
-                zorder=4
-            )
-            ax.add_patch(rect)
-            coffee_count += 1
-            
-        elif struct_type == 'MyHome':
-            triangle = patches.Polygon(
-                [(x, y - 0.25), (x - 0.22, y + 0.15), (x + 0.22, y + 0.15)],
-                linewidth=2, edgecolor='darkgreen', facecolor='lightgreen', 
-                zorder=4
-            )
-            ax.add_patch(triangle)
-            myhome_count += 1
-    
-    print(f'아파트: {apartment_count}개')
-    print(f'빌딩: {building_count}개') 
-    print(f'반달곰 커피: {coffee_count}개')
-    print(f'내 집: {myhome_count}개')
-    
-    # 7. 좌표 레이블 추가
-    print('=== 좌표 레이블 추가 ===')
-    
-    ax.set_xticks(range(min_x, max_x + 1))
-    ax.set_xticklabels(range(min_x, max_x + 1))
-    
-    ax.set_yticks(range(min_y, max_y + 1))
-    ax.set_yticklabels(range(min_y, max_y + 1))
-    
-    # 8. 제목 및 범례
+    
+    # 4. 지도 바탕 (구역 색 래스터, 격자선, 구조물 도형, 좌표 눈금)은 map_raster와 공유
+    print('=== 지도 그리기 ===')
+    
+    area_colors = {0: 'red', 1: 'blue', 2: 'yellow', 3: 'purple'}
+    draw_base_map(fig, ax, merged_data, area_colors=area_colors)
+    
+    # 5. 건설 현장 / 구조물 개수
+    print(f'건설 현장 개수: {int(merged_data["ConstructionSite"].sum())}')
+    
+    struct_counts = merged_data['struct_name'].value_counts()
+    
+    print(f'아파트: {struct_counts.get("Apartment", 0)}개')
+    print(f'빌딩: {struct_counts.get("Building", 0)}개') 
+    print(f'반달곰 커피: {struct_counts.get("BandalgomCoffee", 0)}개')
+    print(f'내 집: {struct_counts.get("MyHome", 0)}개')
+    
+    # 6. 제목 및 범례
     ax.set_title('Area Map', fontsize=16, fontweight='bold', pad=20)
     ax.set_xlabel('X Coordinate', fontsize=12)
     ax.set_ylabel('Y Coordinate', fontsize=12)
@@ -150,22 +67,9 @@ def create_map_visualization():
     ]
     ax.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1.15, 1))
     
-    # 9. Area 구분선 표시 (선택사항)
+    # 7. Area 구분 정보 (구역 색은 바탕 래스터에 포함)
     print('=== Area 구분 정보 추가 ===')
     
-    area_colors = {0: 'red', 1: 'blue', 2: 'yellow', 3: 'purple'}
-    
-    for area_id in sorted(merged_data['area'].unique()):
-        area_data = merged_data[merged_data['area'] == area_id]
-        for _, point in area_data.iterrows():
-            if point['struct_name'] == 'Empty' and point['ConstructionSite'] == 0:
-                circle = patches.Circle(
-                    (point['x'], point['y']), 0.1, 
-                    facecolor=area_colors.get(area_id, 'white'), 
-                    alpha=0.2, zorder=0
-                )
-                ax.add_patch(circle)
-    
     area_info = merged_data.groupby('area').size()
     info_text = 'Area Info:\n'
     for area_id, count in area_info.items():
@@ -174,13 +78,13 @@ def create_map_visualization():
     ax.text(0.02, 0.98, info_text, transform=ax.transAxes, 
             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
     
-    # 10. 이미지 저장
+    # 8. 이미지 저장
     plt.tight_layout()
     plt.savefig('map.png', dpi=300, bbox_inches='tight')
     print('\n=== Map Saved Successfully ===')
     print('Map saved as \'map.png\' file.')
     
-    plt.show()
+    finish_figure(plt, fig)
     
     return merged_data
 
@@ -0,0 +1,82 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 병합 지도 데이터의 공간/구역/구조물 인덱스 - 마스크 스캔 없이 O(1) / O(결과) 조회
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | (x, y)→행 배열, 구역별 행 범위, 구조물 종류별 좌표 목록을 한 번만 생성 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import weakref
+
+import numpy as np
+
+class MapIndex:
+    """병합된 지도 DataFrame에 대한 조회용 인덱스
+
+    - rows: (y, x) → 행 위치를 저장하는 int32 배열 (행이 없으면 -1)
+    - area_order / area_ranges: 구역 번호로 안정 정렬한 행 위치와, 구역별 [start, stop) 범위
+      (DataFrame 자체는 다시 정렬하지 않으므로 기존 행 순서를 쓰는 코드에 영향이 없음)
+    - struct_points: 구조물 종류별 (x, y) 좌표 목록 (DataFrame 행 순서, 'Empty' 제외)
+    """
+
+    def __init__(self, data):
+        xs = data['x'].to_numpy(np.int64)
+        ys = data['y'].to_numpy(np.int64)
+        self.min_x, self.min_y = (int(xs.min()), int(ys.min())) if len(data) else (0, 0)
+        self.width = int(xs.max()) - self.min_x + 1 if len(data) else 0
+        self.height = int(ys.max()) - self.min_y + 1 if len(data) else 0
+
+        # 1. 좌표 → 행 위치 (빽빽한 격자이므로 해시 대신 배열로 직접 조회)
+        self.rows = np.full((self.height, self.width), -1, dtype=np.int32)
+        self.rows[ys - self.min_y, xs - self.min_x] = np.arange(len(data), dtype=np.int32)
+
+        # 2. 구역별 행 범위 (구역 번호로 정렬된 행 위치에서 구역마다 연속 구간)
+        areas = data['area'].to_numpy()
+        self.area_order = np.argsort(areas, kind='stable')
+        area_ids, starts = np.unique(areas[self.area_order], return_index=True)
+        stops = np.append(starts[1:], len(areas))
+        self.area_ranges = {
+            int(area_id): (int(start), int(stop)) for area_id, start, stop in zip(area_ids, starts, stops)
+        }
+
+        # 3. 구조물 종류별 좌표 목록 (struct_name 컬럼이 없는 DataFrame은 빈 목록)
+        self.struct_points = {}
+        if 'struct_name' not in data:
+            return
+        for struct_name, positions in data.groupby('struct_name', observed=True, sort=False).indices.items():
+            if struct_name != 'Empty':
+                self.struct_points[struct_name] = list(zip(xs[positions].tolist(), ys[positions].tolist()))
+
+    def row(self, x, y):
+        """좌표의 행 위치를 반환하는 메서드 (지도 밖이거나 행이 없으면 -1)"""
+
+        gx, gy = int(x) - self.min_x, int(y) - self.min_y
+        if 0 <= gx < self.width and 0 <= gy < self.height:
+            return int(self.rows[gy, gx])
+        return -1
+
+    def area_rows(self, area_id):
+        """구역에 속한 행 위치 배열을 반환하는 메서드 (기존 행 순서 유지)"""
+
+        start, stop = self.area_ranges.get(int(area_id), (0, 0))
+        return self.area_order[start:stop]
+
+    def points(self, struct_name):
+        """구조물 종류의 (x, y) 좌표 목록을 반환하는 메서드 (없으면 빈 목록)"""
+        return self.struct_points.get(struct_name, [])
+
+# DataFrame 객체별로 한 번만 만든 인덱스 (DataFrame이 사라지면 함께 제거)
+_indexes = {}
+
+def index_for(data):
+    """DataFrame의 MapIndex를 반환하는 함수 (같은 DataFrame이면 처음 만든 인덱스를 재사용)
+
+    인덱스는 DataFrame이 바뀌지 않는다고 가정하므로, 행을 수정했다면 copy()한 새 DataFrame을 사용해야 합니다.
+    """
+
+    key = id(data)
+    entry = _indexes.get(key)
+    if entry is None or entry[0]() is not data:
+        entry = (weakref.ref(data, lambda _: _indexes.pop(key, None)), MapIndex(data))
+        _indexes[key] = entry
+    return entry[1]
@@ -0,0 +1,171 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 지도 래스터 렌더링 - 셀마다 patch를 만드는 대신 지도 전체를 NumPy RGB 배열 한 장으로 그림
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 셀당 1픽셀 RGB 배열 + imshow 한 번, 글자/도형/격자선은 읽을 수 있는 확대 수준에서만 표시 | zookeeper
+# 2026-10-18 | 기능 추가 | 구조물 글자를 글자 종류마다 scatter 한 번으로 그리는 draw_letters 추가 | zookeeper
+# 2026-10-18 | 리팩토링 | 경로와 무관한 지도 바탕 그리기를 draw_base_map으로 분리 (베이스 레이어 캐시와 공유) | zookeeper
+# 2026-10-18 | 리팩토링 | draw_base_map에 구역 색(area_colors) 옵션 추가 (map_draw도 같은 바탕 그리기 사용) | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from map_index import index_for
+
+# 셀 색상 (uint8 RGB, matplotlib 색 이름과 같은 값 - 이 모듈은 matplotlib를 import하지 않음)
+WHITE = (255, 255, 255)
+LIGHTGRAY = (211, 211, 211)
+SANDYBROWN = (244, 164, 96)
+LIGHTGREEN = (144, 238, 144)
+
+STRUCTURE_COLORS = {
+    'Apartment': SANDYBROWN,
+    'Building': SANDYBROWN,
+    'BandalgomCoffee': LIGHTGREEN,
+    'MyHome': LIGHTGREEN,
+}
+
+# 셀 한 칸이 이 크기(인치) 이상일 때만 구조물 도형, 글자, 격자선, 좌표 눈금을 그림
+# (8pt 글자가 셀 안에 들어가는 크기, 16인치 그림 기준 약 80 x 80 지도까지)
+READABLE_CELL_INCHES = 0.15
+
+def blend(color, alpha, background=WHITE):
+    """color를 background 위에 alpha 투명도로 겹친 uint8 RGB 값을 반환하는 함수"""
+
+    return tuple(round(alpha * c + (1 - alpha) * b) for c, b in zip(color, background))
+
+def color_to_rgb(color):
+    """matplotlib 색 이름('red' 등)을 uint8 RGB로 변환하는 함수 (그림을 그릴 때만 matplotlib.colors import)"""
+
+    from matplotlib.colors import to_rgb
+    return tuple(round(channel * 255) for channel in to_rgb(color))
+
+# 건설 현장: 기존 patch(lightgray, alpha 0.7)를 흰 배경에 겹친 색
+CONSTRUCTION_COLOR = blend(LIGHTGRAY, 0.7)
+
+def map_bounds(data):
+    """지도 좌표 범위 (min_x, max_x, min_y, max_y)를 Python int로 반환하는 함수"""
+
+    return (int(data['x'].min()), int(data['x'].max()), int(data['y'].min()), int(data['y'].max()))
+
+def rasterize_map(data, area_colors=None, area_alpha=0.15, structures=True):
+    """지도 전체를 셀당 1픽셀의 (높이, 너비, 3) uint8 RGB 배열로 칠하는 함수
+
+    - 빈 셀: 흰색, area_colors({구역: RGB})가 주어지면 구역 색을 area_alpha만큼 옅게 칠함
+    - 건설 현장: 연한 회색
+    - 구조물: structures가 True이면 종류별 색 (확대해서 도형을 따로 그릴 때는 False)
+    행은 y, 열은 x 순서이며 (0, 0) 픽셀이 (min_x, min_y) 셀입니다.
+    """
+
+    min_x, max_x, min_y, max_y = map_bounds(data)
+    image = np.full((max_y - min_y + 1, max_x - min_x + 1, 3), 255, dtype=np.uint8)
+
+    xs = data['x'].to_numpy(np.int64) - min_x
+    ys = data['y'].to_numpy(np.int64) - min_y
+    construction = data['ConstructionSite'].to_numpy(bool)
+    names = data['struct_name'].to_numpy()
+
+    if area_colors:
+        empty = (names == 'Empty') & ~construction
+        areas = data['area'].to_numpy()
+        for area_id, color in area_colors.items():
+            mask = empty & (areas == area_id)
+            image[ys[mask], xs[mask]] = blend(color, area_alpha)
+
+    image[ys[construction], xs[construction]] = CONSTRUCTION_COLOR
+
+    if structures:
+        for struct_name, color in STRUCTURE_COLORS.items():
+            mask = names == struct_name
+            image[ys[mask], xs[mask]] = color
+
+    return image
+
+def is_readable_zoom(fig, ax, width, height):
+    """현재 그림 크기에서 셀 한 칸이 READABLE_CELL_INCHES 이상인지 확인하는 함수"""
+
+    figure_width, figure_height = fig.get_size_inches()
+    position = ax.get_position()
+    cell_inches = min(position.width * figure_width / width, position.height * figure_height / height)
+    return cell_inches >= READABLE_CELL_INCHES
+
+def draw_raster(ax, image, bounds):
+    """래스터 지도를 imshow 한 번으로 그리는 함수 (셀 중심이 정수 좌표에 오도록 extent 지정)"""
+
+    min_x, max_x, min_y, max_y = bounds
+    return ax.imshow(
+        image, extent=(min_x - 0.5, max_x + 0.5, max_y + 0.5, min_y - 0.5),
+        origin='upper', interpolation='nearest', aspect='auto', zorder=0
+    )
+
+def draw_grid_lines(ax, bounds):
+    """셀 경계 격자선을 세로/가로 LineCollection 두 개로 그리는 함수"""
+
+    min_x, max_x, min_y, max_y = bounds
+    ax.vlines(np.arange(min_x, max_x + 2) - 0.5, min_y - 0.5, max_y + 0.5,
+              color='lightgray', linewidth=0.5, alpha=0.7)
+    ax.hlines(np.arange(min_y, max_y + 2) - 0.5, min_x - 0.5, max_x + 0.5,
+              color='lightgray', linewidth=0.5, alpha=0.7)
+
+def draw_letters(ax, points, letter, color, size=36, zorder=5.5):
+    """구조물 글자(A, B, C, H)를 글자 종류마다 scatter 한 번으로 그리는 함수 (mathtext 마커 사용)"""
+
+    if not points:
+        return None
+    xs, ys = zip(*points)
+    return ax.scatter(xs, ys, marker=f'$\\mathbf{{{letter}}}$', s=size, color=color, zorder=zorder)
+
+def draw_base_map(fig, ax, data, area_colors=None):
+    """경로와 무관한 지도 바탕(래스터, 격자선, 구조물 도형/글자, 좌표 눈금)을 그리고 확대 수준 여부를 반환하는 함수
+
+    셀이 충분히 크게 보이면 구조물을 종류별 PatchCollection 하나와 글자별 scatter 하나로 그리고,
+    작게 보이면 래스터 색으로만 표시합니다. area_colors({구역: 색 이름})가 주어지면 빈 셀을 구역 색으로 옅게 칠합니다.
+    (목표 지점 강조, 제목/범례 등 호출자마다 다른 표시는 호출자가 추가)
+    """
+
+    from matplotlib import patches
+    from matplotlib.collections import PatchCollection
+
+    bounds = map_bounds(data)
+    min_x, max_x, min_y, max_y = bounds
+    readable = is_readable_zoom(fig, ax, max_x - min_x + 1, max_y - min_y + 1)
+
+    if area_colors:
+        area_colors = {area_id: color_to_rgb(color) for area_id, color in area_colors.items()}
+    draw_raster(ax, rasterize_map(data, area_colors=area_colors, structures=not readable), bounds)
+    ax.set_xlim(min_x - 0.5, max_x + 0.5)
+    ax.set_ylim(min_y - 0.5, max_y + 0.5)
+    ax.invert_yaxis()  # y축 뒤집기
+
+    if not readable:
+        return readable
+
+    draw_grid_lines(ax, bounds)
+
+    index = index_for(data)
+    apartments, buildings = index.points('Apartment'), index.points('Building')
+    cafes, homes = index.points('BandalgomCoffee'), index.points('MyHome')
+
+    ax.add_collection(PatchCollection(
+        [patches.Circle(point, 0.25) for point in apartments + buildings],
+        linewidth=2, edgecolor='saddlebrown', facecolor='sandybrown', zorder=3
+    ))
+    ax.add_collection(PatchCollection(
+        [patches.Rectangle((x - 0.2, y - 0.2), 0.4, 0.4) for x, y in cafes],
+        linewidth=2, edgecolor='darkgreen', facecolor='lightgreen', zorder=4
+    ))
+    # 시작점(내 집) 강조
+    ax.add_collection(PatchCollection(
+        [patches.Polygon([(x, y - 0.3), (x - 0.26, y + 0.2), (x + 0.26, y + 0.2)]) for x, y in homes],
+        linewidth=3, edgecolor='blue', facecolor='lightgreen', zorder=5
+    ))
+
+    draw_letters(ax, apartments, 'A', 'black')
+    draw_letters(ax, buildings, 'B', 'black')
+    draw_letters(ax, cafes, 'C', 'darkgreen')
+    draw_letters(ax, homes, 'H', 'blue')
+
+    ax.set_xticks(range(min_x, max_x + 1))
+    ax.set_yticks(range(min_y, max_y + 1))
+    return readable
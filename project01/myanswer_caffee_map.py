@@ -1,16 +1,13 @@
-import pandas as pd
+from map_data import load_map_data
+from map_index import index_for
 
 def analysis_data():
-  category_df = pd.read_csv('./area_category.csv')
-  map_df = pd.read_csv('./area_map.csv')
-  struct_df = pd.read_csv('./area_struct.csv')
+  # CSV 로드/병합은 공용 로더(map_data)가 한 번만 수행 (압축된 dtype, 범주형 구조물 이름)
+  merged_df = load_map_data()
 
-  category_df.columns = category_df.columns.str.strip()
-  map_df.columns = map_df.columns.str.strip()
-  struct_df.columns = struct_df.columns.str.strip()
-
-  structCategory_df = struct_df.merge(category_df, on='category', how='left')
-  categoryMap_df = structCategory_df.merge(map_df, on=['x', 'y'], how='left')
+  # 구조물이 없는 칸은 기존과 같이 결측치로 표시
+  struct = merged_df['struct_name'].cat.remove_categories('Empty')
+  categoryMap_df = merged_df.assign(struct=struct)
 
   cols = ['area', 'x', 'y', 'category', 'struct', 'ConstructionSite']
   wholeData_df = categoryMap_df.sort_values('area')[cols]
@@ -20,7 +17,8 @@ def analysis_data():
 wholeData_df = analysis_data()
 
 def filtering_area1(df):
-  area1_df = df[df['area'] == 1]
+  # 구역 인덱스는 DataFrame마다 한 번만 만들어지므로 여러 구역을 조회해도 전체를 다시 훑지 않음
+  area1_df = df.iloc[index_for(df).area_rows(1)]
 
   return area1_df
 
@@ -32,4 +30,4 @@ def struct_stats(df):
   print(df['struct'].value_counts())
 
 print('\n===== 구조물 종류별 요약 통계 =====')
-struct_stats(wholeData_df)
\ No newline at end of file
+struct_stats(wholeData_df)
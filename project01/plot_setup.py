@@ -0,0 +1,48 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : matplotlib 지연 로드 및 헤드리스 실행 설정 - 경로 계산만 할 때는 matplotlib를 import하지 않음
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 처음 그릴 때만 pyplot import + 폰트 설정, --headless / MAP_HEADLESS로 창 표시 생략 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import os
+import sys
+
+HEADLESS_ENV = 'MAP_HEADLESS'
+
+def is_headless(argv=None):
+    """--headless 플래그 또는 MAP_HEADLESS 환경 변수(1/true)가 있으면 True를 반환하는 함수
+
+    헤드리스 모드에서는 창을 띄우지 않으며(plt.show() 생략), 경로 탐색 스크립트는 그림 저장도 건너뜁니다.
+    """
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if '--headless' in argv:
+        return True
+    return os.environ.get(HEADLESS_ENV, '').strip().lower() in ('1', 'true')
+
+def load_pyplot():
+    """matplotlib.pyplot을 import하고 폰트 설정을 적용하여 반환하는 함수 (그림을 그리기 직전에 호출)
+
+    헤드리스 모드에서는 화면 백엔드 초기화 없이 파일 저장용 Agg 백엔드를 사용합니다.
+    """
+
+    import matplotlib
+    if is_headless():
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    # 한글 폰트 설정
+    plt.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
+    plt.rcParams['axes.unicode_minus'] = False
+    return plt
+
+def finish_figure(plt, fig):
+    """저장이 끝난 그림을 화면에 표시하거나, 헤드리스 모드면 표시 없이 닫는 함수"""
+
+    if is_headless():
+        plt.close(fig)
+    else:
+        plt.show()
@@ -0,0 +1,327 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 경로 바이너리 형식 - 시작 셀 + 칸당 2비트 이동 코드(또는 런 길이 부호화)로 경로를 작게 저장
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | DataFrame 없이 경로 단위로 쓰고 읽는 스트리밍 writer/reader, gzip 압축 선택, CSV 변환 | zookeeper
+# 2026-10-18 | 버그 수정 | 잘리거나 손상된 파일은 헤더의 길이/이동 수와 실제 본문을 비교하여 항상 ValueError로 보고 | zookeeper
+# 2026-10-18 | 버그 수정 | RLE 반복 횟수를 MAX_RUN으로 제한하고 이동 수 상한(본문 길이 * MAX_RUN)을 펼치기 전에 검사 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import csv
+import gzip
+import itertools
+import zlib
+
+# 파일 형식 (순수 Python, numpy/pandas 사용 안 함)
+#   파일   = MAGIC + 경로 레코드 반복 (compress=True이면 파일 전체를 gzip으로 감쌈)
+#   레코드 = 시작 x, 시작 y (zigzag varint) + 이동 수 (varint) + 부호화 방식 (1바이트)
+#            + 본문 길이 (varint) + 본문
+#   본문   = PACKED: 이동 코드 4개를 1바이트에 (하위 비트부터 2비트씩)
+#            RLE: (반복 횟수 << 2 | 이동 코드) varint 반복 (반복 횟수는 1 ~ MAX_RUN, 더 긴 구간은 나누어 기록)
+MAGIC = b'MRT1'
+GZIP_MAGIC = b'\x1f\x8b'
+
+PACKED = 0
+RLE = 1
+
+# RLE 항목 하나의 최대 반복 횟수 (varint 2바이트 이내). 항목은 1바이트 이상이므로
+# 이동 수는 본문 길이 * MAX_RUN을 넘을 수 없고, 읽기 전에 헤더의 이동 수를 이 값으로 검사
+MAX_RUN = (1 << 12) - 1
+
+# 잘리거나 손상된 gzip 파일을 읽을 때 발생하는 예외 (ValueError로 바꾸어 보고)
+GZIP_ERRORS = (EOFError, gzip.BadGzipFile, zlib.error)
+
+# 이동 코드 (grid_search.bfs_tree의 방향 코드와 같음: 0:좌, 1:우, 2:상, 3:하)
+MOVE_CODES = {(-1, 0): 0, (1, 0): 1, (0, -1): 2, (0, 1): 3}
+MOVE_STEPS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+def _write_varint(buffer, value):
+    """0 이상의 정수를 7비트 단위 varint로 buffer(bytearray)에 덧붙이는 함수"""
+
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+def _read_varint(stream):
+    """stream에서 varint 하나를 읽는 함수 (파일 끝이면 None)"""
+
+    value = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if shift:
+                raise ValueError('경로 파일이 중간에 끊겼습니다!')
+            return None
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+def _read_field(stream, name):
+    """레코드 중간의 varint 필드를 읽는 함수 (파일이 끝났으면 ValueError)"""
+
+    value = _read_varint(stream)
+    if value is None:
+        raise ValueError(f'경로 파일이 중간에 끊겼습니다! ({name} 없음)')
+    return value
+
+def _read_exact(stream, length, chunk_size=1 << 20):
+    """stream에서 length 바이트를 읽는 함수 (손상된 길이 값으로 큰 버퍼를 한 번에 잡지 않도록 청크 단위)"""
+
+    chunks = []
+    remaining = length
+    while remaining:
+        chunk = stream.read(min(remaining, chunk_size))
+        if not chunk:
+            raise ValueError(f'경로 파일이 중간에 끊겼습니다! (본문 {length} bytes 중 {length - remaining} bytes)')
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+def _unzigzag(value):
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+def encode_moves(points):
+    """좌표 목록을 (시작점, 이동 코드 bytearray)로 바꾸는 함수 (상하좌우 1칸 이동만 허용)"""
+
+    iterator = iter(points)
+    start = next(iterator, None)
+    if start is None:
+        return None, bytearray()
+
+    start = (int(start[0]), int(start[1]))
+    moves = bytearray()
+    previous_x, previous_y = start
+    for x, y in iterator:
+        x, y = int(x), int(y)
+        code = MOVE_CODES.get((x - previous_x, y - previous_y))
+        if code is None:
+            raise ValueError(f'상하좌우 1칸 이동이 아닙니다: {(previous_x, previous_y)} → {(x, y)}')
+        moves.append(code)
+        previous_x, previous_y = x, y
+    return start, moves
+
+def pack_moves(moves):
+    """이동 코드를 1바이트에 4개씩 묶는 함수"""
+
+    packed = bytearray((len(moves) + 3) // 4)
+    for index, code in enumerate(moves):
+        packed[index >> 2] |= code << ((index & 3) * 2)
+    return packed
+
+def unpack_moves(packed, count):
+    """pack_moves로 묶은 이동 코드 count개를 하나씩 돌려주는 generator"""
+
+    for index in range(count):
+        yield (packed[index >> 2] >> ((index & 3) * 2)) & 3
+
+def rle_moves(moves):
+    """같은 이동 코드가 이어지는 구간을 (반복 횟수 << 2 | 코드) varint로 부호화하는 함수 (MAX_RUN 단위로 나눔)"""
+
+    encoded = bytearray()
+    index = 0
+    while index < len(moves):
+        code = moves[index]
+        run = 1
+        while run < MAX_RUN and index + run < len(moves) and moves[index + run] == code:
+            run += 1
+        _write_varint(encoded, run << 2 | code)
+        index += run
+    return encoded
+
+def unrle_moves(encoded, count=None):
+    """rle_moves로 부호화한 이동 코드를 하나씩 돌려주는 generator
+
+    반복 횟수가 1 ~ MAX_RUN 밖이거나, count가 주어졌을 때 반복 횟수의 합이 count를 넘으면 ValueError를 발생시킵니다.
+    """
+
+    total = 0
+    index = 0
+    while index < len(encoded):
+        value = 0
+        shift = 0
+        while True:
+            if index >= len(encoded):
+                raise ValueError('경로 파일의 RLE 본문이 중간에 끊겼습니다!')
+            byte = encoded[index]
+            index += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        run = value >> 2
+        if not 1 <= run <= MAX_RUN:
+            raise ValueError(f'경로 파일 RLE 본문의 반복 횟수가 잘못되었습니다! ({run}, 최대 {MAX_RUN})')
+        total += run
+        if count is not None and total > count:
+            raise ValueError(f'경로 파일 RLE 본문의 이동 수가 헤더보다 많습니다! (이동 {count}개)')
+        yield from itertools.repeat(value & 3, run)
+
+class RouteWriter:
+    """경로를 하나씩 바이너리 파일에 이어 쓰는 writer (with 문 사용)
+
+    encoding은 'packed', 'rle', 'auto'(경로마다 더 작은 쪽) 중 하나이며,
+    compress가 True이면 파일 전체를 gzip으로 압축합니다.
+    """
+
+    def __init__(self, path, compress=False, encoding='auto'):
+        if encoding not in ('packed', 'rle', 'auto'):
+            raise ValueError(f'알 수 없는 부호화 방식입니다: {encoding} (사용 가능: packed, rle, auto)')
+        self.encoding = encoding
+        self.stream = gzip.open(path, 'wb') if compress else open(path, 'wb')
+        self.stream.write(MAGIC)
+        self.count = 0
+
+    def write(self, points):
+        """경로(좌표 목록 또는 iterable) 하나를 레코드로 기록하는 메서드 (빈 경로는 기록하지 않음)"""
+
+        start, moves = encode_moves(points)
+        if start is None:
+            return
+
+        packed = pack_moves(moves) if self.encoding != 'rle' else None
+        encoded = rle_moves(moves) if self.encoding != 'packed' else None
+        if encoded is None or (packed is not None and len(packed) <= len(encoded)):
+            method, body = PACKED, packed
+        else:
+            method, body = RLE, encoded
+
+        header = bytearray()
+        _write_varint(header, _zigzag(start[0]))
+        _write_varint(header, _zigzag(start[1]))
+        _write_varint(header, len(moves))
+        header.append(method)
+        _write_varint(header, len(body))
+        self.stream.write(header)
+        self.stream.write(body)
+        self.count += 1
+
+    def close(self):
+        self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def open_route_file(path):
+    """경로 파일을 열고 MAGIC을 확인하는 함수 (gzip 압축 여부는 파일 앞 2바이트로 판단)"""
+
+    with open(path, 'rb') as f:
+        compressed = f.read(2) == GZIP_MAGIC
+    stream = gzip.open(path, 'rb') if compressed else open(path, 'rb')
+    try:
+        magic = stream.read(len(MAGIC))
+    except GZIP_ERRORS as e:
+        stream.close()
+        raise ValueError(f'압축된 경로 파일이 손상되었습니다: {path} ({e})') from e
+    if magic != MAGIC:
+        stream.close()
+        raise ValueError(f'경로 파일 형식이 아닙니다: {path}')
+    return stream
+
+def _decode_moves(method, body, count):
+    """레코드 본문을 이동 코드 리스트로 복원하는 함수 (본문 길이/이동 수가 헤더와 다르면 ValueError)"""
+
+    if method == PACKED:
+        if len(body) != (count + 3) // 4:
+            raise ValueError(f'경로 파일 본문 길이가 이동 수와 맞지 않습니다! ({len(body)} bytes, 이동 {count}개)')
+        return list(unpack_moves(body, count))
+    if method == RLE:
+        # 손상된 이동 수로 큰 리스트를 만들지 않도록 본문 길이로 가능한 최대 이동 수를 먼저 검사
+        if count > len(body) * MAX_RUN:
+            raise ValueError(f'경로 파일 RLE 본문으로는 이동 {count}개를 만들 수 없습니다! ({len(body)} bytes)')
+        codes = list(unrle_moves(body, count))
+        if len(codes) != count:
+            raise ValueError(f'경로 파일 RLE 본문의 이동 수가 헤더와 다릅니다! ({len(codes)} != {count})')
+        return codes
+    raise ValueError(f'알 수 없는 부호화 방식입니다: {method}')
+
+def iter_routes(path):
+    """경로 파일의 경로를 하나씩 좌표 리스트 [(x, y), ...]로 돌려주는 generator
+
+    레코드 단위로 읽으므로 파일 전체나 DataFrame을 메모리에 올리지 않습니다.
+    파일이 잘렸거나 손상되었으면 (gzip 압축 파일 포함) ValueError를 발생시킵니다.
+    """
+
+    with open_route_file(path) as stream:
+        try:
+            while True:
+                value = _read_varint(stream)
+                if value is None:
+                    return
+                x, y = _unzigzag(value), _unzigzag(_read_field(stream, '시작 y'))
+                count = _read_field(stream, '이동 수')
+                method = stream.read(1)
+                if not method:
+                    raise ValueError('경로 파일이 중간에 끊겼습니다! (부호화 방식 없음)')
+                length = _read_field(stream, '본문 길이')
+                body = _read_exact(stream, length)
+
+                points = [(x, y)]
+                for code in _decode_moves(method[0], body, count):
+                    step_x, step_y = MOVE_STEPS[code]
+                    x, y = x + step_x, y + step_y
+                    points.append((x, y))
+                yield points
+        except GZIP_ERRORS as e:
+            raise ValueError(f'압축된 경로 파일이 손상되었습니다: {path} ({e})') from e
+
+def write_routes(path, routes, compress=False, encoding='auto'):
+    """여러 경로를 한 파일에 저장하고 기록한 경로 수를 반환하는 함수"""
+
+    with RouteWriter(path, compress, encoding) as writer:
+        for points in routes:
+            writer.write(points)
+    return writer.count
+
+def route_to_csv(route_path, csv_path):
+    """경로 파일을 CSV로 변환하는 함수 (경로가 하나면 step,x,y, 여러 개면 route,step,x,y 컬럼)
+
+    반환값: 기록한 행 수
+    """
+
+    routes = iter_routes(route_path)
+    first = next(routes, None)
+    second = next(routes, None)
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        if second is None:
+            writer.writerow(['step', 'x', 'y'])
+            for step, (x, y) in enumerate(first or [], start=1):
+                writer.writerow([step, x, y])
+            return len(first or [])
+
+        writer.writerow(['route', 'step', 'x', 'y'])
+        rows = 0
+        for route_index, points in enumerate(itertools.chain([first, second], routes), start=1):
+            writer.writerows([route_index, step, x, y] for step, (x, y) in enumerate(points, start=1))
+            rows += len(points)
+    return rows
+
+def csv_to_route(csv_path, route_path, compress=False, encoding='auto'):
+    """step,x,y (또는 route,step,x,y) CSV를 경로 파일로 변환하고 기록한 경로 수를 반환하는 함수"""
+
+    def routes():
+        with open(csv_path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            current, points = None, []
+            for row in reader:
+                route_id = row.get('route')
+                if points and route_id != current:
+                    yield points
+                    points = []
+                current = route_id
+                points.append((int(row['x']), int(row['y'])))
+            if points:
+                yield points
+
+    return write_routes(route_path, routes(), compress, encoding)
@@ -0,0 +1,233 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 경로 이미지 고속 생성 - 지도 바탕(베이스 레이어)을 한 번만 그려 캐시하고 경로만 픽셀로 합성
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 병합 데이터 해시로 베이스 레이어 캐시(메모리 + .npz), 경로/시작점/도착점을 NumPy로 합성 | zookeeper
+# 2026-10-18 | 성능 개선 | 경로 바이너리 파일(.route)이 있으면 CSV 대신 읽음 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import hashlib
+import os
+import sys
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from map_cache import CACHE_DIR
+from map_raster import map_bounds, draw_base_map
+from route_format import iter_routes
+
+# 베이스 레이어 그림 설정 (바꾸면 RENDER_VERSION도 올려 이전 캐시를 무효화)
+RENDER_VERSION = 1
+BASE_FIGSIZE = (16, 14)
+BASE_DPI = 100
+
+# 경로 색상 (uint8 RGB)
+SHORTEST_COLOR = (255, 0, 0)
+TOUR_COLOR = (0, 0, 255)
+START_COLOR = (0, 0, 255)
+
+# 같은 프로세스에서 다시 쓰는 베이스 레이어 ({(데이터 해시, dpi): 레이어})
+_layers = {}
+
+# DataFrame 객체별로 한 번만 계산한 해시 (DataFrame이 사라지면 함께 제거)
+_hashes = {}
+
+def data_hash(data):
+    """병합된 지도 데이터 내용의 SHA-1 해시를 반환하는 함수 (컬럼 이름 + 행별 해시, 행 순서 포함)
+
+    같은 DataFrame 객체는 처음 계산한 값을 재사용하므로, 행을 수정했다면 copy()한 새 DataFrame을 사용해야 합니다.
+    """
+
+    key = id(data)
+    entry = _hashes.get(key)
+    if entry is None or entry[0]() is not data:
+        digest = hashlib.sha1(f'v{RENDER_VERSION}'.encode())
+        digest.update(','.join(map(str, data.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+        entry = (weakref.ref(data, lambda _: _hashes.pop(key, None)), digest.hexdigest())
+        _hashes[key] = entry
+    return entry[1]
+
+def render_base_layer(data, dpi=BASE_DPI, figsize=BASE_FIGSIZE):
+    """경로 없이 지도 바탕만 그려 RGB 픽셀 배열과 좌표 → 픽셀 변환값을 반환하는 함수
+
+    pyplot 없이 Agg 캔버스에 직접 그리므로 창을 띄우지 않으며 워커 프로세스에서도 사용할 수 있습니다.
+    반환값: {'image': (높이, 너비, 3) uint8, 'origin': (min_x 셀 중심 열, min_y 셀 중심 행),
+             'scale': (x 1칸당 열 수, y 1칸당 행 수), 'bounds': 지도 좌표 범위}
+    """
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+
+    draw_base_map(fig, ax, data)
+    ax.set_title('Route Map', fontsize=16, fontweight='bold', pad=20)
+    ax.set_xlabel('X Coordinate', fontsize=12)
+    ax.set_ylabel('Y Coordinate', fontsize=12)
+    fig.tight_layout()
+    canvas.draw()
+
+    image = np.asarray(canvas.buffer_rgba())[:, :, :3].copy()
+
+    # 셀 중심 좌표를 픽셀 위치로 바꾸는 변환 (화면 좌표는 아래쪽이 0이므로 행은 뒤집음)
+    min_x, max_x, min_y, max_y = bounds = map_bounds(data)
+    (x0, y0), (x1, y1) = ax.transData.transform([(min_x, min_y), (min_x + 1, min_y + 1)])
+    height = image.shape[0]
+    return {
+        'image': image,
+        'origin': (float(x0), float(height - y0)),
+        'scale': (float(x1 - x0), float(y0 - y1)),
+        'bounds': bounds,
+    }
+
+def load_base_layer(data, dpi=BASE_DPI, cache_dir=CACHE_DIR):
+    """베이스 레이어를 메모리 캐시 → 디스크 캐시(.npz) → 새로 그리기 순서로 가져오는 함수
+
+    캐시 키는 병합 데이터 해시와 dpi이므로, 지도가 바뀌지 않은 동안에는 경로만 합성하면 됩니다.
+    """
+
+    digest = data_hash(data)
+    key = (digest, dpi)
+    if key in _layers:
+        return _layers[key]
+
+    cache_path = os.path.join(cache_dir, f'base_layer_{digest[:16]}_{dpi}.npz')
+    if os.path.exists(cache_path):
+        with np.load(cache_path) as cached:
+            layer = {
+                'image': cached['image'],
+                'origin': tuple(cached['origin'].tolist()),
+                'scale': tuple(cached['scale'].tolist()),
+                'bounds': tuple(cached['bounds'].tolist()),
+            }
+        print(f'베이스 레이어 캐시 사용: {cache_path}')
+    else:
+        layer = render_base_layer(data, dpi)
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez(cache_path, image=layer['image'], origin=layer['origin'],
+                 scale=layer['scale'], bounds=layer['bounds'])
+        print(f'베이스 레이어 캐시 저장: {cache_path}')
+
+    _layers[key] = layer
+    return layer
+
+def to_pixels(layer, points):
+    """지도 좌표 목록을 베이스 레이어의 (열, 행) 픽셀 배열로 변환하는 함수"""
+
+    min_x, _, min_y, _ = layer['bounds']
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    cols = np.rint(layer['origin'][0] + (points[:, 0] - min_x) * layer['scale'][0]).astype(np.int64)
+    rows = np.rint(layer['origin'][1] + (points[:, 1] - min_y) * layer['scale'][1]).astype(np.int64)
+    return cols, rows
+
+def route_mask(layer, path, width):
+    """4방향 경로를 width 픽셀 굵기의 선으로 칠한 bool 마스크를 만드는 함수
+
+    경로는 가로/세로 이동만 있으므로, 방향이 바뀌는 꼭짓점 사이를 직사각형 하나로 칠합니다.
+    """
+
+    height, image_width = layer['image'].shape[:2]
+    mask = np.zeros((height, image_width), dtype=bool)
+    if len(path) < 2:
+        return mask
+
+    cols, rows = to_pixels(layer, path)
+
+    # 방향이 바뀌는 지점(과 양 끝)만 남겨 직선 구간 단위로 칠함
+    steps = np.stack((np.diff(cols), np.diff(rows)), axis=1)
+    turns = np.flatnonzero(np.any(steps[1:] != steps[:-1], axis=1)) + 1
+    corners = np.concatenate(([0], turns, [len(path) - 1]))
+
+    half = width // 2
+    for start, stop in zip(corners[:-1].tolist(), corners[1:].tolist()):
+        row_lo, row_hi = sorted((int(rows[start]), int(rows[stop])))
+        col_lo, col_hi = sorted((int(cols[start]), int(cols[stop])))
+        mask[max(row_lo - half, 0):max(row_hi + half + 1, 0), max(col_lo - half, 0):max(col_hi + half + 1, 0)] = True
+    return mask
+
+def paint(image, mask, color, alpha=1.0):
+    """마스크 위치에 color를 alpha 투명도로 한 번만 겹쳐 칠하는 함수 (겹치는 구간도 같은 색)"""
+
+    if alpha >= 1.0:
+        image[mask] = color
+    else:
+        image[mask] = (alpha * np.asarray(color) + (1 - alpha) * image[mask]).round().astype(np.uint8)
+
+def disc_mask(layer, point, radius):
+    """점을 중심으로 반지름 radius 픽셀의 원 마스크를 만드는 함수 (원을 둘러싼 사각형 안만 계산)"""
+
+    height, width = layer['image'].shape[:2]
+    mask = np.zeros((height, width), dtype=bool)
+    cols, rows = to_pixels(layer, [point])
+    col, row = int(cols[0]), int(rows[0])
+    top, left = max(row - radius, 0), max(col - radius, 0)
+    row_grid, col_grid = np.ogrid[top:max(row + radius + 1, 0), left:max(col + radius + 1, 0)]
+    mask[top:top + row_grid.shape[0], left:left + col_grid.shape[1]] = \
+        (row_grid - row) ** 2 + (col_grid - col) ** 2 <= radius ** 2
+    return mask
+
+def composite_routes(layer, path, all_structures_path=None):
+    """베이스 레이어 복사본 위에 경로를 합성한 RGB 배열을 반환하는 함수
+
+    모든 구조물 방문 경로(파란색, 반투명) → 최단 경로(빨간색) → 시작점(파란 원)/도착점(빨간 원) 순서로 칠합니다.
+    """
+
+    image = layer['image'].copy()
+    cell_pixels = min(abs(layer['scale'][0]), abs(layer['scale'][1]))
+    line_width = max(1, int(round(cell_pixels * 0.08)))
+    marker_radius = max(2, int(round(cell_pixels * 0.12)))
+
+    if all_structures_path and len(all_structures_path) > 1:
+        paint(image, route_mask(layer, all_structures_path, max(1, line_width * 2 // 3)), TOUR_COLOR, 0.6)
+
+    if len(path) > 1:
+        paint(image, route_mask(layer, path, line_width), SHORTEST_COLOR, 0.8)
+    if path:
+        paint(image, disc_mask(layer, path[0], marker_radius), START_COLOR)
+        paint(image, disc_mask(layer, path[-1], marker_radius), SHORTEST_COLOR)
+    return image
+
+def render_route_image(data, path, filename, all_structures_path=None, dpi=BASE_DPI):
+    """캐시된 베이스 레이어에 경로를 합성하여 PNG로 저장하는 함수 (지도 바탕은 다시 그리지 않음)"""
+
+    from matplotlib.image import imsave
+
+    layer = load_base_layer(data, dpi)
+    imsave(filename, composite_routes(layer, path, all_structures_path))
+    return filename
+
+def main():
+    """사용법: python route_render.py [출력 파일] [dpi]
+
+    map_direct_save.py가 저장한 home_to_cafe / home_to_all_structures 경로(.route, 없으면 .csv)를
+    캐시된 베이스 레이어에 합성하여 저장합니다. (기본: route_map.png, 100 dpi)
+    """
+
+    def read_path(name):
+        if os.path.exists(f'{name}.route'):
+            return next(iter_routes(f'{name}.route'), [])
+        if os.path.exists(f'{name}.csv'):
+            return pd.read_csv(f'{name}.csv')[['x', 'y']].to_numpy().tolist()
+        return None
+
+    from map_data import load_map_data
+
+    filename = sys.argv[1] if len(sys.argv) > 1 else 'route_map.png'
+    dpi = int(sys.argv[2]) if len(sys.argv) > 2 else BASE_DPI
+
+    data = load_map_data()
+    path = read_path('home_to_cafe') or []
+    all_structures_path = read_path('home_to_all_structures')
+
+    print('=== 경로 이미지 합성 (캐시된 베이스 레이어 사용) ===')
+    render_route_image(data, path, filename, all_structures_path, dpi)
+    print(f'경로 이미지가 \'{filename}\' 파일로 저장되었습니다.')
+
+if __name__ == '__main__':
+    main()
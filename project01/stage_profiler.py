@@ -0,0 +1,128 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 단계별 실행 시간/메모리/카운터 측정 - --profile 플래그 또는 MAP_PROFILE 환경 변수로 활성화
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 중첩 가능한 stage() 측정 구간, tracemalloc 최대 메모리, JSON 결과 저장 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+PROFILE_FILE = 'profile.json'
+PROFILE_ENV = 'MAP_PROFILE'
+
+# 현재 실행 중인 프로파일러 (비활성화 상태면 None → stage()는 아무것도 측정하지 않음)
+_state = {'profiler': None}
+
+class StageProfiler:
+    """단계(stage)마다 실행 시간, tracemalloc 최대 메모리, 카운터를 기록하는 클래스
+
+    단계는 중첩할 수 있으며 ('load_data/merge'처럼 경로로 기록), 안쪽 단계의 최대 메모리는
+    바깥 단계의 최대 메모리에도 반영됩니다.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.stack = []
+        tracemalloc.start()
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        """측정 구간을 여는 메서드 (with 문에서 카운터 dict를 돌려주며, 값을 넣으면 결과에 함께 기록)"""
+
+        current, peak = tracemalloc.get_traced_memory()
+        if self.stack:
+            # 바깥 단계의 지금까지 최대값을 보존한 뒤 이 단계용으로 초기화
+            self.stack[-1]['peak'] = max(self.stack[-1]['peak'], peak)
+        tracemalloc.reset_peak()
+
+        path = '/'.join([record['stage'] for record in self.stack[-1:]] + [name])
+        record = {'stage': path, 'peak': 0, 'start_memory': current, 'counters': {}}
+        self.records.append(record)  # 시작 순서대로 기록 (안쪽 단계가 바깥 단계 뒤에 나옴)
+        self.stack.append(record)
+
+        started = time.perf_counter()
+        try:
+            yield record['counters']
+        finally:
+            record['elapsed'] = time.perf_counter() - started
+            current, peak = tracemalloc.get_traced_memory()
+            record['peak'] = max(record['peak'], peak)
+            record['end_memory'] = current
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1]['peak'] = max(self.stack[-1]['peak'], record['peak'])
+
+    def report(self):
+        """측정 결과를 JSON으로 저장할 수 있는 dict로 반환하는 메서드"""
+
+        stages = []
+        for record in self.records:
+            stages.append({
+                'stage': record['stage'],
+                'wall_ms': round(record.get('elapsed', 0.0) * 1000, 3),
+                'peak_memory_kb': round(record['peak'] / 1024, 1),
+                'memory_delta_kb': round((record.get('end_memory', record['start_memory'])
+                                          - record['start_memory']) / 1024, 1),
+                **record['counters'],
+            })
+        return {
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 3),
+            'stages': stages,
+        }
+
+@contextmanager
+def _disabled_stage():
+    yield {}
+
+def stage(name):
+    """현재 프로파일러의 측정 구간을 여는 함수 (프로파일링 중이 아니면 측정 없이 빈 카운터 dict 반환)"""
+
+    profiler = _state['profiler']
+    if profiler is None:
+        return _disabled_stage()
+    return profiler.stage(name)
+
+def start_profiling():
+    """프로파일링을 시작하는 함수 (tracemalloc 추적은 실행 속도를 늦추므로 필요할 때만 사용)"""
+    _state['profiler'] = StageProfiler()
+
+def finish_profiling(path=PROFILE_FILE):
+    """프로파일링을 끝내고 결과를 JSON 파일로 저장한 뒤 dict로 반환하는 함수"""
+
+    profiler = _state['profiler']
+    _state['profiler'] = None
+    if profiler is None:
+        return None
+
+    report = profiler.report()
+    tracemalloc.stop()
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return report
+
+def profile_path(argv):
+    """명령행 인자(--profile [경로])와 MAP_PROFILE 환경 변수로 결과 파일 경로를 정하는 함수
+
+    --profile 뒤에 경로가 없으면 profile.json을 사용하고, 환경 변수는 1/true이면 profile.json,
+    그 밖의 값이면 그 값을 경로로 사용합니다. 둘 다 없으면 None (프로파일링 안 함)
+    """
+
+    if '--profile' in argv:
+        position = argv.index('--profile') + 1
+        if position < len(argv) and not argv[position].startswith('-'):
+            return argv[position]
+        return PROFILE_FILE
+
+    value = os.environ.get(PROFILE_ENV, '').strip()
+    if value.lower() in ('', '0', 'false'):
+        return None
+    if value.lower() in ('1', 'true'):
+        return PROFILE_FILE
+    return value
@@ -0,0 +1,114 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 대용량 지역 CSV 스트리밍 병합 - 청크 단위 읽기 + 셀 ID 직접 주소 배열 조인
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | pd.merge 없이 area_struct를 디스크 배열에 펼치고 area_map 청크를 조인하여 바로 기록 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from tiled_grid import scan_bounds
+
+# 출력 컬럼 순서 (pd.merge(area_map, area_struct, on=['x', 'y'])와 동일)
+OUTPUT_COLUMNS = ['x', 'y', 'ConstructionSite', 'category', 'area', 'struct_name']
+
+def read_category_mapping(category_csv):
+    """구조물 ID → 이름 매핑을 읽는 함수 (area_category.csv는 작으므로 한 번에 읽음)"""
+
+    area_category = pd.read_csv(category_csv, skipinitialspace=True)
+    area_category.columns = area_category.columns.str.strip()
+    return dict(zip(area_category['category'], area_category['struct']))
+
+def ingest_merged_csv(output_csv='merged_data.csv', map_csv='area_map.csv', struct_csv='area_struct.csv',
+                      category_csv='area_category.csv', chunksize=1_000_000):
+    """area_map.csv와 area_struct.csv를 청크 단위로 읽어 병합 결과를 output_csv에 이어 쓰는 함수
+
+    좌표가 격자 위에 빽빽하게 있으므로 해시 조인 대신 셀 ID(y * width + x)를 주소로 쓰는 배열로 조인합니다.
+    1. area_struct의 좌표 범위를 구하고, 구역/구조물 값을 셀 ID 위치의 디스크 배열(np.memmap)에 기록
+    2. area_map을 청크로 읽으며 같은 셀 ID의 값을 배열에서 가져와 구조물 행이 있는 셀만 바로 기록
+    두 파일을 메모리에 함께 올리지 않으므로 메모리 사용량은 지도 크기가 아닌 chunksize에 비례합니다.
+    좌표는 파일마다 한 번씩만 나온다고 가정합니다 (중복 좌표는 area_struct의 마지막 행 사용).
+    반환값: 기록한 행 수
+    """
+
+    print(f'=== 스트리밍 병합 ({map_csv} + {struct_csv} → {output_csv}) ===')
+
+    category_mapping = read_category_mapping(category_csv)
+    min_x, min_y, max_x, max_y = scan_bounds([struct_csv], chunksize)
+    width, height = max_x - min_x + 1, max_y - min_y + 1
+    print(f'셀 ID 범위: {width} x {height} ({width * height:,}개 셀)')
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        # 새로 만든 memmap 파일은 0으로 채워져 있으므로 category는 +1 하여 저장 (0: 구조물 행 없음)
+        area = np.memmap(os.path.join(work_dir, 'area.bin'), dtype=np.int32, mode='w+', shape=width * height)
+        category = np.memmap(os.path.join(work_dir, 'category.bin'), dtype=np.int16, mode='w+', shape=width * height)
+
+        for chunk in pd.read_csv(struct_csv, chunksize=chunksize):
+            chunk.columns = chunk.columns.str.strip()
+            chunk = chunk.dropna(subset=['x', 'y', 'area'])
+            cell_ids = (chunk['y'].to_numpy(np.int64) - min_y) * width + (chunk['x'].to_numpy(np.int64) - min_x)
+            area[cell_ids] = chunk['area'].to_numpy()
+            category[cell_ids] = chunk['category'].fillna(0).to_numpy() + 1
+
+        rows = 0
+        with open(output_csv, 'w', newline='') as out:
+            for index, chunk in enumerate(pd.read_csv(map_csv, chunksize=chunksize)):
+                chunk.columns = chunk.columns.str.strip()
+                chunk = chunk.dropna()
+                xs = chunk['x'].to_numpy(np.int64)
+                ys = chunk['y'].to_numpy(np.int64)
+
+                # area_struct 범위 밖 좌표는 조인 대상이 아니므로 셀 0을 읽고 버림
+                inside = (xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)
+                cell_ids = np.where(inside, (ys - min_y) * width + (xs - min_x), 0)
+                codes = category[cell_ids]
+                matched = inside & (codes > 0)
+
+                merged = chunk.loc[matched, ['x', 'y', 'ConstructionSite']]
+                merged['category'] = codes[matched] - 1
+                merged['area'] = area[cell_ids[matched]]
+                merged['struct_name'] = merged['category'].map(category_mapping).fillna('Empty')
+
+                merged[OUTPUT_COLUMNS].to_csv(out, header=(index == 0), index=False)
+                rows += len(merged)
+
+        del area, category  # 임시 디렉터리를 지우기 전에 memmap 해제
+
+    print(f'병합 결과: {rows:,}개 행 기록')
+    return rows
+
+def main():
+    """사용법: python stream_ingest.py [--trace-memory] [출력 CSV] [area_map.csv] [area_struct.csv] [청크 크기]"""
+
+    args = sys.argv[1:]
+    trace_memory = '--trace-memory' in args
+    args = [arg for arg in args if arg != '--trace-memory']
+    output_csv = args[0] if len(args) > 0 else 'merged_data.csv'
+    map_csv = args[1] if len(args) > 1 else 'area_map.csv'
+    struct_csv = args[2] if len(args) > 2 else 'area_struct.csv'
+    chunksize = int(args[3]) if len(args) > 3 else 1_000_000
+
+    # tracemalloc은 pandas 처리를 크게 느리게 하므로 요청한 경우에만 사용
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    ingest_merged_csv(output_csv, map_csv, struct_csv, chunksize=chunksize)
+    elapsed = time.perf_counter() - started
+    print(f'소요 시간: {elapsed:.2f}초')
+
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # memmap 페이지는 디스크에 대응되므로 제외하고, 청크 처리에 쓴 힙 메모리 최대치만 측정
+        print(f'최대 힙 메모리: {peak / 1024 / 1024:.1f}MB (chunksize {chunksize:,})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 지도 타일 피라미드(z/x/y PNG) 생성 - 큰 지도를 한 장의 300 dpi 그림 대신 필요한 타일만 받아 보도록 분할
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 셀 래스터를 공유 메모리로 워커에 전달하여 병렬 렌더링, 셀 내용 해시가 같은 타일은 재사용 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from map_raster import WHITE, LIGHTGRAY, map_bounds, rasterize_map
+
+TILE_DIR = 'tiles'
+MANIFEST_FILE = 'manifest.json'
+TILE_SIZE = 256
+TILE_VERSION = 1  # 타일 그림 방식을 바꾸면 올려서 기존 타일을 모두 다시 그림
+
+# 최대 확대 수준에서 셀 한 칸의 최소 픽셀 수, 격자선을 그리기 시작하는 셀 픽셀 수
+MAX_CELL_PIXELS = 16
+GRID_LINE_CELL_PIXELS = 8
+
+# 워커 프로세스별 상태 (initializer에서 공유 메모리에 연결)
+_worker_state = {}
+
+def max_zoom_for(side, max_cell_pixels=MAX_CELL_PIXELS):
+    """셀 한 칸이 max_cell_pixels 픽셀 이상이 되는 가장 작은 확대 수준을 반환하는 함수"""
+
+    return max(0, math.ceil(math.log2(side * max_cell_pixels / TILE_SIZE)))
+
+def tile_range(raster_shape, side, z):
+    """확대 수준 z에서 지도를 덮는 타일 개수 (x 방향, y 방향)를 반환하는 함수"""
+
+    height, width = raster_shape[:2]
+    cell_pixels = TILE_SIZE * 2 ** z / side
+    return math.ceil(width * cell_pixels / TILE_SIZE), math.ceil(height * cell_pixels / TILE_SIZE)
+
+def tile_cells(side, z, tile_x, tile_y, raster_shape):
+    """타일이 덮는 셀 범위 (행 시작, 행 끝, 열 시작, 열 끝)를 반환하는 함수"""
+
+    height, width = raster_shape[:2]
+    cell_pixels = TILE_SIZE * 2 ** z / side
+    col_start = math.floor(tile_x * TILE_SIZE / cell_pixels)
+    col_stop = min(width, math.ceil((tile_x + 1) * TILE_SIZE / cell_pixels))
+    row_start = math.floor(tile_y * TILE_SIZE / cell_pixels)
+    row_stop = min(height, math.ceil((tile_y + 1) * TILE_SIZE / cell_pixels))
+    return row_start, row_stop, col_start, col_stop
+
+def tile_hash(raster, side, z, tile_x, tile_y):
+    """타일이 덮는 셀 색상과 배치 정보의 해시 (같으면 이전에 그린 타일을 그대로 사용)"""
+
+    row_start, row_stop, col_start, col_stop = tile_cells(side, z, tile_x, tile_y, raster.shape)
+    cells = raster[row_start:row_stop, col_start:col_stop]
+    digest = hashlib.sha1(f'{TILE_VERSION}/{TILE_SIZE}/{side}/{z}/{tile_x}/{tile_y}/{cells.shape}'.encode())
+    digest.update(np.ascontiguousarray(cells).tobytes())
+    return digest.hexdigest()
+
+def render_tile(raster, side, z, tile_x, tile_y):
+    """셀 래스터(셀당 1픽셀)에서 타일 하나를 (TILE_SIZE, TILE_SIZE, 3) uint8 배열로 만드는 함수
+
+    타일 픽셀마다 중심이 속한 셀의 색을 가져오므로(최근접 샘플링) 확대/축소 모두 같은 방식으로 처리하며,
+    셀이 GRID_LINE_CELL_PIXELS 이상으로 보이면 셀 경계에 격자선을 그립니다. 지도 밖은 흰색입니다.
+    """
+
+    height, width = raster.shape[:2]
+    cell_pixels = TILE_SIZE * 2 ** z / side
+    offsets = np.arange(TILE_SIZE) + 0.5
+    cols = np.floor((tile_x * TILE_SIZE + offsets) / cell_pixels).astype(np.int64)
+    rows = np.floor((tile_y * TILE_SIZE + offsets) / cell_pixels).astype(np.int64)
+
+    inside = (rows[:, None] < height) & (cols[None, :] < width)
+    tile = raster[np.minimum(rows, height - 1)[:, None], np.minimum(cols, width - 1)[None, :]]
+    tile[~inside] = WHITE
+
+    if cell_pixels >= GRID_LINE_CELL_PIXELS:
+        col_edges = (tile_x * TILE_SIZE + offsets) - cols * cell_pixels < 1
+        row_edges = (tile_y * TILE_SIZE + offsets) - rows * cell_pixels < 1
+        tile[(row_edges[:, None] | col_edges[None, :]) & inside] = LIGHTGRAY
+    return tile
+
+def _attach_worker(shm_name, shape, side, tile_dir):
+    """워커 시작 시 공유 메모리의 셀 래스터에 복사 없이 연결하는 함수"""
+
+    shm = SharedMemory(name=shm_name)
+    _worker_state['shm'] = shm  # 참조를 유지해야 버퍼가 닫히지 않음
+    _worker_state['raster'] = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    _worker_state['side'] = side
+    _worker_state['tile_dir'] = tile_dir
+
+def _render_tile_task(key):
+    """타일 하나를 그려 z/x/y.png로 저장하고 키를 반환하는 함수"""
+
+    from matplotlib.image import imsave
+
+    z, tile_x, tile_y = key
+    path = os.path.join(_worker_state['tile_dir'], str(z), str(tile_x), f'{tile_y}.png')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    imsave(path, render_tile(_worker_state['raster'], _worker_state['side'], z, tile_x, tile_y))
+    return key
+
+def load_manifest(tile_dir=TILE_DIR):
+    """타일 목록과 해시가 기록된 manifest.json을 읽는 함수 (없으면 None)"""
+
+    path = os.path.join(tile_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def build_tile_pyramid(data, tile_dir=TILE_DIR, max_zoom=None, processes=None):
+    """지도 전체의 z/x/y 타일 피라미드를 만드는 함수
+
+    - 셀 래스터(map_raster.rasterize_map)를 한 번 만들어 공유 메모리로 워커에 전달하고, 타일은 프로세스 풀에서 그림
+    - 타일마다 덮는 셀 내용의 해시를 manifest.json에 기록하여, 다음 실행에서 해시가 같은 타일은 다시 그리지 않음
+    - 지도가 작아져 더 이상 필요 없는 타일 파일은 삭제
+    반환값: 생성 통계 dict (전체/새로 그린/재사용/삭제 타일 수, 걸린 시간)
+    """
+
+    started = time.perf_counter()
+    raster = rasterize_map(data)
+    min_x, max_x, min_y, max_y = map_bounds(data)
+    side = max(raster.shape[0], raster.shape[1])
+    if max_zoom is None:
+        max_zoom = max_zoom_for(side)
+
+    # 1. 확대 수준별 타일 목록과 셀 내용 해시
+    tiles = {}
+    for z in range(max_zoom + 1):
+        count_x, count_y = tile_range(raster.shape, side, z)
+        for tile_x in range(count_x):
+            for tile_y in range(count_y):
+                tiles[(z, tile_x, tile_y)] = tile_hash(raster, side, z, tile_x, tile_y)
+
+    # 2. 이전 manifest와 해시가 같고 파일이 남아 있는 타일은 재사용
+    previous = (load_manifest(tile_dir) or {}).get('tiles', {})
+    pending = [
+        key for key, digest in tiles.items()
+        if previous.get('/'.join(map(str, key))) != digest
+        or not os.path.exists(os.path.join(tile_dir, str(key[0]), str(key[1]), f'{key[2]}.png'))
+    ]
+
+    # 3. 바뀐 타일만 병렬로 렌더링
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(pending)))
+
+    if pending and processes == 1:
+        # 단일 프로세스는 풀과 공유 메모리 없이 같은 함수로 렌더링
+        _worker_state.update(raster=raster, side=side, tile_dir=tile_dir)
+        try:
+            for key in pending:
+                _render_tile_task(key)
+        finally:
+            _worker_state.clear()
+    elif pending:
+        shm = SharedMemory(create=True, size=raster.nbytes)
+        try:
+            shared = np.ndarray(raster.shape, dtype=np.uint8, buffer=shm.buf)
+            shared[:] = raster
+            del shared  # 공유 메모리를 닫기 전에 버퍼 참조 해제
+
+            chunksize = max(1, len(pending) // (processes * 4))
+            with Pool(processes, initializer=_attach_worker, initargs=(shm.name, raster.shape, side, tile_dir)) as pool:
+                for _ in pool.imap_unordered(_render_tile_task, pending, chunksize):
+                    pass
+        finally:
+            shm.close()
+            shm.unlink()
+
+    # 4. 더 이상 쓰지 않는 타일 삭제 후 manifest 저장
+    keys = {'/'.join(map(str, key)): digest for key, digest in tiles.items()}
+    removed = 0
+    for stale in set(previous) - set(keys):
+        path = os.path.join(tile_dir, f'{stale}.png')
+        if os.path.exists(path):
+            os.remove(path)
+            removed += 1
+
+    manifest = {
+        'tile_size': TILE_SIZE,
+        'max_zoom': max_zoom,
+        'bounds': {'min_x': min_x, 'max_x': max_x, 'min_y': min_y, 'max_y': max_y},
+        'tiles': keys,
+    }
+    os.makedirs(tile_dir, exist_ok=True)
+    with open(os.path.join(tile_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+
+    return {
+        'tiles': len(tiles),
+        'rendered': len(pending),
+        'reused': len(tiles) - len(pending),
+        'removed': removed,
+        'max_zoom': max_zoom,
+        'elapsed': time.perf_counter() - started,
+    }
+
+def main():
+    """사용법: python tile_pyramid.py [타일 디렉터리] [최대 확대 수준] [프로세스 수]"""
+
+    from map_data import load_map_data
+
+    tile_dir = sys.argv[1] if len(sys.argv) > 1 else TILE_DIR
+    max_zoom = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    processes = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    data = load_map_data()
+    print(f'=== 타일 피라미드 생성: {tile_dir} ===')
+    stats = build_tile_pyramid(data, tile_dir, max_zoom, processes)
+    print(f'확대 수준 0~{stats["max_zoom"]}, 타일 {stats["tiles"]}개 '
+          f'(새로 그림 {stats["rendered"]}, 재사용 {stats["reused"]}, 삭제 {stats["removed"]})')
+    print(f'걸린 시간: {stats["elapsed"]:.2f}초')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 메모리보다 큰 지도를 위한 타일 단위 디스크 그리드 (numpy.memmap) 및 CSV 변환기
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 점유/구역/구조물 레이어 타일 저장, CSV 변환, 타일 지연 로드 그리드 | zookeeper
+# 2026-10-18 | 수정 | 좌표 범위 스캔 함수를 공개(scan_bounds)하여 스트리밍 병합에서 재사용 | zookeeper
+# 2026-10-18 | 기능 추가 | GridMap과 같은 범위 검사 메서드(contains) 제공 | zookeeper
+# 2026-10-18 | 버그 수정 | 경로 탐색 전 지도 밖 지점 검사, 도달 불가/범위 밖이면 (inf, []) 반환 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from grid_map import GridMap
+from grid_search import SEARCH_METHODS, reconstruct_path
+
+# 레이어 이름 → (파일명, dtype, 격자 밖 패딩 값)
+LAYERS = {
+    'occupancy': ('occupancy.bin', np.uint8, 1),  # 0: 이동 가능, 1: 이동 불가 (격자 밖은 막힘)
+    'area': ('area.bin', np.uint16, 0),
+    'category': ('category.bin', np.uint8, 0),
+}
+META_FILE = 'grid.json'
+
+def scan_bounds(csv_paths, chunksize):
+    """CSV들을 청크 단위로 읽어 좌표 범위만 구하는 함수 (전체를 메모리에 올리지 않음)"""
+
+    min_x = min_y = None
+    max_x = max_y = None
+    for csv_path in csv_paths:
+        for chunk in pd.read_csv(csv_path, usecols=['x', 'y'], chunksize=chunksize):
+            chunk_min_x, chunk_max_x = int(chunk['x'].min()), int(chunk['x'].max())
+            chunk_min_y, chunk_max_y = int(chunk['y'].min()), int(chunk['y'].max())
+            min_x = chunk_min_x if min_x is None else min(min_x, chunk_min_x)
+            min_y = chunk_min_y if min_y is None else min(min_y, chunk_min_y)
+            max_x = chunk_max_x if max_x is None else max(max_x, chunk_max_x)
+            max_y = chunk_max_y if max_y is None else max(max_y, chunk_max_y)
+    return min_x, min_y, max_x, max_y
+
+def _open_layer(directory, meta, layer, mode):
+    """레이어 파일을 (타일 행, 타일 열, 타일 크기, 타일 크기) 모양의 memmap으로 여는 함수"""
+
+    file_name, dtype, _ = LAYERS[layer]
+    tile = meta['tile_size']
+    shape = (meta['tiles_y'], meta['tiles_x'], tile, tile)
+    return np.memmap(os.path.join(directory, file_name), dtype=dtype, mode=mode, shape=shape)
+
+def convert_csv_to_tiles(directory, map_csv='area_map.csv', struct_csv='area_struct.csv',
+                         tile_size=256, chunksize=1_000_000):
+    """area_map.csv / area_struct.csv를 타일 단위 바이너리 그리드로 변환하는 함수
+
+    각 타일(tile_size x tile_size)은 파일 안에서 연속된 블록으로 저장되므로 타일 하나를
+    한 번의 연속 읽기로 가져올 수 있습니다. CSV는 청크 단위로 읽어 메모리 사용량이 일정합니다.
+    """
+
+    print(f'=== CSV → 타일 그리드 변환 ({directory}) ===')
+
+    min_x, min_y, max_x, max_y = scan_bounds([map_csv, struct_csv], chunksize)
+    width, height = max_x - min_x + 1, max_y - min_y + 1
+    meta = {
+        'width': width, 'height': height, 'min_x': min_x, 'min_y': min_y,
+        'tile_size': tile_size,
+        'tiles_x': -(-width // tile_size), 'tiles_y': -(-height // tile_size),
+    }
+
+    os.makedirs(directory, exist_ok=True)
+    layers = {}
+    for layer, (_, _, pad_value) in LAYERS.items():
+        layers[layer] = _open_layer(directory, meta, layer, 'w+')
+        layers[layer][:] = pad_value
+
+    # 격자 안의 셀은 기본적으로 이동 가능 (create_grid_map과 동일)
+    occupancy = layers['occupancy']
+    for tile_y in range(meta['tiles_y']):
+        rows = min(tile_size, height - tile_y * tile_size)
+        for tile_x in range(meta['tiles_x']):
+            columns = min(tile_size, width - tile_x * tile_size)
+            occupancy[tile_y, tile_x, :rows, :columns] = 0
+
+    def scatter(layer, chunk, column):
+        gx = chunk['x'].to_numpy() - min_x
+        gy = chunk['y'].to_numpy() - min_y
+        layers[layer][gy // tile_size, gx // tile_size, gy % tile_size, gx % tile_size] = chunk[column].to_numpy()
+
+    for chunk in pd.read_csv(map_csv, chunksize=chunksize):
+        scatter('occupancy', chunk, 'ConstructionSite')
+    for chunk in pd.read_csv(struct_csv, chunksize=chunksize):
+        chunk = chunk.fillna({'category': 0, 'area': 0})
+        scatter('area', chunk, 'area')
+        scatter('category', chunk, 'category')
+
+    for layer in layers.values():
+        layer.flush()
+    with open(os.path.join(directory, META_FILE), 'w') as f:
+        json.dump(meta, f)
+
+    print(f'그리드 크기: {width} x {height}, 타일 {meta["tiles_x"]} x {meta["tiles_y"]}개 ({tile_size} x {tile_size})')
+    return meta
+
+class TileCellView:
+    """타일 레이어를 셀 ID로 읽는 flat 배열처럼 보이게 하는 클래스
+
+    접근한 타일만 디스크에서 읽어 bytes/배열로 보관하고, 보관 타일 수가 max_tiles를 넘으면
+    가장 오래 사용하지 않은 타일부터 버리므로 상주 메모리가 타일 수로 제한됩니다.
+    """
+
+    def __init__(self, layer, width, tile_size, max_tiles):
+        self.layer = layer
+        self.width = width
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.tiles = {}  # (타일 행, 타일 열) → 타일 데이터 (dict 삽입 순서로 LRU 관리)
+        self.loads = 0
+
+    def tile(self, tile_y, tile_x):
+        """타일 하나를 가져오는 메서드 (없으면 디스크에서 로드)"""
+
+        key = (tile_y, tile_x)
+        data = self.tiles.pop(key, None)
+        if data is None:
+            data = self.layer[tile_y, tile_x].reshape(-1).tolist()
+            self.loads += 1
+            if len(self.tiles) >= self.max_tiles:
+                del self.tiles[next(iter(self.tiles))]
+        self.tiles[key] = data
+        return data
+
+    def __getitem__(self, cell_id):
+        x = cell_id % self.width
+        y = cell_id // self.width
+        tile = self.tile_size
+        return self.tile(y // tile, x // tile)[(y % tile) * tile + x % tile]
+
+class TiledGrid:
+    """디스크의 타일 그리드를 GridMap과 같은 방식(cells, width, height, cell_id, coord)으로 제공하는 클래스"""
+
+    def __init__(self, directory, max_tiles=64):
+        with open(os.path.join(directory, META_FILE)) as f:
+            meta = json.load(f)
+
+        self.width = meta['width']
+        self.height = meta['height']
+        self.min_x = meta['min_x']
+        self.min_y = meta['min_y']
+        self.max_x = self.min_x + self.width - 1
+        self.max_y = self.min_y + self.height - 1
+        self.tile_size = meta['tile_size']
+
+        self.layers = {layer: _open_layer(directory, meta, layer, 'r') for layer in LAYERS}
+        self.cells = TileCellView(self.layers['occupancy'], self.width, self.tile_size, max_tiles)
+        self.area = TileCellView(self.layers['area'], self.width, self.tile_size, max_tiles)
+        self.category = TileCellView(self.layers['category'], self.width, self.tile_size, max_tiles)
+
+    # 범위 검사는 GridMap과 같은 메서드를 사용 (min_x ~ max_x, min_y ~ max_y만 참조)
+    contains = GridMap.contains
+
+    def cell_id(self, x, y):
+        """실제 좌표를 셀 ID로 변환하는 메서드"""
+        return int((y - self.min_y) * self.width + (x - self.min_x))
+
+    def coord(self, cell_id):
+        """셀 ID를 실제 좌표로 변환하는 메서드"""
+        return cell_id % self.width + self.min_x, cell_id // self.width + self.min_y
+
+def find_route(grid, start, end, method='astar'):
+    """타일 그리드에서 두 지점 사이의 최단 경로를 찾는 함수
+
+    A*는 방문한 셀만 탐색 상태로 저장하므로, 타일 지연 로드와 함께 쓰면 메모리가 지도 전체가 아닌
+    탐색 영역에 비례합니다. (bfs, bidirectional은 그리드 크기의 parent 배열을 사용)
+    반환값: (거리, 실제 좌표 경로), 지도 밖의 지점이거나 도달할 수 없으면 (inf, [])
+    """
+
+    # 지도 밖의 좌표는 셀 ID로 바꾸면 다른 행을 가리키므로 탐색 전에 제외
+    if not (grid.contains(*start) and grid.contains(*end)):
+        return float('inf'), []
+
+    goal_id, distance, parent = SEARCH_METHODS[method](
+        grid.cells, grid.width, grid.height, grid.cell_id(*start), {grid.cell_id(*end)})
+    if goal_id is None:
+        return float('inf'), []
+    path = [grid.coord(cell) for cell in reconstruct_path(parent, goal_id)]
+    return distance, path
+
+def main():
+    """사용법: python tiled_grid.py convert <디렉터리> [타일 크기]
+              python tiled_grid.py route <디렉터리> <x1,y1> <x2,y2>"""
+
+    if len(sys.argv) >= 3 and sys.argv[1] == 'convert':
+        tile_size = int(sys.argv[3]) if len(sys.argv) > 3 else 256
+        convert_csv_to_tiles(sys.argv[2], tile_size=tile_size)
+    elif len(sys.argv) == 5 and sys.argv[1] == 'route':
+        grid = TiledGrid(sys.argv[2])
+        start = tuple(int(value) for value in sys.argv[3].split(','))
+        end = tuple(int(value) for value in sys.argv[4].split(','))
+
+        started = time.perf_counter()
+        distance, path = find_route(grid, start, end)
+        elapsed = time.perf_counter() - started
+
+        print(f'{start} → {end}: 거리 {distance}, {len(path)}개 지점, {elapsed:.3f}초')
+        print(f'로드한 타일: {grid.cells.loads}개, 상주 타일: {len(grid.cells.tiles)}개 (최대 {grid.cells.max_tiles})')
+    else:
+        print(main.__doc__)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+# ----------------------------------------------------------------------------------------------------
+# 작성목적 : 모든 구조물 방문 경로 계산 - 구조물 간 거리 행렬 사전 계산 및 투어 구성
+# 작성일 : 2026-10-18
+
+# 변경사항 내역 (날짜 | 변경목적 | 변경내용 | 작성자 순으로 기입)
+# 2026-10-18 | 최초 구현 | 지점별 BFS 1회로 거리 행렬 생성, 행렬 기반 Greedy 투어 및 구간 경로 복원 | zookeeper
+# 2026-10-18 | 기능 추가 | Held-Karp 정확해 / 2-opt·Or-opt 지역 탐색 해법 및 최적성 격차 보고 추가 | zookeeper
+# ----------------------------------------------------------------------------------------------------
+
+import time
+
+from grid_search import bfs_tree, reconstruct_path_from_moves
+
+def build_distance_matrix(cells, width, height, point_ids):
+    """지점마다 BFS를 한 번씩만 수행하여 k x k 거리 행렬과 BFS 트리들을 만드는 함수
+
+    matrix[i][j]는 point_ids[i] → point_ids[j]의 최단 거리(도달 불가 시 inf)이고,
+    trees[i]는 point_ids[i]에서 시작한 BFS의 방향 코드 배열입니다.
+    """
+
+    matrix = []
+    trees = []
+
+    for source_id in point_ids:
+        distances, moves = bfs_tree(cells, width, height, source_id, point_ids)
+        matrix.append([distances.get(target_id, float('inf')) for target_id in point_ids])
+        trees.append(moves)
+
+    return matrix, trees
+
+def greedy_tour(matrix, start_index=0):
+    """거리 행렬만 사용하여 현재 위치에서 가장 가까운 지점을 차례로 고르는 함수 (Greedy)
+
+    반환값: (방문 순서 인덱스 리스트 - 시작 인덱스 포함, 총 거리)
+    """
+
+    current = start_index
+    unvisited = [i for i in range(len(matrix)) if i != start_index]
+    order = [start_index]
+    total_distance = 0
+
+    while unvisited:
+        row = matrix[current]
+
+        # 거리가 같으면 먼저 나온 지점을 선택 (기존 구현과 동일한 순서)
+        next_index = None
+        min_distance = float('inf')
+        for candidate in unvisited:
+            if row[candidate] < min_distance:
+                min_distance = row[candidate]
+                next_index = candidate
+
+        if next_index is None:
+            break  # 남은 지점은 모두 도달 불가
+
+        order.append(next_index)
+        total_distance += min_distance
+        unvisited.remove(next_index)
+        current = next_index
+
+    return order, total_distance
+
+def expand_tour(order, point_ids, trees, width):
+    """방문 순서의 각 구간을 BFS 트리로 복원하여 전체 셀 ID 경로를 만드는 함수"""
+
+    if not order:
+        return []
+
+    cell_path = [point_ids[order[0]]]
+    for source, target in zip(order, order[1:]):
+        leg = reconstruct_path_from_moves(trees[source], width, point_ids[source], point_ids[target])
+        cell_path.extend(leg[1:])  # 첫 번째 요소는 현재 위치이므로 제외
+
+    return cell_path
+
+# Held-Karp 완전 탐색을 사용할 최대 구조물 수 (O(2^k * k^2), 순수 Python 기준)
+EXACT_SOLVER_LIMIT = 16
+
+def held_karp_tour(matrix, start_index=0):
+    """Held-Karp 비트마스크 DP로 시작점에서 모든 지점을 방문하는 최단 경로(복귀 없음)를 구하는 함수
+
+    반환값: (방문 순서 인덱스 리스트 - 시작 인덱스 포함, 총 거리)
+    """
+
+    others = [i for i in range(len(matrix)) if i != start_index]
+    count = len(others)
+    if count == 0:
+        return [start_index], 0
+
+    inf = float('inf')
+    full_mask = (1 << count) - 1
+
+    # cost[mask][j]: mask의 지점들을 모두 방문하고 others[j]에서 끝나는 최단 거리
+    cost = [[inf] * count for _ in range(1 << count)]
+    previous = [[-1] * count for _ in range(1 << count)]
+
+    for j in range(count):
+        cost[1 << j][j] = matrix[start_index][others[j]]
+
+    for mask in range(1, full_mask + 1):
+        row = cost[mask]
+        for j in range(count):
+            current_cost = row[j]
+            if current_cost == inf or not (mask >> j) & 1:
+                continue
+            distances = matrix[others[j]]
+            for k in range(count):
+                if (mask >> k) & 1:
+                    continue
+                next_mask = mask | (1 << k)
+                candidate = current_cost + distances[others[k]]
+                if candidate < cost[next_mask][k]:
+                    cost[next_mask][k] = candidate
+                    previous[next_mask][k] = j
+
+    last = min(range(count), key=lambda j: cost[full_mask][j])
+    total_distance = cost[full_mask][last]
+
+    # 역추적으로 방문 순서 복원
+    order = []
+    mask = full_mask
+    while last != -1:
+        order.append(others[last])
+        last, mask = previous[mask][last], mask & ~(1 << last)
+    order.append(start_index)
+    order.reverse()
+
+    return order, total_distance
+
+def path_length(matrix, order):
+    """방문 순서의 총 거리를 계산하는 함수"""
+    return sum(matrix[a][b] for a, b in zip(order, order[1:]))
+
+def local_search_tour(matrix, start_index=0, time_budget=1.0):
+    """Greedy 경로에서 시작하여 2-opt / Or-opt 개선을 제한 시간 동안 반복하는 함수
+
+    반환값: (방문 순서 인덱스 리스트 - 시작 인덱스 포함, 총 거리)
+    """
+
+    deadline = time.perf_counter() + time_budget
+    order, _ = greedy_tour(matrix, start_index)
+    size = len(order)
+
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+
+        # 2-opt: order[i..j] 구간을 뒤집기 (시작점은 고정, 끝점은 열린 경로)
+        for i in range(1, size - 1):
+            a, b = order[i - 1], order[i]
+            for j in range(i + 1, size):
+                c = order[j]
+                d = order[j + 1] if j + 1 < size else None
+                before = matrix[a][b] + (matrix[c][d] if d is not None else 0)
+                after = matrix[a][c] + (matrix[b][d] if d is not None else 0)
+                if after < before:
+                    order[i:j + 1] = reversed(order[i:j + 1])
+                    b = order[i]
+                    improved = True
+            if time.perf_counter() >= deadline:
+                break
+
+        # Or-opt: 길이 1~3 구간을 떼어 다른 위치에 (필요하면 뒤집어서) 끼워 넣기
+        for segment_length in (1, 2, 3):
+            i = 1
+            while i + segment_length <= size and time.perf_counter() < deadline:
+                first, last = order[i], order[i + segment_length - 1]
+                before = order[i - 1]
+                after = order[i + segment_length] if i + segment_length < size else None
+
+                # 구간을 떼어 냈을 때 줄어드는 거리
+                removal_gain = matrix[before][first]
+                if after is not None:
+                    removal_gain += matrix[last][after] - matrix[before][after]
+
+                rest = order[:i] + order[i + segment_length:]
+                best_delta = 0
+                best_move = None
+                for position in range(1, len(rest) + 1):
+                    u = rest[position - 1]
+                    v = rest[position] if position < len(rest) else None
+                    for reverse in (False, True):
+                        head, tail = (last, first) if reverse else (first, last)
+                        insertion_cost = matrix[u][head]
+                        if v is not None:
+                            insertion_cost += matrix[tail][v] - matrix[u][v]
+                        if insertion_cost - removal_gain < best_delta:
+                            best_delta = insertion_cost - removal_gain
+                            best_move = (position, reverse)
+
+                if best_move is not None:
+                    position, reverse = best_move
+                    segment = order[i:i + segment_length]
+                    if reverse:
+                        segment.reverse()
+                    order = rest[:position] + segment + rest[position:]
+                    improved = True
+                i += 1
+
+    return order, path_length(matrix, order)
+
+def minimum_spanning_tree_length(matrix):
+    """Prim 알고리즘으로 모든 지점의 최소 신장 트리 길이를 구하는 함수 (방문 경로 길이의 하한)"""
+
+    best = {i: matrix[0][i] for i in range(1, len(matrix))}
+    total = 0
+
+    while best:
+        nearest = min(best, key=best.get)
+        total += best.pop(nearest)
+        row = matrix[nearest]
+        for i in best:
+            if row[i] < best[i]:
+                best[i] = row[i]
+
+    return total
+
+# 투어 해법 등록 (이름 → 함수), 새로운 해법은 여기에 추가
+TOUR_SOLVERS = {
+    'greedy': lambda matrix, start_index, time_budget: greedy_tour(matrix, start_index),
+    'held_karp': lambda matrix, start_index, time_budget: held_karp_tour(matrix, start_index),
+    'local_search': local_search_tour,
+}
+
+def solve_tour(matrix, start_index=0, method='auto', time_budget=1.0):
+    """거리 행렬로 모든 지점 방문 경로를 계산하고 최적성 격차를 함께 보고하는 함수
+
+    method='auto'이면 지점 수가 EXACT_SOLVER_LIMIT 이하일 때 Held-Karp(정확해),
+    그보다 많으면 제한 시간(time_budget초) 내 2-opt/Or-opt 지역 탐색을 사용합니다.
+    시작점에서 도달할 수 없는 지점은 제외하고 계산합니다.
+    반환값: 해법, 방문 순서, 총 거리, 하한, 격차(gap), 소요 시간, 제외된 지점을 담은 dict
+    """
+
+    started = time.perf_counter()
+
+    # 도달 가능한 지점만 남겨 부분 행렬 생성 (격자는 무방향이므로 서로 모두 도달 가능)
+    reachable = [i for i in range(len(matrix)) if matrix[start_index][i] < float('inf')]
+    unreachable = [i for i in range(len(matrix)) if matrix[start_index][i] == float('inf')]
+    sub_matrix = [[matrix[i][j] for j in reachable] for i in reachable]
+    sub_start = reachable.index(start_index)
+
+    if method == 'auto':
+        method = 'held_karp' if len(reachable) - 1 <= EXACT_SOLVER_LIMIT else 'local_search'
+    if method not in TOUR_SOLVERS:
+        raise ValueError(f'알 수 없는 투어 해법입니다: {method} (사용 가능: {", ".join(TOUR_SOLVERS)})')
+
+    sub_order, total_distance = TOUR_SOLVERS[method](sub_matrix, sub_start, time_budget)
+    order = [reachable[i] for i in sub_order]
+
+    # 정확해는 격차 0, 그 외에는 최소 신장 트리 길이를 하한으로 사용
+    if method == 'held_karp':
+        lower_bound = total_distance
+    else:
+        lower_bound = minimum_spanning_tree_length(sub_matrix)
+    gap = (total_distance - lower_bound) / lower_bound if lower_bound else 0.0
+
+    return {
+        'method': method,
+        'order': order,
+        'distance': total_distance,
+        'lower_bound': lower_bound,
+        'gap': gap,
+        'elapsed': time.perf_counter() - started,
+        'unreachable': unreachable,
+    }